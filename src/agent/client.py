@@ -16,11 +16,10 @@ In remote mode, this demonstrates the unified architecture:
   File System (ALL access through MCP protocol)
 """
 
-from typing import Optional
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from agent_framework import ChatAgent
-from rich.console import Console
-from rich.markdown import Markdown
 
 from screenshot_mcp.client_wrapper import MCPClientWrapper, get_agent_framework_tools
 from utils.logger import get_logger
@@ -30,6 +29,48 @@ from .modes import detect_mode, init_local_client, init_remote_client
 
 logger = get_logger(__name__)
 
+# Tool results longer than this are truncated in the rendered reply
+_MAX_RESULT_CHARS = 800
+
+
+def _format_tool_arguments(arguments: Any) -> str:
+    """Render tool call arguments (JSON text or dict) as a JSON block ("" if unparseable)."""
+    try:
+        args = json.loads(arguments) if isinstance(arguments, str) else (arguments or {})
+        return f"```json\n{json.dumps(args, indent=2)}\n```"
+    except (TypeError, ValueError):
+        return ""
+
+
+def _format_tool_result(tool_result: Any) -> str:
+    """Render a tool result, led by the processing method when the tool reports one.
+
+    analyze_screenshot results carry processing_method; local OCR and cloud
+    vision are called out so the user always sees which one ran.
+    """
+    try:
+        result_dict = json.loads(tool_result) if isinstance(tool_result, str) else tool_result
+
+        processing_indicator = ""
+        if isinstance(result_dict, dict) and 'processing_method' in result_dict:
+            method = result_dict['processing_method']
+            if method == 'ocr':
+                processing_indicator = "✅ **Local OCR processing completed**\n\n"
+            elif method == 'vision':
+                processing_indicator = "🔍 **Cloud vision analysis completed**\n\n"
+
+        formatted_result = json.dumps(result_dict, indent=2)
+        # Truncate if too long
+        if len(formatted_result) > _MAX_RESULT_CHARS:
+            formatted_result = formatted_result[:_MAX_RESULT_CHARS] + "\n... (truncated)"
+        return f"{processing_indicator}📊 **Tool Result:**\n```json\n{formatted_result}\n```"
+    except (TypeError, ValueError):
+        # Not JSON, show as-is
+        result_str = str(tool_result)
+        if len(result_str) > _MAX_RESULT_CHARS:
+            result_str = result_str[:_MAX_RESULT_CHARS] + "... (truncated)"
+        return f"📊 **Tool Result:**\n```\n{result_str}\n```"
+
 
 class AgentClient:
     """Agent Framework client with embedded MCP Client for screenshot organization.
@@ -102,9 +143,6 @@ class AgentClient:
             tools=tools
         )
 
-        # Console for rich output
-        self.console = Console()
-
         # Current thread (managed externally by CLI)
         self.current_thread = None
 
@@ -134,13 +172,26 @@ class AgentClient:
             logger.info("✓ All file system operations will go through MCP protocol")
 
     async def cleanup(self):
-        """Clean up resources (stop MCP client)."""
+        """Clean up resources (stop MCP client, close local HTTP connections)."""
         if self.mcp_client:
             logger.info("Stopping MCP client...")
             await self.mcp_client.stop()
             self.mcp_client = None
             logger.info("✓ MCP client stopped")
 
+        # The local client holds aiohttp sessions that must be closed explicitly
+        if self.mode == "local":
+            await self.chat_client.aclose()
+
+    async def __aenter__(self):
+        """Start async resources (MCP client in remote mode) for use in ``async with``."""
+        await self.async_init()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Release async resources started by __aenter__."""
+        await self.cleanup()
+
     def get_new_thread(self):
         """Create a new conversation thread.
 
@@ -198,46 +249,16 @@ class AgentClient:
                     if hasattr(msg, 'tool_calls') and msg.tool_calls:
                         for tool_call in msg.tool_calls:
                             tool_name = tool_call.function.name if hasattr(tool_call.function, 'name') else 'unknown'
-                            # Try to get arguments for more detail
-                            try:
-                                import json
-                                args = json.loads(tool_call.function.arguments) if hasattr(tool_call.function, 'arguments') else {}
-                                args_str = json.dumps(args, indent=2)
-                                response_parts.append(f"🔧 **Calling Tool:** `{tool_name}`\n```json\n{args_str}\n```")
-                            except:
-                                response_parts.append(f"🔧 **Calling Tool:** `{tool_name}`")
+                            # Show the arguments too, for more detail
+                            call_text = f"🔧 **Calling Tool:** `{tool_name}`"
+                            args_block = _format_tool_arguments(getattr(tool_call.function, 'arguments', None))
+                            response_parts.append(f"{call_text}\n{args_block}" if args_block else call_text)
                             logger.info(f"Tool called: {tool_name}")
 
                     # Show tool results
                     if hasattr(msg, 'role') and msg.role == 'tool':
                         tool_result = msg.content if hasattr(msg, 'content') else 'No result'
-
-                        # Try to parse and format JSON results
-                        try:
-                            import json
-                            result_dict = json.loads(tool_result) if isinstance(tool_result, str) else tool_result
-
-                            # Check if this is analyze_screenshot result with processing_method
-                            processing_indicator = ""
-                            if isinstance(result_dict, dict) and 'processing_method' in result_dict:
-                                method = result_dict['processing_method']
-                                if method == 'ocr':
-                                    processing_indicator = "✅ **Local OCR processing completed**\n\n"
-                                elif method == 'vision':
-                                    processing_indicator = "🔍 **Cloud vision analysis completed**\n\n"
-
-                            formatted_result = json.dumps(result_dict, indent=2)
-                            # Truncate if too long
-                            if len(formatted_result) > 800:
-                                formatted_result = formatted_result[:800] + "\n... (truncated)"
-                            response_parts.append(f"{processing_indicator}📊 **Tool Result:**\n```json\n{formatted_result}\n```")
-                        except:
-                            # Not JSON or formatting failed, show as-is
-                            result_str = str(tool_result)
-                            if len(result_str) > 800:
-                                result_str = result_str[:800] + "... (truncated)"
-                            response_parts.append(f"📊 **Tool Result:**\n```\n{result_str}\n```")
-
+                        response_parts.append(_format_tool_result(tool_result))
                         logger.info(f"Tool result received")
 
             # Add the final assistant response
@@ -268,15 +289,67 @@ class AgentClient:
             logger.error(error_msg, exc_info=True)
             return f"Sorry, I encountered an error: {str(e)}"
 
-    def display_response(self, response: str):
-        """Display assistant response with rich formatting.
+    async def chat_stream(self, user_message: str, thread=None) -> AsyncIterator[str]:
+        """Send a message and yield the response incrementally as it is generated.
+
+        Streaming counterpart of chat(): text chunks are yielded as soon as the
+        model produces them, so the caller can render the reply progressively
+        instead of waiting for the full response.
 
         Args:
-            response: Response text to display.
+            user_message: User's message.
+            thread: Optional AgentThread to use. If None, uses current_thread.
+
+        Yields:
+            Response text chunks (tool calls are announced inline for transparency).
         """
-        self.console.print()
-        self.console.print(Markdown(response))
-        self.console.print()
+        if thread is None:
+            thread = self.current_thread
+
+        if thread is None:
+            raise ValueError("No thread provided and no current_thread set")
+
+        logger.debug(f"User message (streaming): {user_message}")
+
+        try:
+            if hasattr(self.agent, 'tools') and self.agent.tools:
+                updates = self.agent.run_stream(user_message, thread=thread, tools=self.agent.tools)
+            else:
+                updates = self.agent.run_stream(user_message, thread=thread)
+
+            # Argument chunks per tool call, shown with the call's result
+            tool_arguments: Dict[str, List[Any]] = {}
+            call_id = None
+            async for update in updates:
+                for content in getattr(update, 'contents', None) or []:
+                    content_type = getattr(content, 'type', None)
+                    if content_type == 'function_call':
+                        # Arguments arrive in later chunks, which may omit the call id
+                        call_id = getattr(content, 'call_id', None) or call_id
+                        chunks = tool_arguments.setdefault(call_id, [])
+                        if getattr(content, 'arguments', None):
+                            chunks.append(content.arguments)
+                        if getattr(content, 'name', None):
+                            # Announce tool calls as soon as they are issued
+                            logger.info(f"Tool called: {content.name}")
+                            yield f"\n\n🔧 **Calling Tool:** `{content.name}`\n\n"
+                    elif content_type == 'function_result':
+                        chunks = tool_arguments.pop(getattr(content, 'call_id', None), None)
+                        if chunks:
+                            arguments = "".join(chunks) if all(isinstance(c, str) for c in chunks) else chunks[-1]
+                            args_block = _format_tool_arguments(arguments)
+                            if args_block:
+                                yield f"{args_block}\n\n"
+                        logger.info("Tool result received")
+                        yield f"{_format_tool_result(getattr(content, 'result', None))}\n\n"
+
+                if update.text:
+                    yield update.text
+
+        except Exception as e:
+            error_msg = f"Error communicating with Azure AI: {e}"
+            logger.error(error_msg, exc_info=True)
+            yield f"Sorry, I encountered an error: {str(e)}"
 
     async def serialize_thread(self, thread=None) -> dict:
         """Serialize thread state for persistence.
@@ -88,13 +88,17 @@ Provide insights that prove you understood the content:
 - Don't re-explain everything - just answer the specific question
 
 AVAILABLE MCP TOOLS:
-1. list_screenshots(directory, recursive, max_files) - List files in directory
+1. list_screenshots(directory, recursive, max_files, offset) - List files in directory (page with next_offset)
 2. analyze_screenshot(file_path, force_vision) - Extract text/content from screenshot
    - Returns 'processing_method': 'ocr' (fast local) or 'vision' (accurate cloud)
    - ALWAYS mention which method was used when presenting results to user
-3. get_categories() - Get available categories
-4. create_category_folder(category, base_dir) - Create folder for category
-5. move_screenshot(source_path, dest_folder, new_filename, keep_original) - Move/rename file
+3. analyze_screenshots_batch(file_paths, force_vision) - Analyze several screenshots at once
+   - Prefer this over repeated analyze_screenshot calls when processing many files
+4. get_categories() - Get available categories
+5. create_category_folder(category, base_dir) - Create folder for category
+6. move_screenshot(source_path, dest_folder, new_filename, keep_original) - Move/rename file
+7. place_screenshot(source_path, category, base_dir, new_filename, keep_original) - Create category folder if needed and move/rename file in one call
+   - Prefer this over create_category_folder + move_screenshot when organizing files
 
 BEHAVIORAL GUIDELINES:
 ✅ Be proactive - introduce yourself and ask for directory
@@ -1,7 +1,8 @@
 """Keyword-based classifier for screenshot categorization."""
 
+import operator
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from utils.logger import get_logger
 
@@ -123,6 +124,23 @@ class KeywordClassifier:
             category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
             for category, patterns in self.patterns.items()
         }
+        self._ascii_patterns: Dict[str, Optional[List[re.Pattern]]] = {
+            category: self._compile_ascii(patterns)
+            for category, patterns in self.compiled_patterns.items()
+        }
+
+    @staticmethod
+    def _compile_ascii(patterns: List[re.Pattern]) -> Optional[List[re.Pattern]]:
+        """Compile bytes twins of a category's patterns for ASCII-only text.
+
+        Most OCR output is ASCII; matching it as bytes gives the same matches
+        but skips Unicode case folding. Returns None when a pattern cannot be
+        compiled as bytes, leaving the category on its str patterns.
+        """
+        try:
+            return [re.compile(p.pattern.encode("utf-8"), re.IGNORECASE) for p in patterns]
+        except re.error:
+            return None
 
     def classify(self, text: str) -> str:
         """Classify text based on keyword patterns.
@@ -134,28 +152,60 @@ class KeywordClassifier:
             Category string: one of code, errors, documentation, design,
                            communication, memes, or other.
         """
+        return self.classify_with_matches(text)[0]
+
+    def _find_matches(self, text: str):
+        """Yield (category, pattern, matched keywords) for each pattern that matches.
+
+        Every pattern scans the whole text on its own, so keywords matched by
+        several patterns (overlapping or not) count once per pattern.
+        """
+        ascii_text = text.encode("ascii") if text.isascii() else None
+        for category, patterns in self.compiled_patterns.items():
+            ascii_patterns = self._ascii_patterns[category]
+            if ascii_text is not None and ascii_patterns is not None:
+                for pattern in ascii_patterns:
+                    matches = [match.group().decode("ascii") for match in pattern.finditer(ascii_text)]
+                    if matches:
+                        yield category, pattern, matches
+            else:
+                for pattern in patterns:
+                    matches = [match.group() for match in pattern.finditer(text)]
+                    if matches:
+                        yield category, pattern, matches
+
+    def classify_with_matches(self, text: str) -> Tuple[str, List[str]]:
+        """Classify text and report which keywords decided the category.
+
+        Args:
+            text: Text to classify (typically from OCR).
+
+        Returns:
+            Tuple of (category, matched keywords). The keywords are the
+            distinct lower-cased text matches for the winning category, in
+            pattern order (empty when the result is 'other').
+        """
         if not text or not text.strip():
             logger.debug("Empty text provided, returning 'other'")
-            return "other"
+            return "other", []
 
-        # Count matches for each category
+        # Count matches for each category, keeping the matched text
         category_scores: Dict[str, int] = {category: 0 for category in self.patterns.keys()}
-
-        for category, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                matches = pattern.findall(text)
-                if matches:
-                    category_scores[category] += len(matches)
-                    logger.debug(f"Found {len(matches)} matches for '{pattern.pattern}' in category '{category}'")
-
-        # Find category with highest score
-        if max(category_scores.values()) > 0:
-            best_category = max(category_scores.items(), key=lambda x: x[1])[0]
-            logger.info(f"Classified as '{best_category}' with {category_scores[best_category]} matches")
-            return best_category
+        category_matches: Dict[str, Dict[str, None]] = {category: {} for category in self.patterns.keys()}
+
+        for category, pattern, matches in self._find_matches(text):
+            category_scores[category] += len(matches)
+            category_matches[category].update(dict.fromkeys(match.lower() for match in matches))
+            logger.debug("Found %d matches for '%s' in category '%s'", len(matches), pattern.pattern, category)
+
+        # Find category with highest score (single pass over the scores)
+        best_category, best_score = max(category_scores.items(), key=operator.itemgetter(1))
+        if best_score > 0:
+            logger.info(f"Classified as '{best_category}' with {best_score} matches")
+            return best_category, list(category_matches[best_category])
         else:
             logger.info("No keyword matches found, returning 'other'")
-            return "other"
+            return "other", []
 
     def get_categories(self) -> List[str]:
         """Get list of available categories.
@@ -179,4 +229,5 @@ class KeywordClassifier:
 
         self.patterns[category].append(pattern)
         self.compiled_patterns[category].append(re.compile(pattern, re.IGNORECASE))
+        self._ascii_patterns[category] = self._compile_ascii(self.compiled_patterns[category])
         logger.info(f"Added pattern '{pattern}' to category '{category}'")
@@ -1,22 +1,34 @@
 """Interactive CLI interface for screenshot organization chat."""
 
 import asyncio
+import contextlib
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import click
+from prompt_toolkit import PromptSession
+from prompt_toolkit.formatted_text import HTML
+from prompt_toolkit.patch_stdout import patch_stdout
 from rich.console import Console
+from rich.live import Live
+from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.prompt import Prompt
 
 from agent.client import AgentClient
 from session_manager import SessionManager
 from utils.config import load_config, should_show_model_name
+from utils.event_loop import install_event_loop_policy
 from utils.logger import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+# Shared console - Console() probes terminal capabilities, so create it once
+console = Console()
+
+# Rich markup for the mode line in the welcome panel
+_MODE_DESC_TMPL = "[bold {color}]{emoji} {mode} MODE[/bold {color}] - {model}"
+
 
 class CLIInterface:
     """Interactive command-line interface for screenshot organization."""
@@ -30,27 +42,39 @@ class CLIInterface:
             mode: Operation mode ("local", "remote", or None for auto-detect).
             local_config: Optional dict with local mode config (port, endpoint).
         """
-        self.console = Console()
+        self.console = console
+        self._prompt_session = PromptSession()
         self.agent_client = AgentClient(mode=mode, local_config=local_config)
         self.session_manager = SessionManager()
         self.session_id = session_id or self.session_manager.create_session()
         self.thread = None  # Will be initialized in chat_loop
+        self._session_dirty = False  # True when the thread has changes not yet saved
+
+        # Settings that cannot change during a session - resolve once, not per turn
+        self._mode = self.agent_client.mode
+        self._show_model = should_show_model_name()
 
         logger.info(f"CLI initialized with session: {self.session_id}")
 
-    async def initialize_thread(self):
-        """Initialize or load thread for conversation."""
-        # Try to load previous session if resuming
-        if self.session_id:
-            thread_data = self.session_manager.load_session(self.session_id)
-            if thread_data:
-                try:
-                    self.thread = await self.agent_client.deserialize_thread(thread_data)
-                    logger.info(f"Resumed session {self.session_id} with saved thread")
-                except Exception as e:
-                    logger.warning(f"Failed to deserialize thread: {e}, creating new thread")
-                    self.thread = self.agent_client.get_new_thread()
-            else:
+    async def load_session_data(self) -> Optional[Dict[str, Any]]:
+        """Read the saved thread for the resumed session, if any (off the event loop)."""
+        if not self.session_id:
+            return None
+        return await asyncio.to_thread(self.session_manager.load_session, self.session_id)
+
+    async def initialize_thread(self, thread_data: Optional[Dict[str, Any]] = None):
+        """Initialize or load thread for conversation.
+
+        Args:
+            thread_data: Saved thread from load_session_data(), or None to start fresh.
+        """
+        # Resume the previous session if its thread was saved
+        if thread_data:
+            try:
+                self.thread = await self.agent_client.deserialize_thread(thread_data)
+                logger.info(f"Resumed session {self.session_id} with saved thread")
+            except Exception as e:
+                logger.warning(f"Failed to deserialize thread: {e}, creating new thread")
                 self.thread = self.agent_client.get_new_thread()
         else:
             self.thread = self.agent_client.get_new_thread()
@@ -58,11 +82,14 @@ class CLIInterface:
     def show_welcome(self):
         """Display welcome message and instructions."""
         # Mode-specific info
-        mode = self.agent_client.mode
+        mode = self._mode
         model_name = self.agent_client.model_name
 
         mode_emoji = "🏠" if mode == "local" else "☁️"
-        mode_desc = f"[bold {('green' if mode == 'local' else 'cyan')}]{mode_emoji} {mode.upper()} MODE[/bold {('green' if mode == 'local' else 'cyan')}] - {model_name}"
+        mode_color = "green" if mode == "local" else "cyan"
+        mode_desc = _MODE_DESC_TMPL.format(
+            color=mode_color, emoji=mode_emoji, mode=mode.upper(), model=model_name
+        )
 
         if mode == "local":
             mode_info = "• TESTING MODE: Basic chat only (no tools)\n• Use for quick testing of conversation flow\n• Switch to remote mode for production use"
@@ -134,96 +161,148 @@ code, errors, documentation, design, communication, memes, other
             # Create new thread and clear session
             self.thread = self.agent_client.get_new_thread()
             self.session_manager.clear_session(self.session_id)
+            self._session_dirty = False
             self.console.print("[green]✓ Conversation history cleared[/green]\n")
             return True
 
         return False
 
-    async def chat_loop(self):
-        """Main interactive chat loop (async)."""
-        # Complete async initialization (MCP client for remote mode)
-        await self.agent_client.async_init()
+    async def save_session(self) -> bool:
+        """Persist the current thread if it changed since the last save.
 
-        # Initialize thread
-        await self.initialize_thread()
+        Returns:
+            True if the session was written, False if it was already up-to-date.
+        """
+        if not self._session_dirty:
+            return False
 
-        self.show_welcome()
+        thread_data = await self.agent_client.serialize_thread(self.thread)
+        self.session_manager.save_session(self.session_id, thread_data)
+        self._session_dirty = False
+        return True
 
-        # Trigger proactive introduction (remote mode only)
-        if self.agent_client.mode == "remote":
-            self.console.print()
-            with self.console.status("[cyan]Agent initializing...[/cyan]", spinner="dots"):
-                # Send simple trigger to start conversation
-                intro_response = await self.agent_client.chat("Hello", thread=self.thread)
-
-            # Display agent's introduction
-            if should_show_model_name():
-                mode_emoji = "☁️"
-                mode_color = "cyan"
-                model_name = self.agent_client.model_name
-                self.console.print(f"[bold {mode_color}]Assistant {mode_emoji} {model_name}[/bold {mode_color}]\n")
-            else:
-                self.console.print(f"[bold cyan]Assistant[/bold cyan]\n")
+    async def stream_response(self, user_input: str, header: str, status_text: str):
+        """Send a message to the agent and render the reply as it streams in.
 
-            self.console.print(intro_response)
-            self.console.print()
+        The spinner is shown only until the first chunk arrives; after that the
+        accumulated markdown is re-rendered live as each chunk is received.
+
+        Args:
+            user_input: Message to send to the agent.
+            header: Rich markup printed above the reply.
+            status_text: Rich markup for the spinner shown while waiting.
+        """
+        self._session_dirty = True
+        stream = self.agent_client.chat_stream(user_input, thread=self.thread)
+
+        with self.console.status(status_text, spinner="dots"):
+            first_chunk = await anext(stream, "")
+
+        self.console.print(header)
+        self.console.print()
+
+        response = first_chunk
+        with Live(Markdown(response), console=self.console, refresh_per_second=10) as live:
+            async for chunk in stream:
+                response += chunk
+                live.update(Markdown(response))
+
+        if not response:
+            self.console.print("(No response generated)")
+        self.console.print()
 
+    async def final_save(self):
+        """Save final session state on exit (skipped if already up-to-date)."""
         try:
-            while True:
-                # Get user input
-                try:
-                    user_input = Prompt.ask("[bold green]You[/bold green]")
-                except EOFError:
-                    # Handle Ctrl+D
-                    self.console.print("\n[cyan]Goodbye! 👋[/cyan]")
-                    break
-
-                # Skip empty input
-                if not user_input.strip():
-                    continue
+            if await self.save_session():
+                logger.info("Session saved before exit")
+            else:
+                logger.info("Session up-to-date, nothing to save before exit")
+        except Exception as e:
+            logger.error(f"Failed to save session on exit: {e}")
+
+    async def chat_loop(self):
+        """Main interactive chat loop (async)."""
+        async with contextlib.AsyncExitStack() as stack:
+            # Read the session file in a worker thread while the MCP client
+            # starts. The client is entered in this task: its anyio cancel
+            # scopes must be exited by the task that entered them, and the
+            # stack stops it on every exit path.
+            session_read = asyncio.create_task(self.load_session_data())
+            try:
+                await stack.enter_async_context(self.agent_client)
+            except BaseException:
+                session_read.cancel()
+                raise
+            await self.initialize_thread(await session_read)
 
-                # Handle commands
-                if user_input.startswith("/"):
-                    if await self.handle_command(user_input):
-                        if user_input.strip().lower() in ["/quit", "/exit"]:
-                            break
-                        continue
+            # Registered after the client so it runs before the MCP client stops
+            stack.push_async_callback(self.final_save)
 
-                # Send to agent client
+            self.show_welcome()
+
+            # Trigger proactive introduction (remote mode only)
+            if self._mode == "remote":
                 self.console.print()
-                with self.console.status("[cyan]Thinking...[/cyan]", spinner="dots"):
-                    response = await self.agent_client.chat(user_input, thread=self.thread)
-
-                # Display response with model indicator
-                if should_show_model_name():
-                    mode_emoji = "🏠" if self.agent_client.mode == "local" else "☁️"
-                    mode_color = "green" if self.agent_client.mode == "local" else "cyan"
-                    model_badge = f"[{mode_color}]{mode_emoji} {self.agent_client.mode}[/{mode_color}]"
-                    self.console.print(f"[bold blue]Assistant[/bold blue] {model_badge}")
+
+                # Display agent's introduction
+                if self._show_model:
+                    mode_emoji = "☁️"
+                    mode_color = "cyan"
+                    model_name = self.agent_client.model_name
+                    header = f"[bold {mode_color}]Assistant {mode_emoji} {model_name}[/bold {mode_color}]"
                 else:
-                    self.console.print("[bold blue]Assistant[/bold blue]")
-                self.agent_client.display_response(response)
+                    header = "[bold cyan]Assistant[/bold cyan]"
 
-                # Save session after each exchange
-                thread_data = await self.agent_client.serialize_thread(self.thread)
-                self.session_manager.save_session(self.session_id, thread_data)
+                # Send simple trigger to start conversation
+                await self.stream_response("Hello", header, "[cyan]Agent initializing...[/cyan]")
 
-        except KeyboardInterrupt:
-            self.console.print("\n\n[cyan]Interrupted. Goodbye! 👋[/cyan]")
-        except Exception as e:
-            self.console.print(f"\n[red]Error: {e}[/red]")
-            logger.error(f"Chat loop error: {e}", exc_info=True)
-        finally:
-            # Save final session state
             try:
-                thread_data = await self.agent_client.serialize_thread(self.thread)
-                self.session_manager.save_session(self.session_id, thread_data)
-                logger.info("Session saved before exit")
+                await self._run_turns()
+            except KeyboardInterrupt:
+                self.console.print("\n\n[cyan]Interrupted. Goodbye! 👋[/cyan]")
             except Exception as e:
-                logger.error(f"Failed to save session on exit: {e}")
+                self.console.print(f"\n[red]Error: {e}[/red]")
+                logger.error(f"Chat loop error: {e}", exc_info=True)
+
+    async def _run_turns(self):
+        """Read user input and exchange messages until the user quits."""
+        while True:
+            # Get user input without blocking the event loop
+            try:
+                with patch_stdout():
+                    user_input = await self._prompt_session.prompt_async(
+                        HTML("<ansigreen><b>You</b></ansigreen>: ")
+                    )
+            except EOFError:
+                # Handle Ctrl+D
+                self.console.print("\n[cyan]Goodbye! 👋[/cyan]")
+                break
+
+            # Skip empty input
+            if not user_input.strip():
+                continue
+
+            # Handle commands
+            if user_input.startswith("/"):
+                if await self.handle_command(user_input):
+                    if user_input.strip().lower() in ["/quit", "/exit"]:
+                        break
+                    continue
+
+            # Send to agent client and display response with model indicator
+            self.console.print()
+            if self._show_model:
+                mode_emoji = "🏠" if self._mode == "local" else "☁️"
+                mode_color = "green" if self._mode == "local" else "cyan"
+                model_badge = f"[{mode_color}]{mode_emoji} {self._mode}[/{mode_color}]"
+                header = f"[bold blue]Assistant[/bold blue] {model_badge}"
+            else:
+                header = "[bold blue]Assistant[/bold blue]"
+            await self.stream_response(user_input, header, "[cyan]Thinking...[/cyan]")
 
-            # Cleanup MCP client
-            await self.agent_client.cleanup()
+            # Save session after each exchange
+            await self.save_session()
 
 
 @click.command()
@@ -298,7 +377,6 @@ def main(session: Optional[str], local: bool, port: Optional[int],
     if mode == "remote":
         endpoint = os.environ.get("AZURE_AI_CHAT_ENDPOINT")
         if not endpoint:
-            console = Console()
             console.print("[red]Error: Azure credentials not configured for remote mode.[/red]")
             console.print()
             console.print("Required environment variables:")
@@ -326,10 +404,10 @@ def main(session: Optional[str], local: bool, port: Optional[int],
     # Create and run CLI
     try:
         cli = CLIInterface(session_id=session, mode=mode, local_config=local_config if local_config else None)
+        install_event_loop_policy()
         asyncio.run(cli.chat_loop())
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
-        console = Console()
         console.print(f"[red]Fatal error: {e}[/red]")
         sys.exit(1)
 
@@ -23,18 +23,54 @@ Requires:
 - Inference server running (foundry run phi-4-mini)
 """
 
+import asyncio
 import json
+import threading
 from typing import Any, Dict, List, Optional, Union
 
+import requests
+
 from agent_framework import BaseChatClient
-from agent_framework._types import ChatMessage, ChatResponse
+from agent_framework._types import ChatMessage, ChatResponse, ChatResponseUpdate, Role
 from azure.ai.inference import ChatCompletionsClient
 from azure.ai.inference.models import SystemMessage, UserMessage, AssistantMessage
+from azure.core.pipeline.transport import RequestsTransport
 from utils.logger import get_logger
 from utils.foundry_local import detect_foundry_endpoint, detect_model_id, get_foundry_setup_instructions, clear_endpoint_cache
 
+try:
+    import aiohttp  # noqa: F401 - transport used by the azure-core async pipeline
+    from azure.ai.inference.aio import ChatCompletionsClient as AsyncChatCompletionsClient
+except ImportError:  # Optional speedup - fall back to the sync client in worker threads
+    AsyncChatCompletionsClient = None
+
 logger = get_logger(__name__)
 
+# Azure AI Inference message class per role (unknown roles are sent as user)
+_MESSAGE_TYPES = {
+    "system": SystemMessage,
+    "user": UserMessage,
+    "assistant": AssistantMessage,
+}
+
+# HTTP session shared by every client's sync transport (see _get_shared_session)
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Get the requests session shared by all local clients (created on first use).
+
+    Clients built for new instances or after endpoint re-detection reuse its
+    pooled keep-alive connections instead of each starting an empty pool.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = requests.Session()
+    return _shared_session
+
 
 class LocalFoundryChatClient(BaseChatClient):
     """Local AI Foundry chat client - TESTING ONLY.
@@ -75,8 +111,8 @@ class LocalFoundryChatClient(BaseChatClient):
         # 2. Use provided endpoint (if specific URL given)
         # 3. Fall back to default port with warning
         if endpoint is None or endpoint == "auto":
-            # Clear cache to get fresh endpoint/model detection
-            clear_endpoint_cache()
+            # Detection results are cached briefly, so clients created in quick
+            # succession skip the subprocess; connection errors re-detect
             logger.debug("Attempting to auto-detect Foundry Local endpoint...")
             detected_endpoint = detect_foundry_endpoint()
 
@@ -109,17 +145,69 @@ class LocalFoundryChatClient(BaseChatClient):
             logger.warning(f"⚠️  Could not detect full model ID, using: {self.model_name}")
             logger.warning("    This may cause 404 errors. Check 'foundry model load phi-4'")
 
-        # Initialize Azure AI Inference client (works with local server too)
-        self.client = ChatCompletionsClient(
-            endpoint=self.endpoint,
-            credential={}  # Local doesn't need credentials
-        )
+        # Initialize Azure AI Inference clients (work with local server too)
+        self._connect()
 
         logger.info(f"🏠 LocalFoundryChatClient initialized")
         logger.info(f"   Endpoint: {self.endpoint}")
         logger.info(f"   Model: {self.model_name}")
         logger.info("   Mode: FULLY LOCAL - no cloud dependencies")
 
+    def _connect(self):
+        """Create the Azure AI Inference clients for the current endpoint.
+
+        The sync client serves health checks (and every call when aiohttp is
+        not installed); the async client lets concurrent requests overlap on
+        the event loop without a thread each.
+        """
+        self.client = ChatCompletionsClient(
+            endpoint=self.endpoint,
+            credential={},  # Local doesn't need credentials
+            # Shared session: closing this client leaves it open for the others
+            transport=RequestsTransport(session=_get_shared_session(), session_owner=False)
+        )
+        self.async_client = (
+            AsyncChatCompletionsClient(endpoint=self.endpoint, credential={})
+            if AsyncChatCompletionsClient is not None else None
+        )
+
+    async def _reconnect(self) -> bool:
+        """Re-detect the endpoint off the event loop, closing a replaced async client."""
+        old_async_client = self.async_client
+        reconnected = await asyncio.to_thread(self._reinitialize_connection)
+        if old_async_client is not None and old_async_client is not self.async_client:
+            await old_async_client.close()
+        return reconnected
+
+    async def _complete(self, **kwargs):
+        """Call chat completions without blocking the event loop."""
+        if self.async_client is not None:
+            return await self.async_client.complete(**kwargs)
+        # The sync call blocks, so run it in a worker thread; the client's
+        # pooled keep-alive connection is reused across calls
+        return await asyncio.to_thread(self.client.complete, **kwargs)
+
+    async def _stream_updates(self, **kwargs):
+        """Yield streaming chat completion updates without blocking the event loop."""
+        if self.async_client is not None:
+            stream = await self.async_client.complete(stream=True, **kwargs)
+            try:
+                async for update in stream:
+                    yield update
+            finally:
+                await stream.aclose()
+            return
+
+        stream = await asyncio.to_thread(self.client.complete, stream=True, **kwargs)
+        try:
+            # The sync stream is a blocking iterator; pull each update in a
+            # worker thread so the event loop stays free between chunks
+            updates = iter(stream)
+            while (update := await asyncio.to_thread(next, updates, None)) is not None:
+                yield update
+        finally:
+            stream.close()
+
     def _reinitialize_connection(self):
         """Reinitialize endpoint and model detection (called on connection errors).
 
@@ -142,11 +230,8 @@ class LocalFoundryChatClient(BaseChatClient):
                 self.model_name = detected_model_id
                 logger.info(f"✓ Re-detected model ID: {self.model_name}")
 
-            # Reinitialize client with new endpoint
-            self.client = ChatCompletionsClient(
-                endpoint=self.endpoint,
-                credential={}
-            )
+            # Reinitialize clients with new endpoint
+            self._connect()
             return True
         else:
             logger.warning("Failed to re-detect endpoint")
@@ -183,50 +268,25 @@ class LocalFoundryChatClient(BaseChatClient):
             List of SystemMessage, UserMessage, AssistantMessage objects.
         """
         # Normalize to list
-        if isinstance(messages, str):
-            return [UserMessage(content=messages)]
-        elif isinstance(messages, ChatMessage):
-            role = str(messages.role).lower()  # Convert Role enum to string
-            content = messages.text or ""  # ChatMessage uses 'text' not 'content'
-            if role == "system":
-                return [SystemMessage(content=content)]
-            elif role == "user":
-                return [UserMessage(content=content)]
-            elif role == "assistant":
-                return [AssistantMessage(content=content)]
-            else:
-                return [UserMessage(content=content)]
-        elif isinstance(messages, list):
-            result = []
-            for msg in messages:
-                if isinstance(msg, str):
-                    result.append(UserMessage(content=msg))
-                elif isinstance(msg, ChatMessage):
-                    role = str(msg.role).lower()  # Convert Role enum to string
-                    content = msg.text or ""  # ChatMessage uses 'text' not 'content'
-                    if role == "system":
-                        result.append(SystemMessage(content=content))
-                    elif role == "user":
-                        result.append(UserMessage(content=content))
-                    elif role == "assistant":
-                        result.append(AssistantMessage(content=content))
-                    else:
-                        result.append(UserMessage(content=content))
-                elif isinstance(msg, dict):
-                    role = msg.get("role", "user").lower()
-                    content = msg.get("content", "") or msg.get("text", "")  # Support both
-                    if role == "system":
-                        result.append(SystemMessage(content=content))
-                    elif role == "user":
-                        result.append(UserMessage(content=content))
-                    elif role == "assistant":
-                        result.append(AssistantMessage(content=content))
-                    else:
-                        result.append(UserMessage(content=content))
-            return result
-        else:
+        if isinstance(messages, (str, ChatMessage)):
+            messages = [messages]
+        elif not isinstance(messages, list):
             return [UserMessage(content=str(messages))]
 
+        result = []
+        for msg in messages:
+            if isinstance(msg, str):
+                result.append(UserMessage(content=msg))
+            elif isinstance(msg, ChatMessage):
+                # Role enum to string; ChatMessage uses 'text' not 'content'
+                message_type = _MESSAGE_TYPES.get(str(msg.role).lower(), UserMessage)
+                result.append(message_type(content=msg.text or ""))
+            elif isinstance(msg, dict):
+                message_type = _MESSAGE_TYPES.get(msg.get("role", "user").lower(), UserMessage)
+                content = msg.get("content", "") or msg.get("text", "")  # Support both
+                result.append(message_type(content=content))
+        return result
+
     async def _inner_get_response(
         self,
         *,
@@ -264,7 +324,7 @@ class LocalFoundryChatClient(BaseChatClient):
         for attempt in range(1, max_attempts + 1):
             try:
                 # Call local AI Foundry server - basic chat only
-                response = self.client.complete(
+                response = await self._complete(
                     messages=inference_messages,
                     model=self.model_name,
                     temperature=temperature,
@@ -292,7 +352,7 @@ class LocalFoundryChatClient(BaseChatClient):
                     logger.warning(f"Connection error on attempt {attempt}: {error_type}")
                     logger.info("Retrying with re-detected endpoint...")
 
-                    if self._reinitialize_connection():
+                    if await self._reconnect():
                         continue  # Retry with new endpoint
                     else:
                         # Re-detection failed, fall through to error handling
@@ -315,12 +375,71 @@ class LocalFoundryChatClient(BaseChatClient):
         chat_options: Optional[Any] = None,
         **kwargs
     ):
-        """Streaming response not yet implemented for local mode.
+        """Stream a basic chat response from the local model as it is decoded.
+
+        LOCAL MODE - TESTING ONLY: text only, no tool calls (see
+        _inner_get_response). Text arrives after the first decoded tokens
+        instead of after the whole completion.
 
-        This is a placeholder to satisfy the BaseChatClient abstract method requirement.
-        Streaming can be implemented in the future if needed.
+        Args:
+            messages: User messages in Agent Framework format
+            chat_options: Optional chat options (temperature, max_tokens)
+            **kwargs: Additional parameters
+
+        Yields:
+            ChatResponseUpdate objects with the text of each streamed chunk
         """
-        raise NotImplementedError("Streaming responses are not yet supported in local mode")
+        temperature = kwargs.get('temperature', getattr(chat_options, 'temperature', 0.7) if chat_options else 0.7)
+        max_tokens = kwargs.get('max_tokens', getattr(chat_options, 'max_tokens', 1024) if chat_options else 1024)
+
+        inference_messages = self._convert_to_inference_messages(messages)
+
+        logger.debug(f"🏠 LOCAL: Streaming basic chat response with {self.model_name}")
+
+        # Retry logic as in _inner_get_response, but only while nothing has
+        # been yielded yet - a retry after that would repeat the reply
+        max_attempts = 2
+        for attempt in range(1, max_attempts + 1):
+            streamed = False
+            try:
+                async for update in self._stream_updates(
+                    messages=inference_messages,
+                    model=self.model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                ):
+                    if update.choices and update.choices[0].delta.content:
+                        streamed = True
+                        yield ChatResponseUpdate(text=update.choices[0].delta.content, role=Role.ASSISTANT)
+                return
+
+            except Exception as e:
+                error_type = type(e).__name__
+                is_connection_error = "connection" in str(e).lower() or "not found" in str(e).lower()
+
+                if attempt < max_attempts and is_connection_error and not streamed:
+                    logger.warning(f"Connection error on streaming attempt {attempt}: {error_type}")
+                    logger.info("Retrying with re-detected endpoint...")
+
+                    if await self._reconnect():
+                        continue  # Retry with new endpoint
+
+                logger.error(f"Error streaming local response (attempt {attempt}): {e}", exc_info=True)
+                yield ChatResponseUpdate(
+                    text=(
+                        f"I encountered an error connecting to the local AI Foundry server:\n"
+                        f"{str(e)}\n\n"
+                        f"{get_foundry_setup_instructions()}"
+                    ),
+                    role=Role.ASSISTANT
+                )
+                return
+
+    async def aclose(self):
+        """Close the clients' HTTP connections."""
+        if self.async_client is not None:
+            await self.async_client.close()
+        self.client.close()
 
     # Additional methods for compatibility with Agent Framework
 
@@ -1,16 +1,24 @@
 """Batch processor for organizing multiple screenshots efficiently."""
 
+import json
+import os
+import pickle
+import stat
+import threading
 import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional, Tuple
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchStats:
     """Statistics from batch processing operation."""
     total_files: int = 0
@@ -20,6 +28,7 @@ class BatchStats:
     skipped: int = 0
     processing_time_ms: float = 0.0
     errors: list[str] = field(default_factory=list)
+    categories_count: Counter = field(default_factory=Counter)
     
     @property
     def success_rate(self) -> float:
@@ -29,7 +38,7 @@ class BatchStats:
         return (self.successful / self.processed) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class FileProcessingResult:
     """Result of processing a single file."""
     path: Path
@@ -44,25 +53,53 @@ class BatchProcessor:
 
     def __init__(
         self,
-        supported_extensions: Optional[list[str]] = None
+        supported_extensions: Optional[list[str]] = None,
+        scan_workers: int = 0,
+        process_workers: int = 1,
+        use_processes: bool = False,
+        sort_by_inode: bool = False
     ):
         """Initialize batch processor.
 
         Args:
             supported_extensions: List of file extensions to process (e.g., ['.png', '.jpg']).
                                 If None, defaults to common image formats.
+            scan_workers: Threads for recursive directory scans. 0 scans serially;
+                          higher values help on network filesystems (NFS/SMB),
+                          where directory reads and stats are latency-bound.
+            process_workers: Files processed concurrently by process_batch. OCR
+                             runs in tesseract subprocesses and vision calls wait
+                             on the network, so threads scale with the core count.
+            use_processes: Run process_workers in a process pool instead of
+                           threads, for processor functions that do CPU-bound
+                           work in Python and would otherwise serialize on the
+                           GIL. The function, its results and its exceptions
+                           must be picklable; if the function is not (a lambda
+                           or closure), threads are used instead.
+            sort_by_inode: Return scan_folder/scan_entries results in inode
+                           order rather than directory order. Inode order
+                           roughly follows on-disk layout, so processing the
+                           files in that order reads cold data more
+                           sequentially (notably on spinning disks).
         """
+        self.scan_workers = scan_workers
+        self.process_workers = process_workers
+        self.use_processes = use_processes
+        self.sort_by_inode = sort_by_inode
         if supported_extensions is None:
             self.supported_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff']
         else:
-            # Ensure extensions have leading dot
+            # Ensure extensions have leading dot and are lower-case (scans
+            # compare against the lower-cased file name)
             self.supported_extensions = [
-                ext if ext.startswith('.') else f'.{ext}'
+                (ext if ext.startswith('.') else f'.{ext}').lower()
                 for ext in supported_extensions
             ]
         
         logger.info(
-            f"BatchProcessor initialized with extensions: {self.supported_extensions}"
+            f"BatchProcessor initialized with extensions: {self.supported_extensions} "
+            f"(scan_workers={scan_workers}, process_workers={process_workers}, "
+            f"use_processes={use_processes}, sort_by_inode={sort_by_inode})"
         )
 
     def scan_folder(
@@ -79,39 +116,155 @@ class BatchProcessor:
         Returns:
             List of file paths matching supported extensions.
         """
-        folder_path = Path(folder_path).expanduser()
+        return [Path(entry.path) for entry in self.scan_entries(folder_path, recursive)]
 
-        if not folder_path.exists():
-            logger.error(f"Folder not found: {folder_path}")
-            return []
-        
-        if not folder_path.is_dir():
-            logger.error(f"Not a directory: {folder_path}")
-            return []
-        
-        files = []
-        pattern = "**/*" if recursive else "*"
-        
+    def scan_entries(
+        self,
+        folder_path: str | Path,
+        recursive: bool = False
+    ) -> list[os.DirEntry]:
+        """Scan folder for supported files, returning raw directory entries.
+
+        Cheaper than scan_folder when callers only need path strings and
+        stat results: no Path objects are built, and DirEntry.stat() is
+        cached per entry.
+
+        Args:
+            folder_path: Path to folder to scan.
+            recursive: If True, scan subdirectories recursively.
+
+        Returns:
+            List of os.DirEntry objects matching supported extensions.
+        """
+        files = list(self.iter_entries(folder_path, recursive))
+        if self.sort_by_inode:
+            # On POSIX the inode number comes with the directory read, so no stat
+            files.sort(key=os.DirEntry.inode)
+        logger.info(
+            f"Found {len(files)} supported files in {folder_path} "
+            f"(recursive={recursive})"
+        )
+        return files
+
+    def iter_entries(
+        self,
+        folder_path: str | Path,
+        recursive: bool = False
+    ) -> Iterator[os.DirEntry]:
+        """Lazily yield directory entries for supported files.
+
+        Callers that only need part of the listing (or just a count) can stop
+        or skip without holding every entry in memory.
+
+        Args:
+            folder_path: Path to folder to scan.
+            recursive: If True, scan subdirectories recursively.
+
+        Yields:
+            os.DirEntry objects matching supported extensions. Scanning stops
+            (after logging) if a directory cannot be read. With scan_workers
+            set, recursive scans are parallel and entries come sorted by path,
+            so the order is stable between calls.
+        """
+        folder = os.path.expanduser(os.fspath(folder_path))
+
+        # One stat covers both the existence and the directory check
         try:
-            for item in folder_path.glob(pattern):
-                if item.is_file() and item.suffix.lower() in self.supported_extensions:
-                    files.append(item)
-            
-            logger.info(
-                f"Found {len(files)} supported files in {folder_path} "
-                f"(recursive={recursive})"
-            )
-            return files
-            
-        except Exception as e:
-            logger.error(f"Error scanning folder {folder_path}: {e}")
-            return []
+            folder_stat = os.stat(folder)
+        except OSError:
+            logger.error(f"Folder not found: {folder}")
+            return
+
+        if not stat.S_ISDIR(folder_stat.st_mode):
+            logger.error(f"Not a directory: {folder}")
+            return
+
+        extensions = tuple(self.supported_extensions)
+
+        if recursive and self.scan_workers > 0:
+            yield from self._scan_parallel(folder, extensions)
+            return
+
+        stack = [folder]
+
+        try:
+            # Walk with os.scandir: DirEntry caches the type from the directory
+            # read, so filtering needs no extra stat per entry
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith(extensions) and entry.is_file():
+                            yield entry
+
+        except OSError as e:
+            logger.error(f"Error scanning folder {folder}: {e}")
+
+    def _scan_parallel(self, folder: str, extensions: tuple[str, ...]) -> list[os.DirEntry]:
+        """Walk a directory tree with a pool of threads sharing a LIFO stack.
+
+        Each worker pops a directory, reads it with os.scandir and pushes its
+        subdirectories back. Directory reads and the stat of matching files
+        run outside the GIL, so they overlap across workers.
+
+        Args:
+            folder: Root directory to walk.
+            extensions: Lower-case file extensions to match.
+
+        Returns:
+            Matching os.DirEntry objects, sorted by path.
+        """
+        stack = [folder]
+        found: list[os.DirEntry] = []
+        in_progress = 0
+        cond = threading.Condition()
+
+        def worker():
+            nonlocal in_progress
+            while True:
+                with cond:
+                    # Idle until there is work, or stop once nothing is queued or running
+                    while not stack and in_progress:
+                        cond.wait()
+                    if not stack:
+                        cond.notify_all()
+                        return
+                    directory = stack.pop()
+                    in_progress += 1
+
+                subdirs, files = [], []
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.name.lower().endswith(extensions) and entry.is_file():
+                                entry.stat()  # Warm the DirEntry stat cache in parallel
+                                files.append(entry)
+                except OSError as e:
+                    logger.warning(f"Error scanning folder {directory}: {e}")
+                finally:
+                    with cond:
+                        stack.extend(subdirs)
+                        found.extend(files)
+                        in_progress -= 1
+                        cond.notify_all()
+
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as executor:
+            for future in [executor.submit(worker) for _ in range(self.scan_workers)]:
+                future.result()
+
+        found.sort(key=lambda entry: entry.path)
+        return found
 
     def process_batch(
         self,
         files: list[Path],
         processor_func: Callable[[Path], FileProcessingResult],
-        progress_callback: Optional[Callable[[int, int, Path], None]] = None
+        progress_callback: Optional[Callable[[int, int, Path], None]] = None,
+        results_path: Optional[str | Path] = None
     ) -> BatchStats:
         """Process a batch of files with progress tracking.
 
@@ -119,47 +272,68 @@ class BatchProcessor:
             files: List of file paths to process.
             processor_func: Function to process each file. Should return FileProcessingResult.
             progress_callback: Optional callback function(current, total, file_path) for progress updates.
+            results_path: Optional JSON Lines file that receives one record per
+                file (path, success, category, error, processing_time_ms) as
+                soon as it is processed, so per-file results survive a crash
+                mid-batch without being held in memory.
 
         Returns:
             BatchStats with processing results and statistics.
         """
-        stats = BatchStats(total_files=len(files))
-        start_time = time.perf_counter()
-        
-        logger.info(f"Starting batch processing of {len(files)} files")
+        total = len(files)
+        stats = BatchStats(total_files=total)
+        start_ns = time.perf_counter_ns()
         
-        for idx, file_path in enumerate(files, 1):
-            try:
+        workers = min(self.process_workers, total)
+        logger.info(f"Starting batch processing of {total} files ({max(workers, 1)} workers)")
+
+        # Open the results file first: a bad path fails before any worker starts
+        results_file = open(results_path, "w", encoding="utf-8", buffering=1) if results_path else None
+        executor = read_ahead = None
+
+        try:
+            # Results come back in input order either way; statistics and
+            # logging stay in this thread
+            executor = self._make_executor(workers, processor_func) if workers > 1 else None
+            outcomes = None
+            if executor is not None:
+                # Hand process workers several files per round trip to amortize pickling
+                chunksize = max(1, total // (4 * workers)) if isinstance(executor, ProcessPoolExecutor) else 1
+                outcomes = executor.map(partial(_call_safely, processor_func), files, chunksize=chunksize)
+            # Serially, a helper thread reads the next file ahead while the current
+            # one is processed, so its disk/network read overlaps OCR compute
+            read_ahead = ThreadPoolExecutor(max_workers=1) if executor is None and total > 1 else None
+
+            for idx, file_path in enumerate(files, 1):
                 # Call progress callback if provided
+                callback_error = None
                 if progress_callback:
-                    progress_callback(idx, len(files), file_path)
-                
-                # Process file
-                result = processor_func(file_path)
-                stats.processed += 1
-                
-                if result.success:
-                    stats.successful += 1
-                    logger.debug(
-                        f"[{idx}/{len(files)}] Successfully processed: {file_path.name} -> {result.category}"
-                    )
-                else:
-                    stats.failed += 1
-                    error_msg = f"{file_path.name}: {result.error or 'Unknown error'}"
-                    stats.errors.append(error_msg)
-                    logger.warning(
-                        f"[{idx}/{len(files)}] Failed to process: {error_msg}"
-                    )
-                    
-            except Exception as e:
-                stats.failed += 1
-                error_msg = f"{file_path.name}: {str(e)}"
-                stats.errors.append(error_msg)
-                logger.error(
-                    f"[{idx}/{len(files)}] Exception processing {file_path.name}: {e}"
-                )
-        
-        stats.processing_time_ms = (time.perf_counter() - start_time) * 1000
+                    try:
+                        progress_callback(idx, total, file_path)
+                    except Exception as e:
+                        callback_error = e
+
+                if read_ahead is not None and idx < total:
+                    read_ahead.submit(_read_ahead, files[idx])
+
+                # Process file (or collect the already-running one, in order)
+                if outcomes is not None:
+                    result, error = next(outcomes)
+                elif callback_error is None:
+                    result, error = _call_safely(processor_func, file_path)
+                if callback_error is not None:
+                    result, error = None, callback_error
+                self._record_result(stats, idx, file_path, result, error)
+                if results_file is not None:
+                    results_file.write(_result_record(file_path, result, error))
+        finally:
+            for pool in (executor, read_ahead):
+                if pool is not None:
+                    pool.shutdown(cancel_futures=True)
+            if results_file is not None:
+                results_file.close()
+
+        stats.processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
         logger.info(
             f"Batch processing complete: {stats.successful}/{stats.total_files} successful "
@@ -171,12 +345,68 @@ class BatchProcessor:
         
         return stats
 
+    def _make_executor(
+        self,
+        workers: int,
+        processor_func: Callable[[Path], FileProcessingResult]
+    ) -> Executor:
+        """Create the pool for process_batch: processes if configured and possible, else threads."""
+        if self.use_processes:
+            try:
+                pickle.dumps(processor_func)
+            except Exception as e:
+                logger.warning(
+                    f"processor_func cannot be sent to worker processes ({e}); using threads"
+                )
+            else:
+                return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def _record_result(
+        self,
+        stats: BatchStats,
+        idx: int,
+        file_path: Path,
+        result: Optional[FileProcessingResult],
+        error: Optional[Exception]
+    ):
+        """Add one file's outcome to the batch statistics."""
+        total = stats.total_files
+        if error is not None:
+            stats.failed += 1
+            error_msg = f"{file_path.name}: {str(error)}"
+            stats.errors.append(error_msg)
+            logger.error(
+                f"[{idx}/{total}] Exception processing {file_path.name}: {error}"
+            )
+            return
+
+        stats.processed += 1
+                
+        if result.success:
+            stats.successful += 1
+            if result.category:
+                stats.categories_count[result.category] += 1
+            logger.debug(
+                "[%d/%d] Successfully processed: %s -> %s", idx, total, file_path.name, result.category
+            )
+        else:
+            stats.failed += 1
+            error_msg = f"{file_path.name}: {result.error or 'Unknown error'}"
+            stats.errors.append(error_msg)
+            logger.warning(
+                f"[{idx}/{total}] Failed to process: {error_msg}"
+            )
+
     def process_folder(
         self,
         folder_path: str | Path,
         processor_func: Callable[[Path], FileProcessingResult],
         recursive: bool = False,
-        progress_callback: Optional[Callable[[int, int, Path], None]] = None
+        progress_callback: Optional[Callable[[int, int, Path], None]] = None,
+        results_path: Optional[str | Path] = None,
+        min_size_kb: Optional[int] = None,
+        max_size_kb: Optional[int] = None
     ) -> BatchStats:
         """Scan and process all supported files in a folder.
 
@@ -185,35 +415,45 @@ class BatchProcessor:
             processor_func: Function to process each file.
             recursive: If True, process subdirectories recursively.
             progress_callback: Optional progress callback function.
+            results_path: Optional JSON Lines file for per-file results (see process_batch).
+            min_size_kb: Skip files smaller than this (see filter_files_by_size).
+            max_size_kb: Skip files larger than this (see filter_files_by_size).
 
         Returns:
             BatchStats with processing results.
         """
-        # Scan folder for files
-        files = self.scan_folder(folder_path, recursive=recursive)
+        # Scan and size-filter the directory entries, so the size check uses
+        # each entry's cached stat; Path objects are built only for survivors
+        entries = self.scan_entries(folder_path, recursive=recursive)
+        if min_size_kb is not None or max_size_kb is not None:
+            entries = self.filter_files_by_size(entries, min_size_kb, max_size_kb)
+        files = [Path(entry.path) for entry in entries]
         
         if not files:
             logger.warning(f"No supported files found in {folder_path}")
             return BatchStats(total_files=0)
         
         # Process batch
-        return self.process_batch(files, processor_func, progress_callback)
+        return self.process_batch(files, processor_func, progress_callback, results_path)
 
     def filter_files_by_size(
         self,
-        files: list[Path],
+        files: list[Path] | list[os.DirEntry],
         min_size_kb: Optional[int] = None,
         max_size_kb: Optional[int] = None
-    ) -> list[Path]:
+    ) -> list[Path] | list[os.DirEntry]:
         """Filter files by size constraints.
 
         Args:
-            files: List of file paths to filter.
+            files: List of file paths to filter, or entries from scan_entries.
+                   Entries cache their stat result, so filtering them costs no
+                   extra syscall after a parallel scan and leaves the stat
+                   cached for later callers.
             min_size_kb: Minimum file size in KB (inclusive).
             max_size_kb: Maximum file size in KB (inclusive).
 
         Returns:
-            Filtered list of file paths.
+            Filtered list of the same items that were passed in.
         """
         filtered = []
         
@@ -222,11 +462,11 @@ class BatchProcessor:
                 size_kb = file_path.stat().st_size / 1024
                 
                 if min_size_kb is not None and size_kb < min_size_kb:
-                    logger.debug(f"Skipping {file_path.name}: too small ({size_kb:.1f}KB)")
+                    logger.debug("Skipping %s: too small (%.1fKB)", file_path.name, size_kb)
                     continue
                 
                 if max_size_kb is not None and size_kb > max_size_kb:
-                    logger.debug(f"Skipping {file_path.name}: too large ({size_kb:.1f}KB)")
+                    logger.debug("Skipping %s: too large (%.1fKB)", file_path.name, size_kb)
                     continue
                 
                 filtered.append(file_path)
@@ -258,6 +498,11 @@ class BatchProcessor:
             f"Avg Time/File: {stats.processing_time_ms / stats.processed:.2f}ms" if stats.processed > 0 else "Avg Time/File: N/A",
         ]
         
+        if stats.categories_count:
+            report_lines.append("\n=== Categories ===")
+            for category, count in stats.categories_count.most_common():
+                report_lines.append(f"{category}: {count}")
+
         if stats.errors:
             report_lines.append(f"\n=== Errors ({len(stats.errors)}) ===")
             for idx, error in enumerate(stats.errors[:10], 1):  # Show first 10 errors
@@ -266,3 +511,52 @@ class BatchProcessor:
                 report_lines.append(f"... and {len(stats.errors) - 10} more errors")
         
         return "\n".join(report_lines)
+
+
+def _call_safely(
+    processor_func: Callable[[Path], FileProcessingResult],
+    file_path: Path
+) -> Tuple[Optional[FileProcessingResult], Optional[Exception]]:
+    """Run processor_func on one file, returning (result, None) or (None, exception)."""
+    try:
+        return processor_func(file_path), None
+    except Exception as e:
+        return None, e
+
+
+# Chunk size for read-ahead on platforms without posix_fadvise
+_READ_AHEAD_CHUNK = 1 << 20
+
+
+def _read_ahead(file_path: Path):
+    """Pull a file into the OS page cache so the next reader finds it there.
+
+    Uses posix_fadvise(WILLNEED) where available (kernel readahead, no
+    copy); elsewhere reads the file through once. Errors are ignored - the
+    processor reports them when it opens the file itself.
+    """
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                buffer = bytearray(_READ_AHEAD_CHUNK)
+                while f.readinto(buffer):
+                    pass
+    except OSError:
+        pass
+
+
+def _result_record(
+    file_path: Path,
+    result: Optional[FileProcessingResult],
+    error: Optional[Exception]
+) -> str:
+    """Format one file's outcome as a JSON Lines record."""
+    if result is None:
+        record = {"path": str(file_path), "success": False, "category": None,
+                  "error": str(error), "processing_time_ms": 0.0}
+    else:
+        record = {"path": str(file_path), "success": result.success, "category": result.category,
+                  "error": result.error, "processing_time_ms": result.processing_time_ms}
+    return json.dumps(record) + "\n"
@@ -1,9 +1,13 @@
 """File organizer for screenshot management with safe file operations."""
 
+import errno
+import os
 import re
 import shutil
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -11,8 +15,15 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Filename sanitization patterns, compiled once for large batches
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATORS_RE = re.compile(r'[-\s]+')
 
-@dataclass
+# Conflicting target paths whose next counter is remembered (least recently used dropped first)
+_NEXT_COUNTER_SIZE = 1024
+
+
+@dataclass(slots=True)
 class OrganizeResult:
     """Result of a file organization operation."""
     success: bool
@@ -29,7 +40,8 @@ class FileOrganizer:
         self,
         base_folder: str | Path,
         categories: list[str],
-        keep_originals: bool = True
+        keep_originals: bool = True,
+        preserve_metadata: bool = True
     ):
         """Initialize file organizer.
 
@@ -37,11 +49,21 @@ class FileOrganizer:
             base_folder: Base directory for organized screenshots.
             categories: List of valid category names for folders.
             keep_originals: If True, copy files instead of moving them.
+            preserve_metadata: If True, copies keep the source's timestamps,
+                               permission bits and extended attributes (like
+                               shutil.copy2). False copies data only, which
+                               saves a stat and the xattr calls per copy.
         """
         self.base_folder = Path(base_folder).expanduser()
         self.categories = categories
         self.keep_originals = keep_originals
+        self.preserve_metadata = preserve_metadata
         self.archive_folder = self.base_folder / "_originals"
+        # Set once the folder structure has been created, so organize_file
+        # does not re-issue a mkdir per folder for every file
+        self._structure_ready = False
+        # Next counter to try per conflicting target path (see reserve_unique_path)
+        self._next_counter: "OrderedDict[Path, int]" = OrderedDict()
         
         logger.info(
             f"FileOrganizer initialized: base={self.base_folder}, "
@@ -49,7 +71,14 @@ class FileOrganizer:
         )
 
     def ensure_folder_structure(self):
-        """Create base folder and category subfolders if they don't exist."""
+        """Create base folder and category subfolders if they don't exist.
+
+        Runs once per organizer; call invalidate_structure() first to force
+        the folders to be checked again.
+        """
+        if self._structure_ready:
+            return
+
         try:
             # Create base folder
             self.base_folder.mkdir(parents=True, exist_ok=True)
@@ -65,11 +94,17 @@ class FileOrganizer:
             if self.keep_originals:
                 self.archive_folder.mkdir(exist_ok=True)
                 logger.debug(f"Ensured archive folder exists: {self.archive_folder}")
+
+            self._structure_ready = True
                 
         except Exception as e:
             logger.error(f"Failed to create folder structure: {e}")
             raise
 
+    def invalidate_structure(self):
+        """Forget that the folder structure exists (e.g. after folders were removed)."""
+        self._structure_ready = False
+
     def generate_safe_filename(
         self,
         suggested_name: str,
@@ -87,8 +122,8 @@ class FileOrganizer:
             Safe filename with timestamp and extension.
         """
         # Sanitize suggested name: remove special chars, limit length
-        safe_name = re.sub(r'[^\w\s-]', '', suggested_name)
-        safe_name = re.sub(r'[-\s]+', '_', safe_name)
+        safe_name = _UNSAFE_CHARS_RE.sub('', suggested_name)
+        safe_name = _SEPARATORS_RE.sub('_', safe_name)
         safe_name = safe_name.strip('_').lower()
         
         # Limit length to reasonable size
@@ -100,7 +135,7 @@ class FileOrganizer:
             safe_name = "screenshot"
         
         # Add timestamp for uniqueness
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         # Ensure extension has leading dot
         if not original_extension.startswith('.'):
@@ -108,7 +143,7 @@ class FileOrganizer:
         
         filename = f"{safe_name}_{timestamp}{original_extension}"
         
-        logger.debug(f"Generated safe filename: {filename} from '{suggested_name}'")
+        logger.debug("Generated safe filename: %s from '%s'", filename, suggested_name)
         return filename
 
     def get_unique_path(self, target_path: Path) -> Path:
@@ -132,10 +167,49 @@ class FileOrganizer:
         while True:
             new_path = parent / f"{stem}_{counter}{suffix}"
             if not new_path.exists():
-                logger.debug(f"Resolved conflict: {target_path} -> {new_path}")
+                logger.debug("Resolved conflict: %s -> %s", target_path, new_path)
                 return new_path
             counter += 1
 
+    def reserve_unique_path(self, target_path: Path) -> Path:
+        """Claim a unique path by creating it as an empty placeholder file.
+
+        Like get_unique_path, but each candidate is created with O_EXCL, so
+        two workers can never be handed the same name. The counter where the
+        last conflict was resolved is remembered per target, so repeated
+        conflicts (e.g. many "Screenshot.png" originals) cost one attempt
+        instead of re-probing every earlier name. Only the most recently
+        conflicting _NEXT_COUNTER_SIZE targets are remembered.
+
+        Args:
+            target_path: Desired file path.
+
+        Returns:
+            The reserved path (may have counter appended if original exists).
+
+        Raises:
+            OSError: If the parent folder is missing or not writable.
+        """
+        counter = self._next_counter.get(target_path, 0)
+        stem, suffix = target_path.stem, target_path.suffix
+        while True:
+            candidate = (
+                target_path if counter == 0
+                else target_path.with_name(f"{stem}_{counter}{suffix}")
+            )
+            try:
+                os.close(os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            except FileExistsError:
+                counter += 1
+                continue
+            if counter:
+                self._next_counter[target_path] = counter + 1
+                self._next_counter.move_to_end(target_path)
+                if len(self._next_counter) > _NEXT_COUNTER_SIZE:
+                    self._next_counter.popitem(last=False)
+                logger.debug("Resolved conflict: %s -> %s", target_path, candidate)
+            return candidate
+
     def organize_file(
         self,
         source_path: str | Path,
@@ -173,7 +247,7 @@ class FileOrganizer:
             category = "other" if "other" in self.categories else self.categories[0]
         
         try:
-            # Ensure folder structure exists
+            # Ensure folder structure exists (once per organizer)
             self.ensure_folder_structure()
             
             # Generate safe filename
@@ -191,29 +265,10 @@ class FileOrganizer:
                     source_path.suffix
                 )
             
-            # Determine destination path
-            destination_folder = self.base_folder / category
-            destination_path = destination_folder / filename
-            
-            # Handle filename conflicts
-            destination_path = self.get_unique_path(destination_path)
+            # Determine destination path (conflicts are resolved by _transfer)
+            destination_path = self.base_folder / category / filename
             
-            # Archive original if keeping originals
-            archived = False
-            if self.keep_originals:
-                archive_path = self.archive_folder / source_path.name
-                archive_path = self.get_unique_path(archive_path)
-                shutil.copy2(source_path, archive_path)
-                archived = True
-                logger.debug(f"Archived original to: {archive_path}")
-            
-            # Move or copy file
-            if self.keep_originals:
-                shutil.copy2(source_path, destination_path)
-                operation = "copied"
-            else:
-                shutil.move(str(source_path), str(destination_path))
-                operation = "moved"
+            destination_path, archived, operation = self._transfer(source_path, destination_path)
             
             logger.info(
                 f"Successfully {operation} {source_path.name} to "
@@ -237,6 +292,71 @@ class FileOrganizer:
                 error=error
             )
 
+    def _transfer(self, source_path: Path, destination_path: Path) -> tuple[Path, bool, str]:
+        """Archive (if keeping originals) and copy or move a file into place.
+
+        Target names are reserved before any data is written, and the
+        placeholders are removed again if the transfer fails.
+
+        Args:
+            source_path: File to organize.
+            destination_path: Desired destination path.
+
+        Returns:
+            Tuple of (destination_path, archived, operation) where
+            destination_path is the unique path used and operation is
+            "copied" or "moved".
+        """
+        reserved = []
+        try:
+            destination_path = self._reserve_in_structure(destination_path)
+            reserved.append(destination_path)
+
+            # Archive original and copy it into place if keeping originals
+            if self.keep_originals:
+                archive_path = self._reserve_in_structure(self.archive_folder / source_path.name)
+                reserved.append(archive_path)
+                _copy_pair(source_path, archive_path, destination_path, self.preserve_metadata)
+                logger.debug("Archived original to: %s", archive_path)
+                return destination_path, True, "copied"
+
+            try:
+                # Replaces the empty placeholder reserved above
+                os.replace(source_path, destination_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Different filesystem: copy, then remove the source
+                shutil.move(str(source_path), str(destination_path))
+            return destination_path, False, "moved"
+        except BaseException:
+            for path in reserved:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            raise
+
+    def _reserve_in_structure(self, target_path: Path) -> Path:
+        """Reserve a unique path, recreating the folder structure if its folder is gone.
+
+        Only the reservation is retried: it writes no data, so running it
+        again after the folders are recreated is safe.
+
+        Args:
+            target_path: Desired file path inside a category or archive folder.
+
+        Returns:
+            The reserved path.
+        """
+        try:
+            return self.reserve_unique_path(target_path)
+        except FileNotFoundError:
+            # A folder was removed since the structure was created
+            self.invalidate_structure()
+            self.ensure_folder_structure()
+            return self.reserve_unique_path(target_path)
+
     def get_category_path(self, category: str) -> Path:
         """Get the path for a specific category folder.
 
@@ -258,11 +378,12 @@ class FileOrganizer:
         
         try:
             for category in self.categories:
-                category_path = self.base_folder / category
-                if category_path.exists():
-                    files = list(category_path.glob('*'))
-                    stats[category] = len([f for f in files if f.is_file()])
-                else:
+                try:
+                    # DirEntry answers is_file from the directory read, without
+                    # a stat per file (dotfiles count, as with glob('*') on 3.11)
+                    with os.scandir(self.base_folder / category) as entries:
+                        stats[category] = sum(1 for entry in entries if entry.is_file())
+                except FileNotFoundError:
                     stats[category] = 0
                     
             logger.debug(f"Organization statistics: {stats}")
@@ -271,3 +392,69 @@ class FileOrganizer:
         except Exception as e:
             logger.error(f"Failed to gather statistics: {e}")
             return {}
+
+
+# copy_file_range copies inside the kernel (and reflinks on Btrfs/XFS); Linux only
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range") and sys.platform.startswith("linux")
+
+
+def _copy_pair(
+    source: Path,
+    archive_path: Path,
+    destination_path: Path,
+    preserve_metadata: bool = True
+):
+    """Copy source to both an archive and a destination.
+
+    On Linux the source is opened and sized once and both copies go through
+    os.copy_file_range, so the data never passes through a userspace buffer.
+    Elsewhere, or if the kernel refuses the range copy, shutil.copy2 (or
+    shutil.copyfile without metadata) is used.
+
+    Args:
+        preserve_metadata: Also copy timestamps, mode and xattrs (shutil.copystat).
+    """
+    fallback_copy = shutil.copy2 if preserve_metadata else shutil.copyfile
+    if not _HAS_COPY_FILE_RANGE:
+        fallback_copy(source, archive_path)
+        fallback_copy(source, destination_path)
+        return
+
+    with open(source, "rb") as src:
+        size = os.fstat(src.fileno()).st_size
+        for target in (archive_path, destination_path):
+            if not _copy_range(src.fileno(), target, size):
+                fallback_copy(source, target)
+            elif preserve_metadata:
+                shutil.copystat(source, target)
+
+
+def _copy_range(src_fd: int, target: Path, size: int) -> bool:
+    """Copy size bytes from src_fd into a new file at target with copy_file_range.
+
+    Returns:
+        True once all size bytes are copied, False if the caller should fall
+        back to a regular copy (target is then left empty)
+    """
+    with open(target, "wb") as dst:
+        offset = 0
+        try:
+            while offset < size:
+                copied = os.copy_file_range(src_fd, dst.fileno(), size - offset, offset_src=offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError as e:
+            # EXDEV on older kernels, EINVAL/ENOSYS on unsupported filesystems
+            if offset:
+                raise
+            logger.debug("copy_file_range not available for %s: %s", target, e)
+            return False
+        if offset != size:
+            # The source shrank, or the filesystem stopped short (some report
+            # 0 instead of an error); drop the partial data and copy normally.
+            # Truncating rather than unlinking keeps the reserved name
+            logger.debug("copy_file_range stopped at %d of %d bytes for %s", offset, size, target)
+            dst.truncate(0)
+            return False
+    return True
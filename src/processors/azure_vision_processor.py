@@ -6,7 +6,7 @@ import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from PIL import Image
 from openai import AzureOpenAI
@@ -16,7 +16,7 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class VisionResult:
     """Result from Azure GPT-4o Vision processing."""
     category: str
@@ -46,6 +46,12 @@ Categories must be one of: code, errors, documentation, design, communication, m
 
         logger.info("AzureVisionProcessor initialized (client will connect on first use)")
 
+    @property
+    def cache_variant(self) -> str:
+        """The deployment and prompt that shape results, for keying stored results."""
+        deployment = self.deployment or os.getenv("AZURE_AI_MODEL_DEPLOYMENT", "gpt-4o")
+        return f"{deployment}|{self.prompt_template}"
+
     def ensure_client_ready(self):
         """Lazy initialize Azure OpenAI client on first use."""
         if self.client is None:
@@ -70,11 +76,13 @@ Categories must be one of: code, errors, documentation, design, communication, m
             self.deployment = deployment
             logger.info(f"Azure OpenAI client initialized successfully (deployment: {deployment})")
 
-    def process(self, image_path: str | Path) -> VisionResult:
+    def process(self, image_path: str | Path, image_bytes: Optional[bytes] = None) -> VisionResult:
         """Process image using Azure GPT-4o Vision.
 
         Args:
             image_path: Path to the image file to analyze.
+            image_bytes: Already-read file contents (optional). When given, the
+                file is not read again.
 
         Returns:
             VisionResult with category, description, and filename suggestion.
@@ -84,25 +92,16 @@ Categories must be one of: code, errors, documentation, design, communication, m
             Exception: If vision processing fails.
         """
         image_path = Path(image_path)
-        if not image_path.exists():
+        if image_bytes is None and not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        logger.debug(f"Processing image with Azure GPT-4o Vision: {image_path}")
+        logger.debug("Processing image with Azure GPT-4o Vision: %s", image_path)
         start_time = time.perf_counter()
 
         try:
             # Ensure client is ready
             self.ensure_client_ready()
 
-            # Encode image to base64
-            with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
-
-            # Determine image format
-            image_format = image_path.suffix.lower().lstrip('.')
-            if image_format == 'jpg':
-                image_format = 'jpeg'
-
             # Call Azure OpenAI GPT-4o with vision
             response = self.client.chat.completions.create(
                 model=self.deployment,  # Use configured deployment name
@@ -114,12 +113,7 @@ Categories must be one of: code, errors, documentation, design, communication, m
                                 "type": "text",
                                 "text": self.prompt_template
                             },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/{image_format};base64,{image_data}"
-                                }
-                            }
+                            self._image_content(image_path, image_bytes)
                         ]
                     }
                 ],
@@ -129,7 +123,7 @@ Categories must be one of: code, errors, documentation, design, communication, m
 
             # Extract response
             response_text = response.choices[0].message.content
-            logger.debug(f"GPT-4o Vision response: {response_text[:200]}...")
+            logger.debug("GPT-4o Vision response: %.200s...", response_text)
 
             # Parse JSON response
             parsed = self._parse_response(response_text)
@@ -154,6 +148,166 @@ Categories must be one of: code, errors, documentation, design, communication, m
             logger.error(f"Azure vision processing failed after {processing_time_ms:.2f}ms: {e}")
             raise
 
+    def process_batch(
+        self,
+        images: List[Tuple[Path, Optional[bytes]]]
+    ) -> List[VisionResult]:
+        """Analyze several images with a single GPT-4o request.
+
+        All images go into one chat completion, each preceded by an id label
+        ("img1", "img2", ...). The model returns a JSON array whose entries
+        carry those ids, so results are matched by id rather than position.
+
+        Args:
+            images: (image path, optional already-read bytes) pairs.
+
+        Returns:
+            One VisionResult per input image, in input order.
+
+        Raises:
+            ValueError: If the reply cannot be matched to the inputs.
+            Exception: If the request fails (callers can fall back to process()).
+        """
+        if len(images) == 1:
+            return [self.process(*images[0])]
+
+        logger.debug(f"Processing {len(images)} images with one Azure GPT-4o Vision request")
+        start_time = time.perf_counter()
+
+        try:
+            self.ensure_client_ready()
+
+            image_ids = [f"img{index}" for index in range(1, len(images) + 1)]
+            content = [{
+                "type": "text",
+                "text": (
+                    f"{self.prompt_template}\n\n"
+                    f"You are given {len(images)} screenshots, each preceded by its id. Analyze "
+                    f"each one separately and return ONLY a JSON array with exactly {len(images)} "
+                    'objects in the same format plus an "id" field naming the screenshot, e.g. '
+                    '{"id": "img1", "category": "code", "description": "...", "filename": "..."}'
+                )
+            }]
+            for image_id, (path, data) in zip(image_ids, images):
+                content.append({"type": "text", "text": f"Screenshot id: {image_id}"})
+                content.append(self._image_content(Path(path), data))
+
+            response = self.client.chat.completions.create(
+                model=self.deployment,
+                messages=[{"role": "user", "content": content}],
+                max_tokens=300 * len(images),
+                temperature=0.3
+            )
+            response_text = response.choices[0].message.content
+            parsed = self._parse_batch_response(response_text, image_ids)
+
+        except Exception as e:
+            processing_time_ms = (time.perf_counter() - start_time) * 1000
+            logger.error(f"Azure batched vision processing failed after {processing_time_ms:.2f}ms: {e}")
+            raise
+
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Azure batched vision processing of {len(images)} images in {processing_time_ms:.2f}ms")
+
+        return [
+            VisionResult(
+                category=item["category"],
+                description=item["description"],
+                suggested_filename=item["filename"],
+                processing_time_ms=processing_time_ms,
+                raw_response=response_text,
+                confidence=0.8
+            )
+            for item in (parsed[image_id] for image_id in image_ids)
+        ]
+
+    @staticmethod
+    def _image_content(image_path: Path, image_bytes: Optional[bytes]) -> Dict[str, Any]:
+        """Build the image_url message part for an image (base64 data URL)."""
+        if image_bytes is None:
+            image_bytes = image_path.read_bytes()
+        image_data = base64.b64encode(image_bytes).decode('ascii')
+
+        # Determine image format
+        image_format = image_path.suffix.lower().lstrip('.')
+        if image_format == 'jpg':
+            image_format = 'jpeg'
+
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:image/{image_format};base64,{image_data}"
+            }
+        }
+
+    def _parse_batch_response(self, response: str, image_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Parse the JSON array reply of a batched request.
+
+        Args:
+            response: Raw model response string.
+            image_ids: Ids the images were labelled with in the request.
+
+        Returns:
+            One validated result dictionary per image, keyed by image id.
+
+        Raises:
+            ValueError: If the reply is not a JSON array with exactly one
+                result for each image id.
+        """
+        data = json.loads(self._strip_code_fence(response))
+        if not isinstance(data, list):
+            raise ValueError("Expected a JSON array of results")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for item in data:
+            image_id = item.get("id") if isinstance(item, dict) else None
+            if image_id not in image_ids:
+                raise ValueError(f"Result for unknown image id: {image_id!r}")
+            if image_id in results:
+                raise ValueError(f"Duplicate result for image id: {image_id}")
+            results[image_id] = self._validate_result(item)
+
+        missing = [image_id for image_id in image_ids if image_id not in results]
+        if missing:
+            raise ValueError(f"Missing results for image ids: {', '.join(missing)}")
+        return results
+
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Remove markdown code fences GPT-4o sometimes wraps JSON in."""
+        response = response.strip()
+        if response.startswith("```json"):
+            response = response[7:]
+        if response.startswith("```"):
+            response = response[3:]
+        if response.endswith("```"):
+            response = response[:-3]
+        return response.strip()
+
+    @staticmethod
+    def _validate_result(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Check required fields and normalize the category of one result.
+
+        Raises:
+            ValueError: If a required field is missing.
+        """
+        # Validate required fields
+        required_fields = ["category", "description", "filename"]
+        for field_name in required_fields:
+            if field_name not in data:
+                raise ValueError(f"Missing required field: {field_name}")
+
+        # Validate category
+        valid_categories = ["code", "errors", "documentation", "design",
+                          "communication", "memes", "other"]
+        if data["category"] not in valid_categories:
+            logger.warning(
+                f"Invalid category '{data['category']}', defaulting to 'other'"
+            )
+            data["category"] = "other"
+
+        return data
+
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON response from GPT-4o Vision.
 
@@ -168,33 +322,9 @@ Categories must be one of: code, errors, documentation, design, communication, m
         """
         try:
             # Try to extract JSON from response (GPT-4o sometimes adds markdown)
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            response = response.strip()
-
+            response = self._strip_code_fence(response)
             data = json.loads(response)
-
-            # Validate required fields
-            required_fields = ["category", "description", "filename"]
-            for field in required_fields:
-                if field not in data:
-                    raise ValueError(f"Missing required field: {field}")
-
-            # Validate category
-            valid_categories = ["code", "errors", "documentation", "design",
-                              "communication", "memes", "other"]
-            if data["category"] not in valid_categories:
-                logger.warning(
-                    f"Invalid category '{data['category']}', defaulting to 'other'"
-                )
-                data["category"] = "other"
-
-            return data
+            return self._validate_result(data)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
@@ -1,19 +1,119 @@
 """OCR Processor using Tesseract for text extraction from images."""
 
+import io
+import os
+import shlex
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Tesseract's OpenMP threading scales poorly; one thread per tesseract process
+# with several processes in parallel (see analyze_screenshots_batch) is faster.
+# Set before any tesseract subprocess is spawned; an explicit value wins. The
+# MCP client also sets it in the server's environment at launch.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 import pytesseract
-from PIL import Image
+from PIL import Image, ImageStat
+
+try:
+    import tesserocr
+except ImportError:  # Optional speedup - fall back to the tesseract CLI via pytesseract
+    tesserocr = None
+
+try:
+    import easyocr
+except ImportError:  # Optional speedup - batches are OCR'd by Tesseract
+    easyocr = None
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# tesserocr APIs per thread and Tesseract config: model loading is the
+# expensive part of a tesseract run, and an API must not be shared between threads
+_tess_local = threading.local()
+
+# One long-lived pool for parallel Tesseract work: its threads keep their
+# tesserocr APIs across calls, and concurrent callers share one core-sized bound
+_ocr_pool: Optional[ThreadPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
+
+
+def get_ocr_pool() -> ThreadPoolExecutor:
+    """Get the shared OCR thread pool (one thread per CPU core), creating it once.
+
+    Work running on a pool thread (e.g. a batch worker) OCRs tiles on its
+    own thread instead of submitting them to the pool it is occupying.
+    """
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _ocr_pool_lock:
+            if _ocr_pool is None:
+                _ocr_pool = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="ocr",
+                    initializer=_mark_pool_thread
+                )
+    return _ocr_pool
+
+
+def _mark_pool_thread():
+    """Flag the current thread as an OCR pool thread (see get_ocr_pool)."""
+    _tess_local.in_pool = True
+
+
+def _image_to_string(img: Image.Image, config: str = "") -> str:
+    """Run Tesseract on an opened image.
 
-@dataclass
+    With tesserocr installed, the image is recognized in-process by a
+    long-lived per-thread API (language data loaded once, GIL released while
+    recognizing). Otherwise each call spawns the tesseract CLI via pytesseract.
+
+    Args:
+        img: Opened image.
+        config: Tesseract command-line options (--psm, --oem, -c key=value).
+
+    Returns:
+        Recognized text.
+    """
+    if tesserocr is None:
+        return pytesseract.image_to_string(img, lang="eng", config=config)
+
+    api = _tesserocr_api(config)
+    api.SetImage(img)
+    return api.GetUTF8Text()
+
+
+def _tesserocr_api(config: str) -> "tesserocr.PyTessBaseAPI":
+    """Get this thread's tesserocr API for a Tesseract config string, creating it once."""
+    apis = getattr(_tess_local, "apis", None)
+    if apis is None:
+        apis = _tess_local.apis = {}
+
+    api = apis.get(config)
+    if api is None:
+        options, variables = {}, {}
+        args = iter(shlex.split(config))
+        for arg in args:
+            if arg in ("--psm", "--oem"):
+                options[arg[2:]] = int(next(args))
+            elif arg == "-c":
+                key, _, value = next(args).partition("=")
+                variables[key] = value
+            else:
+                logger.debug(f"Ignoring unsupported tesserocr option: {arg}")
+        api = apis[config] = tesserocr.PyTessBaseAPI(lang="eng", **options)
+        for key, value in variables.items():
+            api.SetVariable(key, value)
+    return api
+
+
+@dataclass(slots=True)
 class OCRResult:
     """Result from OCR processing."""
     text: str
@@ -27,21 +127,189 @@ class OCRResult:
 class OCRProcessor:
     """Handles OCR processing using Tesseract."""
 
-    def __init__(self, min_words_threshold: int = 10):
+    # Canvas every image in a GPU batch is fitted into, keeping its aspect
+    # ratio, and padded to (EasyOCR needs one shape per batch)
+    GPU_BATCH_WIDTH = 1280
+    GPU_BATCH_HEIGHT = 720
+
+    # Tesseract options for quick_probe: LSTM engine, one uniform text block,
+    # no second pass on inverted lines
+    PROBE_CONFIG = "--oem 1 --psm 6 -c tessedit_do_invert=0"
+
+    def __init__(
+        self,
+        min_words_threshold: int = 10,
+        tile_max_height: int = 0,
+        gpu_min_batch: int = 0,
+        probe_width: int = 0,
+        tesseract_config: str = ""
+    ):
         """Initialize OCR processor.
 
         Args:
             min_words_threshold: Minimum word count to consider text sufficient
                 for classification without needing vision model.
+            tile_max_height: Images taller than this (in pixels) are split into
+                full-width bands that are OCR'd in parallel. 0 disables tiling.
+            gpu_min_batch: Batches of at least this many images are OCR'd on the
+                GPU with EasyOCR when it and CUDA are available. 0 disables it.
+            probe_width: Width (in pixels) of the downscaled copy that
+                quick_probe() OCRs. 0 disables probing.
+            tesseract_config: Tesseract options for full OCR, e.g.
+                "--oem 1 --psm 6" (LSTM engine, one uniform text block).
+                Empty uses Tesseract's defaults.
         """
         self.min_words_threshold = min_words_threshold
-        logger.info(f"OCRProcessor initialized with min_words_threshold={min_words_threshold}")
+        self.tile_max_height = tile_max_height
+        self.gpu_min_batch = gpu_min_batch
+        self.probe_width = probe_width
+        self.tesseract_config = tesseract_config
+        self._gpu_reader = None
+        self._gpu_lock = threading.Lock()
+        logger.info(
+            f"OCRProcessor initialized with min_words_threshold={min_words_threshold}, "
+            f"tile_max_height={tile_max_height}, gpu_min_batch={gpu_min_batch}, "
+            f"probe_width={probe_width}, tesseract_config={tesseract_config!r}"
+        )
+
+    @property
+    def cache_variant(self) -> str:
+        """The engine and options that shape process() output, for keying stored results."""
+        engine = "tesserocr" if tesserocr is not None else "pytesseract"
+        return f"{engine}|{self.tesseract_config}|tile_max_height={self.tile_max_height}"
+
+    def use_gpu_for(self, batch_size: int) -> bool:
+        """Whether a batch of this many images should go through process_batch().
+
+        Single images stay on Tesseract, where GPU model startup would dominate.
+        """
+        return bool(self.gpu_min_batch) and batch_size >= self.gpu_min_batch and self._get_gpu_reader() is not None
+
+    def _get_gpu_reader(self):
+        """Create and warm up the EasyOCR reader on first use (None without a GPU)."""
+        if easyocr is None or not self.gpu_min_batch:
+            return None
+        with self._gpu_lock:
+            if self._gpu_reader is None:
+                import numpy as np
+                import torch
+
+                if not torch.cuda.is_available():
+                    logger.info("EasyOCR installed but no CUDA device, using Tesseract for batches")
+                    self.gpu_min_batch = 0
+                    return None
+
+                logger.info("Loading EasyOCR GPU reader")
+                try:
+                    reader = easyocr.Reader(["en"], gpu=True, cudnn_benchmark=True)
+                    # First batch triggers cuDNN autotuning - pay for it here, not on real work
+                    reader.readtext_batched(
+                        [np.zeros((self.GPU_BATCH_HEIGHT, self.GPU_BATCH_WIDTH, 3), np.uint8)],
+                        n_width=self.GPU_BATCH_WIDTH,
+                        n_height=self.GPU_BATCH_HEIGHT,
+                        detail=0
+                    )
+                except Exception as e:
+                    logger.warning(f"EasyOCR GPU reader failed to load ({e}), using Tesseract for batches")
+                    self.gpu_min_batch = 0
+                    return None
+                self._gpu_reader = reader
+            return self._gpu_reader
+
+    def gpu_batch_mode(self, width: int, height: int) -> Optional[str]:
+        """How process_batch() would treat an image of this size.
+
+        Args:
+            width: Image width in pixels.
+            height: Image height in pixels.
+
+        Returns:
+            None if the image needs tiling and should go through process()
+            instead, "full" if it fits the GPU canvas as is, or "downscaled"
+            if it has to be shrunk (its text may then be less accurate).
+        """
+        if self.tile_max_height and height > self.tile_max_height:
+            return None
+        if width <= self.GPU_BATCH_WIDTH and height <= self.GPU_BATCH_HEIGHT:
+            return "full"
+        return "downscaled"
+
+    def process_batch(self, image_paths: List[str | Path]) -> List[OCRResult]:
+        """Extract text from several images in one GPU pass.
+
+        Each image is scaled down (never up) to fit GPU_BATCH_WIDTH x
+        GPU_BATCH_HEIGHT with its aspect ratio kept, padded to that size, and
+        recognized by EasyOCR as a single batch. Check use_gpu_for() first,
+        and gpu_batch_mode() for each image: tall images that need tiling
+        belong in process().
+
+        Args:
+            image_paths: Paths to the image files to process.
+
+        Returns:
+            One OCRResult per path, in input order.
+
+        Raises:
+            RuntimeError: If the GPU reader is not available.
+            Exception: If OCR processing fails.
+        """
+        reader = self._get_gpu_reader()
+        if reader is None:
+            raise RuntimeError("GPU OCR is not available")
 
-    def process(self, image_path: str | Path) -> OCRResult:
+        start_time = time.perf_counter()
+        batch = reader.readtext_batched(
+            [self._gpu_canvas(path) for path in image_paths],
+            n_width=self.GPU_BATCH_WIDTH,
+            n_height=self.GPU_BATCH_HEIGHT,
+            batch_size=len(image_paths),
+            detail=0
+        )
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"GPU OCR of {len(image_paths)} images in {processing_time_ms:.2f}ms")
+
+        results = []
+        for lines in batch:
+            text = "\n".join(lines).strip()
+            word_count = len(text.split())
+            results.append(OCRResult(
+                text=text,
+                word_count=word_count,
+                processing_time_ms=processing_time_ms / len(image_paths),
+                sufficient_text=word_count >= self.min_words_threshold,
+                language="en",
+                confidence=0.0,
+            ))
+        return results
+
+    def _gpu_canvas(self, image_path: str | Path):
+        """Fit an image into the GPU batch canvas without distorting it.
+
+        Returns:
+            RGB array of GPU_BATCH_HEIGHT x GPU_BATCH_WIDTH, image at the top left.
+        """
+        import numpy as np
+
+        with Image.open(image_path) as img:
+            img = img.convert("RGB")
+            scale = min(self.GPU_BATCH_WIDTH / img.width, self.GPU_BATCH_HEIGHT / img.height, 1.0)
+            if scale < 1.0:
+                size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+                img = img.resize(size, Image.Resampling.LANCZOS)
+            # Pad with the bottom-right pixel, so the padding reads as more background
+            canvas = Image.new(
+                "RGB", (self.GPU_BATCH_WIDTH, self.GPU_BATCH_HEIGHT), img.getpixel((img.width - 1, img.height - 1))
+            )
+            canvas.paste(img, (0, 0))
+        return np.asarray(canvas)
+
+    def process(self, image_path: str | Path, image_bytes: Optional[bytes] = None) -> OCRResult:
         """Extract text from image using OCR.
 
         Args:
             image_path: Path to the image file to process.
+            image_bytes: Already-read file contents (optional). When given, the
+                image is decoded from memory instead of re-reading the file.
 
         Returns:
             OCRResult with extracted text and metadata.
@@ -51,17 +319,21 @@ class OCRProcessor:
             Exception: If OCR processing fails.
         """
         image_path = Path(image_path)
-        if not image_path.exists():
+        if image_bytes is None and not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
-        logger.debug(f"Processing image with OCR: {image_path}")
+        logger.debug("Processing image with OCR: %s", image_path)
         start_time = time.perf_counter()
 
         try:
             # Open and process image
-            with Image.open(image_path) as img:
-                # Extract text using Tesseract
-                text = pytesseract.image_to_string(img, lang="eng")
+            source = io.BytesIO(image_bytes) if image_bytes is not None else image_path
+            with Image.open(source) as img:
+                # Extract text using Tesseract (tall images band by band)
+                if self.tile_max_height and img.height > self.tile_max_height:
+                    text = self._ocr_tiled(img)
+                else:
+                    text = _image_to_string(img, self.tesseract_config)
 
             # Calculate metrics
             processing_time_ms = (time.perf_counter() - start_time) * 1000
@@ -87,6 +359,91 @@ class OCRProcessor:
             logger.error(f"OCR processing failed after {processing_time_ms:.2f}ms: {e}")
             raise
 
+    def quick_probe(self, image_path: str | Path, image_bytes: Optional[bytes] = None) -> bool:
+        """Estimate cheaply whether full OCR is likely to find sufficient text.
+
+        Runs a fast Tesseract pass (PROBE_CONFIG) on a copy downscaled to
+        probe_width. Images where even this finds fewer than
+        min_words_threshold words - icons, photos, sparse UI - are unlikely
+        to pass full OCR either, so callers can go straight to vision.
+
+        Args:
+            image_path: Path to the image file to probe.
+            image_bytes: Already-read file contents (optional).
+
+        Returns:
+            True if full OCR is worth running (always True when probing is
+            disabled or the image is already narrower than probe_width).
+        """
+        if not self.probe_width:
+            return True
+
+        start_time = time.perf_counter()
+        source = io.BytesIO(image_bytes) if image_bytes is not None else Path(image_path)
+        with Image.open(source) as img:
+            if img.width <= self.probe_width:
+                return True
+            height = max(1, round(img.height * self.probe_width / img.width))
+            small = img.convert("L").resize((self.probe_width, height), Image.Resampling.BILINEAR)
+
+        word_count = len(_image_to_string(small, self.PROBE_CONFIG).split())
+        logger.debug(
+            f"OCR probe: {word_count} words at {self.probe_width}px in "
+            f"{(time.perf_counter() - start_time) * 1000:.2f}ms"
+        )
+        return word_count >= self.min_words_threshold
+
+    def _ocr_tiled(self, img: Image.Image) -> str:
+        """OCR a tall image as horizontal bands in parallel.
+
+        Bands span the full width, so text lines are never split sideways, and
+        each cut is placed on the most uniform row near the band boundary (a
+        gap between lines), so no overlap or de-duplication is needed.
+
+        Args:
+            img: Opened image.
+
+        Returns:
+            Text of all bands, top to bottom.
+        """
+        bounds = self._band_bounds(img)
+        bands = [img.crop((0, top, img.width, bottom)) for top, bottom in zip(bounds, bounds[1:])]
+        logger.debug("Tiled OCR: %dx%d split into %d bands", img.width, img.height, len(bands))
+
+        # Each band is its own tesseract subprocess (or GIL-free tesserocr
+        # call), so pool threads run them in parallel. On a pool thread the
+        # other threads are busy with other images, so bands run here instead
+        ocr_band = partial(_image_to_string, config=self.tesseract_config)
+        if getattr(_tess_local, "in_pool", False):
+            texts = [ocr_band(band) for band in bands]
+        else:
+            texts = list(get_ocr_pool().map(ocr_band, bands))
+
+        return "\n".join(text.strip() for text in texts if text.strip())
+
+    def _band_bounds(self, img: Image.Image) -> list[int]:
+        """Choose row offsets that split an image into bands of at most tile_max_height.
+
+        Args:
+            img: Opened image.
+
+        Returns:
+            Sorted row offsets, starting at 0 and ending at the image height.
+        """
+        gray = img.convert("L")
+        search = max(1, self.tile_max_height // 10)
+        bounds = [0]
+        while img.height - bounds[-1] > self.tile_max_height:
+            target = bounds[-1] + self.tile_max_height
+            # Pick the flattest row in the last 10% of the band - ideally blank space
+            cut = min(
+                range(target - search, target),
+                key=lambda row: ImageStat.Stat(gray.crop((0, row, img.width, row + 1))).stddev[0]
+            )
+            bounds.append(cut)
+        bounds.append(img.height)
+        return bounds
+
     def process_with_preprocessing(self, image_path: str | Path) -> OCRResult:
         """Process image with preprocessing for better OCR accuracy.
 
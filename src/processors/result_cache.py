@@ -0,0 +1,142 @@
+"""On-disk cache of OCR and vision results keyed by image content.
+
+The same screenshot is often analyzed again in a later run (re-organizing a
+folder, a copy under another name). Results are stored as small JSON files
+named by a hash of the image bytes and of the settings that produced them
+(OCR engine and options, vision deployment and prompt), so an identical
+image never pays for Tesseract or a GPT-4o call twice, whatever its path or
+timestamps, while a settings change never serves results made the old way.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.logger import get_logger
+
+try:
+    import blake3
+except ImportError:  # Optional speedup - fall back to hashlib.sha256
+    blake3 = None
+
+logger = get_logger(__name__)
+
+
+class ResultCache:
+    """Stores processor results as JSON files under <cache_dir>/<kind>/."""
+
+    # Bump when the stored result format changes; older entries are then ignored
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_dir: str | Path, max_age_days: float = 30):
+        """Initialize result cache.
+
+        Args:
+            cache_dir: Directory for cache files (created on first write).
+            max_age_days: Entries older than this are treated as misses and
+                removed by prune(). 0 keeps entries forever.
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_age_s = max_age_days * 86400
+        logger.info(
+            f"ResultCache initialized with directory: {self.cache_dir} "
+            f"(max_age_days={max_age_days})"
+        )
+
+    @staticmethod
+    def digest(image_bytes: bytes) -> str:
+        """Hash image contents into a cache key.
+
+        Args:
+            image_bytes: Raw image file contents.
+
+        Returns:
+            Hex digest (BLAKE3 when installed, SHA-256 otherwise).
+        """
+        if blake3 is not None:
+            return blake3.blake3(image_bytes).hexdigest()
+        return hashlib.sha256(image_bytes).hexdigest()
+
+    def get(self, kind: str, digest: str, variant: str = "") -> Optional[Dict[str, Any]]:
+        """Look up a cached result.
+
+        Args:
+            kind: Result type, e.g. "ocr" or "vision".
+            digest: Content digest from digest().
+            variant: Settings that produced the result (see put()).
+
+        Returns:
+            The stored result dict, or None on a miss, expired or unreadable entry.
+        """
+        entry_path = self._entry_path(kind, digest, variant)
+        try:
+            with open(entry_path, "rb") as f:
+                if self.max_age_s and time.time() - os.fstat(f.fileno()).st_mtime > self.max_age_s:
+                    expired = True
+                else:
+                    return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable {kind} cache entry {digest}: {e}")
+            return None
+        if expired:
+            entry_path.unlink(missing_ok=True)
+        return None
+
+    def put(self, kind: str, digest: str, result: Dict[str, Any], variant: str = ""):
+        """Store a result. Failures are logged and otherwise ignored.
+
+        Args:
+            kind: Result type, e.g. "ocr" or "vision".
+            digest: Content digest from digest().
+            result: JSON-serializable result dict.
+            variant: Settings that produced the result (engine, options,
+                model); results for other settings are stored separately.
+        """
+        entry_path = self._entry_path(kind, digest, variant)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename, so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(result, f)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write {kind} cache entry {digest}: {e}")
+
+    def prune(self) -> int:
+        """Delete entries older than max_age_days (and stray temp files).
+
+        Returns:
+            Number of files removed.
+        """
+        if not self.max_age_s:
+            return 0
+        cutoff = time.time() - self.max_age_s
+        removed = 0
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.unlink(path)
+                        removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logger.info(f"Pruned {removed} expired result cache entries")
+        return removed
+
+    def _entry_path(self, kind: str, digest: str, variant: str = "") -> Path:
+        """Path of a cache entry (two-character fan-out keeps directories small)."""
+        variant_key = hashlib.sha256(f"{self.SCHEMA_VERSION}|{variant}".encode()).hexdigest()[:16]
+        return self.cache_dir / kind / digest[:2] / f"{digest}.{variant_key}.json"
@@ -15,6 +15,7 @@ Components:
 - client_wrapper: MCPClientWrapper for managing MCP server subprocess
 - server: MCP server providing file operation tools via stdio
 - tools: Individual MCP tool implementations
+- codec: JSON encoding/decoding of tool payloads on the stdio transport
 
 Note: Import components directly from submodules to avoid circular imports
 with the installed 'mcp' SDK package.
@@ -24,7 +24,6 @@ This demonstrates Model Context Protocol (MCP) integration with Agent Framework.
 """
 
 import asyncio
-import json
 import os
 import sys
 from pathlib import Path
@@ -33,10 +32,68 @@ from typing import Any, Dict, List, Optional
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from screenshot_mcp import codec
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Environment passed to the MCP server subprocess: the variables it actually
+# reads (credentials, mode, OCR/locale/proxy settings), not the whole shell state
+_ENV_ALLOWLIST = frozenset({
+    "PATH", "HOME", "USER", "LANG", "TMPDIR", "TEMP", "TMP", "VIRTUAL_ENV",
+    "SYSTEMROOT", "APPDATA", "LOCALAPPDATA", "USERPROFILE",
+    "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE",
+    "TESSERACT_PATH", "TESSDATA_PREFIX", "OMP_THREAD_LIMIT", "LOG_LEVEL",
+    # GPU OCR (EasyOCR/CUDA) needs the device selection and the CUDA libraries
+    "CUDA_VISIBLE_DEVICES", "LD_LIBRARY_PATH",
+})
+_ENV_PREFIXES = ("AZURE_", "PYTHON", "SCREENSHOT_ORGANIZER_", "TESSDATA", "LC_")
+# Top-level sections of config/default_config.yaml that utils.config lets an
+# environment variable of the upper-cased name override
+_CONFIG_OVERRIDE_VARS = frozenset({"PROCESSING", "ORGANIZATION", "MODELS", "API", "LOGGING"})
+
+# Tools whose result is fixed for the lifetime of the server process (no
+# arguments, no file system access) - answered locally after the first call
+_STATIC_TOOLS = frozenset({"get_categories"})
+
+# Fixed error results returned by call_tool_async - shared, treat as read-only.
+# Plain dicts (not MappingProxyType) because tool results are JSON-serialized
+# by Agent Framework.
+_ERR_EMPTY = {"error": "Tool returned empty response", "success": False}
+_ERR_FORMAT = {"error": "Unexpected result format", "success": False}
+
+
+def _tool_arguments(**arguments: Any) -> Dict[str, Any]:
+    """Build an MCP tool argument dict, leaving out unset (None) values.
+
+    The MCP SDK rejects None for optional typed parameters; omitting them lets
+    the server apply its defaults and keeps the request payload minimal.
+
+    Returns:
+        Dictionary of the non-None keyword arguments
+    """
+    return {key: value for key, value in arguments.items() if value is not None}
+
+
+def _server_environment() -> Dict[str, str]:
+    """Build the environment for the MCP server subprocess.
+
+    Returns:
+        Subset of os.environ the server needs, including top-level config
+        overrides (_CONFIG_OVERRIDE_VARS), with OMP_THREAD_LIMIT defaulted to 1.
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key in _ENV_ALLOWLIST or key in _CONFIG_OVERRIDE_VARS or key.startswith(_ENV_PREFIXES)
+    }
+    # OCR parallelism comes from one single-threaded tesseract per worker
+    # thread; OpenMP threads inside each would only oversubscribe the cores.
+    # Set here so it holds from server start-up, whatever is imported first.
+    env.setdefault("OMP_THREAD_LIMIT", "1")
+    return env
+
 
 class MCPClientWrapper:
     """Embedded MCP client for Agent Framework WITH MCP Client Integration.
@@ -61,6 +118,8 @@ class MCPClientWrapper:
         self.write_stream = None
         self._server_task = None
         self._event_loop = None
+        self._agent_tools = None  # Built once by get_agent_framework_tools()
+        self._static_results: Dict[str, Dict[str, Any]] = {}  # Cached _STATIC_TOOLS results
         logger.info("MCPClientWrapper initialized")
 
     async def start(self):
@@ -71,12 +130,12 @@ class MCPClientWrapper:
         project_root = Path(__file__).parent.parent.parent
 
         # Configure MCP server parameters
-        # Pass current environment to subprocess so it has access to Azure credentials
+        # Pass the relevant environment to subprocess so it has access to Azure credentials
         server_params = StdioServerParameters(
             command=sys.executable,  # Use same Python interpreter
             args=["-m", "src.screenshot_mcp.server"],
             cwd=str(project_root),
-            env=dict(os.environ)  # Pass parent's environment variables
+            env=_server_environment()
         )
 
         # Start MCP server and create session
@@ -89,8 +148,20 @@ class MCPClientWrapper:
             self.session = ClientSession(self.read_stream, self.write_stream)
             await self.session.__aenter__()
 
-            # Initialize session
-            await self.session.initialize()
+            # Initialize session - the server answers only after its module
+            # imports finish, so build the Agent Framework tool wrappers
+            # (pydantic schemas, closures) while that round-trip is pending
+            init_task = asyncio.create_task(self.session.initialize())
+            await asyncio.sleep(0)  # Let the initialize request go out first
+            try:
+                get_agent_framework_tools(self)
+            except BaseException:
+                init_task.cancel()
+                raise
+            await init_task
+
+            # Remember the loop that owns the session's streams; sync wrappers submit to it
+            self._event_loop = asyncio.get_running_loop()
 
             logger.info("MCP client session started and initialized")
 
@@ -109,6 +180,9 @@ class MCPClientWrapper:
             if self._stdio_client:
                 await self._stdio_client.__aexit__(None, None, None)
 
+            self._event_loop = None
+            self._static_results.clear()
+
             logger.info("MCP client session stopped")
 
         except Exception as e:
@@ -122,7 +196,8 @@ class MCPClientWrapper:
             arguments: Tool arguments dictionary
 
         Returns:
-            Tool result as dictionary
+            Tool result as dictionary (results of _STATIC_TOOLS and fixed error
+            results are shared between calls - treat them as read-only)
 
         Raises:
             RuntimeError: If session not started
@@ -131,32 +206,41 @@ class MCPClientWrapper:
         if not self.session:
             raise RuntimeError("MCP session not started. Call start() first.")
 
-        logger.debug(f"Calling MCP tool: {name} with args: {arguments}")
+        cached = self._static_results.get(name)
+        if cached is not None:
+            return cached
+
+        # %-style args: formatting is skipped entirely unless DEBUG is enabled
+        logger.debug("Calling MCP tool: %s with args: %s", name, arguments)
 
         try:
             result = await self.session.call_tool(name, arguments)
 
-            # Parse result from TextContent
-            if hasattr(result, 'content') and result.content:
+            # Parse result from TextContent (happy path first - no per-call hasattr checks)
+            try:
                 content_text = result.content[0].text
-                logger.debug(f"Tool {name} raw content: {repr(content_text)}")
-
-                # Check if content is empty
-                if not content_text or not content_text.strip():
-                    logger.error(f"Tool {name} returned empty content")
-                    return {"error": "Tool returned empty response", "success": False}
-
-                try:
-                    data = json.loads(content_text)
-                    logger.debug(f"Tool {name} returned: {data}")
-                    return data
-                except json.JSONDecodeError as json_err:
-                    logger.error(f"JSON decode error for tool {name}: {json_err}")
-                    logger.error(f"Raw content was: {repr(content_text)}")
-                    return {"error": f"Invalid JSON response: {str(json_err)}", "success": False}
-            else:
+            except (AttributeError, IndexError, TypeError):
                 logger.error(f"Tool {name} returned unexpected format: {result}")
-                return {"error": "Unexpected result format", "success": False}
+                return _ERR_FORMAT
+
+            logger.debug("Tool %s raw content: %r", name, content_text)
+
+            # Check if content is empty
+            if not content_text or not content_text.strip():
+                logger.error(f"Tool {name} returned empty content")
+                return _ERR_EMPTY
+
+            try:
+                data = codec.decode(content_text)
+            except codec.DecodeError as json_err:
+                logger.error(f"JSON decode error for tool {name}: {json_err}")
+                logger.error(f"Raw content was: {repr(content_text)}")
+                return {"error": f"Invalid JSON response: {str(json_err)}", "success": False}
+
+            logger.debug("Tool %s returned: %s", name, data)
+            if name in _STATIC_TOOLS and "error" not in data:
+                self._static_results[name] = data
+            return data
 
         except Exception as e:
             logger.error(f"Error calling tool {name}: {e}", exc_info=True)
@@ -170,7 +254,8 @@ class MCPClientWrapper:
         self,
         directory: str,
         recursive: bool = False,
-        max_files: Optional[int] = None
+        max_files: Optional[int] = None,
+        offset: int = 0
     ) -> Dict[str, Any]:
         """List screenshot files in a directory.
 
@@ -178,6 +263,7 @@ class MCPClientWrapper:
             directory: Absolute path to directory to scan
             recursive: Whether to scan subdirectories
             max_files: Maximum number of files to return
+            offset: Number of files to skip (for paging)
 
         Returns:
             Dictionary with files list and metadata
@@ -185,11 +271,42 @@ class MCPClientWrapper:
         return self._run_async(
             self.call_tool_async(
                 "list_screenshots",
-                {
-                    "directory": directory,
-                    "recursive": recursive,
-                    "max_files": max_files
-                }
+                _tool_arguments(
+                    directory=directory,
+                    recursive=recursive,
+                    max_files=max_files,
+                    offset=offset
+                )
+            )
+        )
+
+    def export_screenshot_list(
+        self,
+        directory: str,
+        output_path: str,
+        recursive: bool = False,
+        overwrite: bool = False
+    ) -> Dict[str, Any]:
+        """Write the full screenshot listing of a directory to an NDJSON file.
+
+        Args:
+            directory: Absolute path to directory to scan
+            output_path: Absolute path of the NDJSON file to write (inside directory)
+            recursive: Whether to scan subdirectories
+            overwrite: Replace output_path if it already exists
+
+        Returns:
+            Dictionary with output path and total count
+        """
+        return self._run_async(
+            self.call_tool_async(
+                "export_screenshot_list",
+                _tool_arguments(
+                    directory=directory,
+                    output_path=output_path,
+                    recursive=recursive,
+                    overwrite=overwrite
+                )
             )
         )
 
@@ -219,6 +336,27 @@ class MCPClientWrapper:
             )
         )
 
+    def analyze_screenshots_batch(
+        self,
+        file_paths: List[str],
+        force_vision: bool = False
+    ) -> Dict[str, Any]:
+        """Analyze several screenshots in one call (OCR runs in parallel server-side).
+
+        Args:
+            file_paths: Absolute paths to screenshot files
+            force_vision: Skip OCR and use vision model directly
+
+        Returns:
+            Dictionary with results (one analysis dict per path, in input order)
+        """
+        return self._run_async(
+            self.call_tool_async(
+                "analyze_screenshots_batch",
+                {"file_paths": file_paths, "force_vision": force_vision}
+            )
+        )
+
     def get_categories(self) -> Dict[str, Any]:
         """Get list of available screenshot categories.
 
@@ -246,10 +384,10 @@ class MCPClientWrapper:
         return self._run_async(
             self.call_tool_async(
                 "categorize_screenshot",
-                {
-                    "text": text,
-                    "available_categories": available_categories
-                }
+                _tool_arguments(
+                    text=text,
+                    available_categories=available_categories
+                )
             )
         )
 
@@ -270,10 +408,7 @@ class MCPClientWrapper:
         return self._run_async(
             self.call_tool_async(
                 "create_category_folder",
-                {
-                    "category": category,
-                    "base_dir": base_dir
-                }
+                _tool_arguments(category=category, base_dir=base_dir)
             )
         )
 
@@ -298,12 +433,45 @@ class MCPClientWrapper:
         return self._run_async(
             self.call_tool_async(
                 "move_screenshot",
-                {
-                    "source_path": source_path,
-                    "dest_folder": dest_folder,
-                    "new_filename": new_filename,
-                    "keep_original": keep_original
-                }
+                _tool_arguments(
+                    source_path=source_path,
+                    dest_folder=dest_folder,
+                    new_filename=new_filename,
+                    keep_original=keep_original
+                )
+            )
+        )
+
+    def place_screenshot(
+        self,
+        source_path: str,
+        category: str,
+        base_dir: Optional[str] = None,
+        new_filename: Optional[str] = None,
+        keep_original: bool = True
+    ) -> Dict[str, Any]:
+        """Move (or copy) a screenshot into its category folder, creating it if needed.
+
+        Args:
+            source_path: Absolute path to source file
+            category: Category name
+            base_dir: Base directory for organization (optional)
+            new_filename: New filename (without extension)
+            keep_original: If True, copy instead of move
+
+        Returns:
+            Dictionary with original_path, new_path, operation, folder_created, success
+        """
+        return self._run_async(
+            self.call_tool_async(
+                "place_screenshot",
+                _tool_arguments(
+                    source_path=source_path,
+                    category=category,
+                    base_dir=base_dir,
+                    new_filename=new_filename,
+                    keep_original=keep_original
+                )
             )
         )
 
@@ -328,12 +496,12 @@ class MCPClientWrapper:
         return self._run_async(
             self.call_tool_async(
                 "generate_filename",
-                {
-                    "original_filename": original_filename,
-                    "category": category,
-                    "text": text,
-                    "description": description
-                }
+                _tool_arguments(
+                    original_filename=original_filename,
+                    category=category,
+                    text=text,
+                    description=description
+                )
             )
         )
 
@@ -345,34 +513,44 @@ class MCPClientWrapper:
         """Run an async coroutine and return result synchronously.
 
         This allows Agent Framework (which may be sync) to call async MCP tools.
+        The coroutine is submitted to the event loop that started the session
+        (the session's streams are bound to it), so no loop is created per call.
 
         Args:
             coro: Async coroutine to run
 
         Returns:
             Result from coroutine
+
+        Raises:
+            RuntimeError: If the session is not started, or if called from the
+                session's own event loop (which would deadlock)
         """
-        # Get or create event loop
+        loop = self._event_loop
+        if loop is None or loop.is_closed():
+            coro.close()
+            raise RuntimeError("MCP session not started. Call start() first.")
+
         try:
-            loop = asyncio.get_running_loop()
+            running_loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No loop running, create new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        # If we're already in an async context, use the existing loop
-        if loop.is_running():
-            # Create a task and return a future
-            # This is tricky - we can't block in an async context
-            # For now, raise an error - caller should use async methods
+            running_loop = None
+
+        if running_loop is loop:
+            # Blocking here would stall the loop that has to run the coroutine
+            coro.close()
             raise RuntimeError(
                 "Cannot use synchronous tool methods from async context. "
                 "Use call_tool_async() instead."
             )
-        else:
-            # We're in a sync context, run the coroutine
+
+        if not loop.is_running():
+            # Session loop is idle (sync caller drove start() itself) - reuse it
             return loop.run_until_complete(coro)
 
+        # Session loop runs in another thread - hand the coroutine over and wait
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
 
 # ============================================================================
 # GLOBAL MCP CLIENT INSTANCE
@@ -421,8 +599,12 @@ def get_agent_framework_tools(mcp_client: MCPClientWrapper) -> List[Dict[str, An
         mcp_client: MCPClientWrapper instance
 
     Returns:
-        List of tool dictionaries for Agent Framework
+        List of tool dictionaries for Agent Framework (built once per client;
+        stable function identities let Agent Framework reuse their schemas)
     """
+    if mcp_client._agent_tools is not None:
+        return mcp_client._agent_tools
+
     from typing import Annotated
     from pydantic import Field
 
@@ -432,14 +614,14 @@ def get_agent_framework_tools(mcp_client: MCPClientWrapper) -> List[Dict[str, An
     async def list_screenshots_tool(
         directory: Annotated[str, Field(description="Absolute path to directory to scan")],
         recursive: Annotated[bool, Field(description="Scan subdirectories")] = False,
-        max_files: Annotated[Optional[int], Field(description="Max files to return")] = None
+        max_files: Annotated[Optional[int], Field(description="Max files to return")] = None,
+        offset: Annotated[int, Field(description="Files to skip (use next_offset to page)")] = 0
     ) -> Dict[str, Any]:
         """List screenshot files in a directory."""
-        args = {"directory": directory, "recursive": recursive}
-        # Only include max_files if explicitly set (MCP SDK rejects None for optional int)
-        if max_files is not None:
-            args["max_files"] = max_files
-        return await mcp_client.call_tool_async("list_screenshots", args)
+        return await mcp_client.call_tool_async(
+            "list_screenshots",
+            _tool_arguments(directory=directory, recursive=recursive, max_files=max_files, offset=offset)
+        )
 
     tools.append({
         "function": list_screenshots_tool,
@@ -464,6 +646,23 @@ def get_agent_framework_tools(mcp_client: MCPClientWrapper) -> List[Dict[str, An
         "description": "Extract text/content from screenshot without categorizing"
     })
 
+    # Tool 2b: analyze_screenshots_batch
+    async def analyze_screenshots_batch_tool(
+        file_paths: Annotated[List[str], Field(description="Absolute paths to screenshot files")],
+        force_vision: Annotated[bool, Field(description="Use vision model directly")] = False
+    ) -> Dict[str, Any]:
+        """Analyze several screenshots concurrently using OCR or vision model."""
+        return await mcp_client.call_tool_async("analyze_screenshots_batch", {
+            "file_paths": file_paths,
+            "force_vision": force_vision
+        })
+
+    tools.append({
+        "function": analyze_screenshots_batch_tool,
+        "name": "analyze_screenshots_batch",
+        "description": "Extract text/content from several screenshots at once without categorizing"
+    })
+
     # Tool 3: get_categories
     async def get_categories_tool() -> Dict[str, Any]:
         """Get list of available screenshot categories."""
@@ -481,11 +680,9 @@ def get_agent_framework_tools(mcp_client: MCPClientWrapper) -> List[Dict[str, An
         base_dir: Annotated[Optional[str], Field(description="Base directory")] = None
     ) -> Dict[str, Any]:
         """Create a category folder for organizing screenshots."""
-        args = {"category": category}
-        # Only include base_dir if explicitly set
-        if base_dir is not None:
-            args["base_dir"] = base_dir
-        return await mcp_client.call_tool_async("create_category_folder", args)
+        return await mcp_client.call_tool_async(
+            "create_category_folder", _tool_arguments(category=category, base_dir=base_dir)
+        )
 
     tools.append({
         "function": create_category_folder_tool,
@@ -501,15 +698,12 @@ def get_agent_framework_tools(mcp_client: MCPClientWrapper) -> List[Dict[str, An
         keep_original: Annotated[bool, Field(description="Copy instead of move")] = True
     ) -> Dict[str, Any]:
         """Move or copy a screenshot file to a destination folder."""
-        args = {
-            "source_path": source_path,
-            "dest_folder": dest_folder,
-            "keep_original": keep_original
-        }
-        # Only include new_filename if explicitly set
-        if new_filename is not None:
-            args["new_filename"] = new_filename
-        return await mcp_client.call_tool_async("move_screenshot", args)
+        return await mcp_client.call_tool_async("move_screenshot", _tool_arguments(
+            source_path=source_path,
+            dest_folder=dest_folder,
+            new_filename=new_filename,
+            keep_original=keep_original
+        ))
 
     tools.append({
         "function": move_screenshot_tool,
@@ -517,5 +711,29 @@ def get_agent_framework_tools(mcp_client: MCPClientWrapper) -> List[Dict[str, An
         "description": "Move or copy a screenshot file to organize it"
     })
 
+    # Tool 6: place_screenshot
+    async def place_screenshot_tool(
+        source_path: Annotated[str, Field(description="Source file path")],
+        category: Annotated[str, Field(description="Category name")],
+        base_dir: Annotated[Optional[str], Field(description="Base directory")] = None,
+        new_filename: Annotated[Optional[str], Field(description="New filename without extension")] = None,
+        keep_original: Annotated[bool, Field(description="Copy instead of move")] = True
+    ) -> Dict[str, Any]:
+        """Move or copy a screenshot into its category folder, creating the folder if needed."""
+        return await mcp_client.call_tool_async("place_screenshot", _tool_arguments(
+            source_path=source_path,
+            category=category,
+            base_dir=base_dir,
+            new_filename=new_filename,
+            keep_original=keep_original
+        ))
+
+    tools.append({
+        "function": place_screenshot_tool,
+        "name": "place_screenshot",
+        "description": "Create a category folder if needed and move/copy a screenshot into it"
+    })
+
     logger.info(f"Created {len(tools)} Agent Framework tool wrappers")
+    mcp_client._agent_tools = tools
     return tools
@@ -0,0 +1,64 @@
+"""JSON codec for MCP tool payloads.
+
+Tool results cross the stdio transport as JSON text inside TextContent, and
+the decoded result is handed to the Agent, so the wire format stays JSON.
+Uses msgspec's JSON encoder/decoder (one reusable instance each) when it is
+installed, then orjson, and falls back to the stdlib json module otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import msgspec
+except ImportError:  # Optional speedup - try orjson next
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
+
+if msgspec is not None:
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+    DecodeError = msgspec.DecodeError
+elif orjson is not None:
+    DecodeError = orjson.JSONDecodeError
+else:
+    DecodeError = json.JSONDecodeError
+
+
+def encode(obj: Any) -> str:
+    """Encode a tool result as compact JSON text.
+
+    Args:
+        obj: JSON-serializable tool result.
+
+    Returns:
+        JSON string for a TextContent payload.
+    """
+    if msgspec is not None:
+        return _encoder.encode(obj).decode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def decode(text: str) -> Any:
+    """Decode a JSON tool payload.
+
+    Args:
+        text: JSON text from a TextContent payload.
+
+    Returns:
+        Decoded Python object.
+
+    Raises:
+        DecodeError: If the text is not valid JSON.
+    """
+    if msgspec is not None:
+        return _decoder.decode(text)
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -30,15 +30,16 @@ This demonstrates separation of concerns: Brain (Agent) vs Hands (MCP Server).
 """
 
 import asyncio
-import json
 from typing import Any, Dict, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from screenshot_mcp import codec
 from screenshot_mcp import tools as mcp_tools
 from utils.config import load_config
+from utils.event_loop import install_event_loop_policy
 from utils.logger import get_logger, setup_logging
 
 logger = get_logger(__name__)
@@ -51,7 +52,7 @@ class ScreenshotMCPServer:
     embedded MCP client in Agent Framework.
 
     Role in Architecture:
-    - Provides 7 low-level file operation tools
+    - Provides 10 low-level file operation tools
     - Returns facts and data (not intelligent decisions)
     - Mediates ALL file system access
     - Communicates via MCP protocol (stdio)
@@ -96,11 +97,45 @@ class ScreenshotMCPServer:
                                 "type": "integer",
                                 "description": "Maximum number of files to return",
                                 "minimum": 1
+                            },
+                            "offset": {
+                                "type": "integer",
+                                "description": "Number of files to skip (for paging through large directories)",
+                                "minimum": 0,
+                                "default": 0
                             }
                         },
                         "required": ["directory"]
                     }
                 ),
+                Tool(
+                    name="export_screenshot_list",
+                    description="Write the full screenshot listing of a directory to an NDJSON file, one file info object per line. Use for very large directories instead of paging list_screenshots.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "directory": {
+                                "type": "string",
+                                "description": "Absolute path to directory to scan for screenshots"
+                            },
+                            "output_path": {
+                                "type": "string",
+                                "description": "Absolute path of the NDJSON file to write, inside directory"
+                            },
+                            "recursive": {
+                                "type": "boolean",
+                                "description": "Scan subdirectories recursively",
+                                "default": False
+                            },
+                            "overwrite": {
+                                "type": "boolean",
+                                "description": "Replace output_path if it already exists",
+                                "default": False
+                            }
+                        },
+                        "required": ["directory", "output_path"]
+                    }
+                ),
                 Tool(
                     name="analyze_screenshot",
                     description="Analyze screenshot content using OCR or vision model. Returns RAW analysis data (text, description) without making categorization decisions.",
@@ -120,6 +155,26 @@ class ScreenshotMCPServer:
                         "required": ["file_path"]
                     }
                 ),
+                Tool(
+                    name="analyze_screenshots_batch",
+                    description="Analyze several screenshots at once (OCR runs in parallel). Returns RAW analysis data per file without making categorization decisions.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "file_paths": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Absolute paths to screenshot files to analyze"
+                            },
+                            "force_vision": {
+                                "type": "boolean",
+                                "description": "Skip OCR and use vision model directly",
+                                "default": False
+                            }
+                        },
+                        "required": ["file_paths"]
+                    }
+                ),
                 Tool(
                     name="get_categories",
                     description="Get list of available screenshot categories with descriptions and keywords.",
@@ -192,6 +247,37 @@ class ScreenshotMCPServer:
                         "required": ["source_path", "dest_folder"]
                     }
                 ),
+                Tool(
+                    name="place_screenshot",
+                    description="Move (or copy) a screenshot into its category folder, creating the folder if needed. Combines create_category_folder and move_screenshot - the Agent decides category and filename.",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "source_path": {
+                                "type": "string",
+                                "description": "Absolute path to source file"
+                            },
+                            "category": {
+                                "type": "string",
+                                "description": "Category name (e.g., 'code', 'errors')"
+                            },
+                            "base_dir": {
+                                "type": "string",
+                                "description": "Base directory for organization (uses config default if not provided)"
+                            },
+                            "new_filename": {
+                                "type": "string",
+                                "description": "New filename (without extension). If None, keeps original name"
+                            },
+                            "keep_original": {
+                                "type": "boolean",
+                                "description": "If True, copy instead of move",
+                                "default": True
+                            }
+                        },
+                        "required": ["source_path", "category"]
+                    }
+                ),
                 Tool(
                     name="generate_filename",
                     description="Generate a descriptive filename for a screenshot. Simple utility - the Agent can use its own intelligence for better names.",
@@ -240,13 +326,26 @@ class ScreenshotMCPServer:
                     result = mcp_tools.list_screenshots(
                         directory=arguments["directory"],
                         recursive=arguments.get("recursive", False),
-                        max_files=arguments.get("max_files")
+                        max_files=arguments.get("max_files"),
+                        offset=arguments.get("offset", 0)
+                    )
+                elif name == "export_screenshot_list":
+                    result = mcp_tools.export_screenshot_list(
+                        directory=arguments["directory"],
+                        output_path=arguments["output_path"],
+                        recursive=arguments.get("recursive", False),
+                        overwrite=arguments.get("overwrite", False)
                     )
                 elif name == "analyze_screenshot":
                     result = mcp_tools.analyze_screenshot(
                         file_path=arguments["file_path"],
                         force_vision=arguments.get("force_vision", False)
                     )
+                elif name == "analyze_screenshots_batch":
+                    result = mcp_tools.analyze_screenshots_batch(
+                        file_paths=arguments["file_paths"],
+                        force_vision=arguments.get("force_vision", False)
+                    )
                 elif name == "get_categories":
                     result = mcp_tools.get_categories()
                 elif name == "categorize_screenshot":
@@ -266,6 +365,14 @@ class ScreenshotMCPServer:
                         new_filename=arguments.get("new_filename"),
                         keep_original=arguments.get("keep_original", True)
                     )
+                elif name == "place_screenshot":
+                    result = mcp_tools.place_screenshot(
+                        source_path=arguments["source_path"],
+                        category=arguments["category"],
+                        base_dir=arguments.get("base_dir"),
+                        new_filename=arguments.get("new_filename"),
+                        keep_original=arguments.get("keep_original", True)
+                    )
                 elif name == "generate_filename":
                     result = mcp_tools.generate_filename(
                         original_filename=arguments["original_filename"],
@@ -279,20 +386,20 @@ class ScreenshotMCPServer:
                 # Return result as JSON text content
                 return [TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=codec.encode(result)
                 )]
 
             except FileNotFoundError as e:
                 logger.error(f"File not found error in {name}: {e}")
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": f"File not found: {str(e)}"})
+                    text=codec.encode({"error": f"File not found: {str(e)}"})
                 )]
             except Exception as e:
                 logger.error(f"Error executing tool {name}: {e}", exc_info=True)
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": f"Tool execution failed: {str(e)}"})
+                    text=codec.encode({"error": f"Tool execution failed: {str(e)}"})
                 )]
 
         logger.info("All MCP tools registered")
@@ -330,4 +437,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
@@ -19,20 +19,26 @@ Tool Philosophy - "Dumb Tools, Smart Agent":
 This demonstrates separation of concerns in Agent Framework WITH MCP Client Integration.
 """
 
-from .list_screenshots import list_screenshots
+from .list_screenshots import export_screenshot_list, iter_screenshot_files, list_screenshots
 from .analyze_screenshot import analyze_screenshot
+from .analyze_screenshots_batch import analyze_screenshots_batch
 from .get_categories import get_categories
 from .categorize_screenshot import categorize_screenshot
 from .create_category_folder import create_category_folder
 from .move_screenshot import move_screenshot
+from .place_screenshot import place_screenshot
 from .generate_filename import generate_filename
 
 __all__ = [
     "list_screenshots",
+    "iter_screenshot_files",
+    "export_screenshot_list",
     "analyze_screenshot",
+    "analyze_screenshots_batch",
     "get_categories",
     "categorize_screenshot",
     "create_category_folder",
     "move_screenshot",
+    "place_screenshot",
     "generate_filename",
 ]
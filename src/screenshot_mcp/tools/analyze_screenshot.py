@@ -4,17 +4,57 @@ Returns RAW analysis data (extracted text, descriptions).
 Does NOT make categorization or filename decisions - that's the Agent's job.
 """
 
+import copy
+import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated, Any, Dict
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from utils.logger import get_logger
-from .shared import ocr_processor, vision_processor
+from .shared import (
+    get_ocr_processor,
+    get_result_cache,
+    get_vision_processor,
+    ocr_skip_max_stddev,
+    resolve_screenshot,
+    vision_max_batch,
+)
+
+if TYPE_CHECKING:
+    from processors.ocr_processor import OCRResult
+    from processors.result_cache import ResultCache
 
 logger = get_logger(__name__)
 
+# Completed analyses keyed by (path, mtime_ns, size, force_vision) - an
+# unchanged file is never OCR'd or sent to the vision model twice. Guarded by
+# a lock because analyze_screenshots_batch calls in from worker threads.
+_ANALYSIS_CACHE_SIZE = 1024
+_analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# OCR results computed ahead of time for a batch (see prefetch_ocr), keyed by
+# (path, mtime_ns, size) and consumed by analyze_screenshot, each with whether
+# the image was OCR'd at full resolution. Same lock.
+_ocr_prefetched: Dict[tuple, Any] = {}
+
+# Vision results requested ahead of time for a batch (see prefetch_vision),
+# keyed and consumed the same way. Same lock.
+_vision_prefetched: Dict[tuple, Any] = {}
+
+# OCR pre-screen (see _is_low_contrast): longest thumbnail side, and the widest
+# grayscale range a flat image may have. Even thin text strokes averaged into
+# the thumbnail leave a much wider range than compression noise does.
+_PRESCREEN_SIZE = 512
+_PRESCREEN_MAX_RANGE = 32
+
 
 def analyze_screenshot(
     file_path: Annotated[str, Field(description="Absolute path to screenshot file to analyze")],
@@ -39,34 +79,36 @@ def analyze_screenshot(
         - success: Whether analysis succeeded
         - error: Error message if failed (None if successful)
     """
-    # Normalize path by handling shell escapes
-    normalized_path = file_path.replace('\\ ', ' ')  # Handle escaped spaces from shell
-    path_obj = Path(normalized_path).expanduser()
-
-    # macOS uses Unicode narrow no-break space (U+202F) before AM/PM in screenshot filenames
-    # Try both variations: with regular spaces and with U+202F before AM/PM
-    if not path_obj.exists():
-        dir_path = path_obj.parent
-        filename = path_obj.name
-
-        # Try replacing space before AM/PM with U+202F (macOS default)
-        import re
-        unicode_filename = re.sub(r' (AM|PM)', '\u202f\\1', filename)
-        unicode_path_obj = dir_path / unicode_filename
-        if unicode_path_obj.exists():
-            path_obj = unicode_path_obj
-        else:
-            # Also try the reverse: U+202F before AM/PM -> regular space
-            regular_filename = re.sub('\u202f(AM|PM)', r' \1', filename)
-            regular_path_obj = dir_path / regular_filename
-            if regular_path_obj.exists():
-                path_obj = regular_path_obj
+    # Normalize path (shell escapes, macOS AM/PM spacing) with a single stat
+    path_obj, stat = resolve_screenshot(file_path, "Screenshot file")
+    return analyze_path(path_obj, stat, force_vision)
+
+
+def analyze_path(path_obj: Path, stat: os.stat_result, force_vision: bool = False) -> Dict[str, Any]:
+    """Analyze an already-resolved screenshot (see analyze_screenshot).
+
+    Lets batch callers resolve each path once and skip the per-call
+    normalization and stat.
 
-    if not path_obj.exists():
-        raise FileNotFoundError(f"Screenshot file not found: {normalized_path}")
+    Args:
+        path_obj: Existing screenshot file, as returned by resolve_screenshot
+        stat: Its stat result
+        force_vision: If True, skip OCR and use vision model directly
+
+    Returns:
+        Analysis dictionary as described in analyze_screenshot()
+    """
+    start_ns = time.perf_counter_ns()
+    cache_key = (str(path_obj), stat.st_mtime_ns, stat.st_size, force_vision)
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            _analysis_cache.move_to_end(cache_key)
+    if cached is not None:
+        logger.debug("Analysis cache hit: %s", path_obj.name)
+        return {**copy.deepcopy(cached), "processing_time_ms": (time.perf_counter_ns() - start_ns) / 1e6}
 
-    logger.debug(f"Analyzing screenshot: {file_path} (force_vision={force_vision})")
-    start_time = time.perf_counter()
+    logger.debug("Analyzing screenshot: %s (force_vision=%s)", path_obj, force_vision)
 
     response = {
         "extracted_text": None,
@@ -77,14 +119,22 @@ def analyze_screenshot(
         "success": False,
         "error": None
     }
+    # Analyses built on OCR of a downscaled image are not kept in the cache
+    cacheable = True
 
     try:
-        if force_vision:
+        # Read the file once; OCR and the vision fallback both work from these
+        # bytes, and they also key the on-disk result cache
+        image_bytes = path_obj.read_bytes()
+        result_cache = get_result_cache()
+        digest = result_cache.digest(image_bytes) if result_cache is not None else None
+
+        if force_vision or _is_low_contrast(path_obj, stat.st_mtime_ns):
             # Use vision model
-            logger.debug("force_vision=True, using vision model")
-            vision_result = vision_processor.process(path_obj)
+            logger.debug("force_vision=%s, using vision model", force_vision)
+            vision_description = _vision(path_obj, image_bytes, cache_key, result_cache, digest)
             response.update({
-                "vision_description": vision_result.description,
+                "vision_description": vision_description,
                 "processing_method": "vision",
                 "success": True
             })
@@ -92,43 +142,282 @@ def analyze_screenshot(
             # Try OCR first
             logger.debug("Attempting OCR extraction")
             try:
-                ocr_result = ocr_processor.process(path_obj)
-                response.update({
-                    "extracted_text": ocr_result.text,
-                    "word_count": ocr_result.word_count,
-                    "processing_method": "ocr",
-                    "success": True
-                })
+                ocr_result, cacheable = _ocr(path_obj, image_bytes, cache_key, result_cache, digest)
+                if ocr_result is None:
+                    # The quick probe found too little text for full OCR to suffice
+                    logger.debug("OCR probe found too little text, using vision model")
+                    vision_description = _vision(path_obj, image_bytes, cache_key, result_cache, digest)
+                    response.update({
+                        "vision_description": vision_description,
+                        "processing_method": "vision",
+                        "success": True
+                    })
+                else:
+                    response.update({
+                        "extracted_text": ocr_result.text,
+                        "word_count": ocr_result.word_count,
+                        "processing_method": "ocr",
+                        "success": True
+                    })
 
                 # If insufficient text, add vision description
-                if not ocr_result.sufficient_text:
+                if ocr_result is not None and not ocr_result.sufficient_text:
                     logger.debug("Insufficient OCR text, adding vision analysis")
-                    vision_result = vision_processor.process(path_obj)
-                    response["vision_description"] = vision_result.description
+                    vision_description = _vision(path_obj, image_bytes, cache_key, result_cache, digest)
+                    response["vision_description"] = vision_description
                     response["processing_method"] = "vision"
 
             except Exception as ocr_error:
                 # OCR failed, fall back to vision processing
                 logger.warning(f"OCR failed ({ocr_error}), falling back to vision model")
-                vision_result = vision_processor.process(path_obj)
+                vision_description = _vision(path_obj, image_bytes, cache_key, result_cache, digest)
                 response.update({
-                    "vision_description": vision_result.description,
+                    "vision_description": vision_description,
                     "processing_method": "vision",
                     "success": True
                 })
 
-        response["processing_time_ms"] = (time.perf_counter() - start_time) * 1000
+        response["processing_time_ms"] = (time.perf_counter_ns() - start_ns) / 1e6
 
         logger.debug(
-            f"Analysis complete: {path_obj.name} via {response['processing_method']} "
-            f"in {response['processing_time_ms']:.2f}ms"
+            "Analysis complete: %s via %s in %.2fms",
+            path_obj.name, response["processing_method"], response["processing_time_ms"]
         )
 
+        # Deep copy so the caller's (and later callers') changes to nested
+        # values never reach the cached entry
+        if cacheable:
+            snapshot = copy.deepcopy(response)
+            with _analysis_cache_lock:
+                _analysis_cache[cache_key] = snapshot
+                if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.popitem(last=False)
+
         return response
 
     except Exception as e:
         response["success"] = False
         response["error"] = str(e)
-        response["processing_time_ms"] = (time.perf_counter() - start_time) * 1000
-        logger.error(f"Failed to analyze screenshot {file_path}: {e}")
+        response["processing_time_ms"] = (time.perf_counter_ns() - start_ns) / 1e6
+        logger.error(f"Failed to analyze screenshot {path_obj}: {e}")
         raise
+
+
+def _is_low_contrast(path_obj: Path, mtime_ns: int) -> bool:
+    """Check whether an image is too flat to contain readable text.
+
+    Near-uniform images (blank captures, solid backgrounds, faded photos)
+    always fail the OCR word threshold, so they go straight to the vision
+    model. Off unless processing.ocr_skip_max_stddev is set. Results are
+    cached per (path, mtime).
+
+    Args:
+        path_obj: Path to the image file
+        mtime_ns: File modification time (cache key)
+
+    Returns:
+        True if OCR should be skipped
+    """
+    if ocr_skip_max_stddev <= 0:
+        return False
+    return _low_contrast(str(path_obj), mtime_ns)
+
+
+def _ocr(
+    path_obj: Path,
+    image_bytes: bytes,
+    cache_key: tuple,
+    result_cache: Optional["ResultCache"],
+    digest: Optional[str]
+) -> Tuple[Optional["OCRResult"], bool]:
+    """OCR an image, reusing an on-disk cached or GPU-prefetched result.
+
+    The result is None (without running full OCR) when the processor's quick
+    probe predicts too little text; the caller goes straight to vision. The
+    flag is False when the text came from a downscaled image, so the analysis
+    built on it should not be cached.
+    """
+    from processors.ocr_processor import OCRResult
+
+    ocr = get_ocr_processor()
+    if result_cache is not None:
+        cached = result_cache.get("ocr", digest, ocr.cache_variant)
+        if cached is not None:
+            logger.debug("OCR result cache hit: %s", path_obj.name)
+            ocr_result = OCRResult(**cached)
+            # The threshold may have changed since the result was stored
+            ocr_result.sufficient_text = ocr_result.word_count >= ocr.min_words_threshold
+            return ocr_result, True
+
+    with _analysis_cache_lock:
+        prefetched = _ocr_prefetched.pop(cache_key[:3], None)
+    if prefetched is not None:
+        # EasyOCR output is not stored, so the disk cache only ever serves
+        # Tesseract output matching ocr.cache_variant
+        return prefetched
+    if not ocr.quick_probe(path_obj, image_bytes):
+        return None, True
+    ocr_result = ocr.process(path_obj, image_bytes)
+    if result_cache is not None:
+        result_cache.put("ocr", digest, asdict(ocr_result), ocr.cache_variant)
+    return ocr_result, True
+
+
+def _vision(
+    path_obj: Path,
+    image_bytes: bytes,
+    cache_key: tuple,
+    result_cache: Optional["ResultCache"],
+    digest: Optional[str]
+) -> str:
+    """Describe an image with the vision model, reusing an on-disk cached or prefetched result."""
+    if result_cache is not None:
+        variant = get_vision_processor().cache_variant
+        cached = result_cache.get("vision", digest, variant)
+        if cached is not None:
+            logger.debug("Vision result cache hit: %s", path_obj.name)
+            return cached["description"]
+
+    with _analysis_cache_lock:
+        vision_result = _vision_prefetched.pop(cache_key[:3], None)
+    if vision_result is None:
+        vision_result = get_vision_processor().process(path_obj, image_bytes)
+    if result_cache is not None:
+        result_cache.put("vision", digest, asdict(vision_result), variant)
+    return vision_result.description
+
+
+def prefetch_ocr(screenshots: List[Tuple[Path, os.stat_result]]):
+    """OCR a batch of screenshots on the GPU ahead of analyze_path.
+
+    Only files that analyze_path will actually OCR are included (not
+    cached, not low-contrast, not tall enough to need tiling). Does nothing
+    unless the batch is large enough for the GPU path. Results left over
+    from an earlier batch are dropped; the MCP server runs one tool call at
+    a time.
+
+    Args:
+        screenshots: Resolved (path, stat) pairs about to be analyzed without
+            force_vision
+    """
+    from PIL import Image
+
+    with _analysis_cache_lock:
+        _ocr_prefetched.clear()
+    ocr = get_ocr_processor()
+    if not ocr.use_gpu_for(len(screenshots)):
+        return
+
+    pending = []
+    for path_obj, stat in screenshots:
+        key = (str(path_obj), stat.st_mtime_ns, stat.st_size)
+        with _analysis_cache_lock:
+            cached = (*key, False) in _analysis_cache
+        if cached or _is_low_contrast(path_obj, stat.st_mtime_ns):
+            continue
+        try:
+            with Image.open(path_obj) as img:
+                mode = ocr.gpu_batch_mode(*img.size)
+        except Exception:
+            continue  # analyze_path reports unreadable files
+        if mode is not None:
+            pending.append((key, path_obj, mode == "full"))
+
+    if not ocr.use_gpu_for(len(pending)):
+        return
+
+    try:
+        results = ocr.process_batch([path_obj for _, path_obj, _ in pending])
+    except Exception as e:
+        logger.warning(f"GPU OCR batch failed ({e}), falling back to Tesseract")
+        return
+
+    with _analysis_cache_lock:
+        for (key, _, full_resolution), result in zip(pending, results):
+            _ocr_prefetched[key] = (result, full_resolution)
+
+
+def prefetch_vision(screenshots: List[Tuple[Path, os.stat_result]], force_vision: bool):
+    """Send a batch's vision-bound screenshots to the model several at a time.
+
+    Only files known up front to need the vision model are included: all of
+    them with force_vision, otherwise the low-contrast ones. Files already in
+    the analysis or on-disk result cache are skipped. Each request carries up
+    to vision_max_batch images; a failed request leaves its images to
+    analyze_path, which then sends them one by one. Does nothing when
+    vision_max_batch is 1.
+
+    Args:
+        screenshots: Resolved (path, stat) pairs about to be analyzed
+        force_vision: Whether the batch is analyzed with force_vision
+    """
+    with _analysis_cache_lock:
+        _vision_prefetched.clear()
+    if vision_max_batch <= 1 or len(screenshots) < 2:
+        return
+
+    result_cache = get_result_cache()
+    processor = get_vision_processor()
+    pending = []
+    for path_obj, stat in screenshots:
+        key = (str(path_obj), stat.st_mtime_ns, stat.st_size)
+        with _analysis_cache_lock:
+            cached = (*key, force_vision) in _analysis_cache
+        if cached or not (force_vision or _is_low_contrast(path_obj, stat.st_mtime_ns)):
+            continue
+        try:
+            image_bytes = path_obj.read_bytes()
+        except OSError:
+            continue  # analyze_path reports the error
+        if result_cache is not None and result_cache.get(
+            "vision", result_cache.digest(image_bytes), processor.cache_variant
+        ) is not None:
+            continue
+        pending.append((key, path_obj, image_bytes))
+
+    chunks = [pending[i:i + vision_max_batch] for i in range(0, len(pending), vision_max_batch)]
+    chunks = [chunk for chunk in chunks if len(chunk) > 1]
+    if not chunks:
+        return
+
+    def run(chunk):
+        try:
+            results = processor.process_batch([(path_obj, data) for _, path_obj, data in chunk])
+        except Exception as e:
+            logger.warning(f"Batched vision request failed ({e}), images will be sent individually")
+            return
+        with _analysis_cache_lock:
+            _vision_prefetched.update(zip((key for key, _, _ in chunk), results))
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), 4), thread_name_prefix="vision-batch") as executor:
+        list(executor.map(run, chunks))
+
+
+@lru_cache(maxsize=1024)
+def _low_contrast(path: str, mtime_ns: int) -> bool:
+    """Measure grayscale contrast on a thumbnail (cached by mtime).
+
+    The thumbnail keeps the aspect ratio. Sparse text on a flat background
+    (dark-mode editors, terminals) has a low overall stddev, so an image
+    only counts as flat when its grayscale range is narrow as well.
+    """
+    from PIL import Image, ImageStat
+
+    try:
+        with Image.open(path) as img:
+            img.draft("L", (_PRESCREEN_SIZE, _PRESCREEN_SIZE))  # Reduced-size decode where the format supports it
+            thumbnail = img.convert("L")
+            thumbnail.thumbnail((_PRESCREEN_SIZE, _PRESCREEN_SIZE))
+    except Exception as e:
+        logger.debug("OCR pre-screen skipped for %s: %s", path, e)
+        return False
+
+    stddev = ImageStat.Stat(thumbnail).stddev[0]
+    darkest, brightest = thumbnail.getextrema()
+    if stddev < ocr_skip_max_stddev and brightest - darkest <= _PRESCREEN_MAX_RANGE:
+        logger.debug(
+            "Low-contrast image (stddev=%.1f, range=%d), skipping OCR: %s",
+            stddev, brightest - darkest, path
+        )
+        return True
+    return False
@@ -0,0 +1,101 @@
+"""Analyze several screenshots in one call, with OCR running in parallel.
+
+Tesseract runs as a native subprocess (or GIL-free tesserocr call) per
+image, so the shared OCR thread pool gives near-linear speedup up to the
+core count without a process pool. Large batches are OCR'd in one GPU pass
+first when EasyOCR and CUDA are available, and images bound for the vision
+model can share requests (processing.vision_max_batch).
+Each file gets the same OCR-then-vision treatment as analyze_screenshot.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Annotated, Any, Dict, List, Tuple, Union
+
+from pydantic import Field
+
+from utils.logger import get_logger
+from .analyze_screenshot import analyze_path, prefetch_ocr, prefetch_vision
+from .shared import resolve_screenshot
+
+logger = get_logger(__name__)
+
+
+def analyze_screenshots_batch(
+    file_paths: Annotated[List[str], Field(description="Absolute paths to screenshot files to analyze")],
+    force_vision: Annotated[bool, Field(description="Skip OCR and use vision model directly")] = False
+) -> Dict[str, Any]:
+    """Analyze several screenshots concurrently using OCR or vision model.
+
+    Returns RAW analysis data per file, like analyze_screenshot. A failure on
+    one file is reported in its entry and does not fail the batch.
+
+    Args:
+        file_paths: Absolute paths to screenshot files
+        force_vision: If True, skip OCR and use vision model directly
+
+    Returns:
+        Dictionary containing:
+        - results: One analysis dict per path, in input order, each with
+          file_path and processing_time_ms (error set if it failed)
+        - processing_time_ms: Wall-clock time for the whole batch
+    """
+    if not file_paths:
+        return {"results": [], "processing_time_ms": 0.0}
+
+    from processors.ocr_processor import get_ocr_pool
+
+    # Each worker drives its own tesseract subprocess (OMP_THREAD_LIMIT=1 is set
+    # by processors.ocr_processor), so threads give process-level parallelism.
+    # The pool is shared and long-lived: concurrent batches stay within the
+    # core count, and its threads keep their tesserocr APIs between batches
+    executor = get_ocr_pool()
+    logger.debug(f"Analyzing {len(file_paths)} screenshots on the shared OCR pool")
+    start_ns = time.perf_counter_ns()
+
+    # Resolve every path once (in parallel - stats are latency-bound on
+    # network shares); the GPU prefetch and the analysis both reuse it
+    resolved = list(executor.map(_resolve, file_paths))
+    screenshots = [item for item in resolved if not isinstance(item, Exception)]
+    if not force_vision:
+        prefetch_ocr(screenshots)
+    # The images are all known here, so vision-bound ones can share requests
+    prefetch_vision(screenshots, force_vision)
+
+    results = list(executor.map(
+        lambda args: _analyze_one(*args, force_vision), zip(file_paths, resolved)
+    ))
+
+    processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    logger.debug(f"Batch analysis of {len(file_paths)} files complete in {processing_time_ms:.2f}ms")
+
+    return {"results": results, "processing_time_ms": processing_time_ms}
+
+
+def _resolve(file_path: str) -> Union[Tuple[Path, os.stat_result], Exception]:
+    """Resolve a screenshot path, returning the error instead of raising it."""
+    try:
+        return resolve_screenshot(file_path, "Screenshot file")
+    except Exception as e:
+        return e
+
+
+def _analyze_one(
+    file_path: str,
+    resolved: Union[Tuple[Path, os.stat_result], Exception],
+    force_vision: bool
+) -> Dict[str, Any]:
+    """Analyze a single resolved file, turning failures into an error entry."""
+    start_ns = time.perf_counter_ns()
+    try:
+        if isinstance(resolved, Exception):
+            raise resolved
+        return {"file_path": file_path, **analyze_path(*resolved, force_vision)}
+    except Exception as e:
+        return {
+            "file_path": file_path,
+            "success": False,
+            "error": str(e),
+            "processing_time_ms": (time.perf_counter_ns() - start_ns) / 1e6
+        }
@@ -9,7 +9,7 @@ from typing import Annotated, Any, Dict, List
 from pydantic import Field
 
 from utils.logger import get_logger
-from .shared import classifier
+from .shared import get_classifier
 
 logger = get_logger(__name__)
 
@@ -34,17 +34,10 @@ def categorize_screenshot(
         - matched_keywords: List of keywords that matched
         - method: Always "keyword_classifier"
     """
-    logger.debug(f"Categorizing text using keyword classifier ({len(text)} chars)")
+    logger.debug("Categorizing text using keyword classifier (%d chars)", len(text))
 
-    # Use keyword classifier
-    category = classifier.classify(text)
-
-    # Find which keywords matched (simplified - just check if category keywords appear in text)
-    patterns = classifier.patterns
-    matched_keywords = []
-    if category in patterns:
-        text_lower = text.lower()
-        matched_keywords = [kw for kw in patterns[category] if kw in text_lower]
+    # Use keyword classifier - one scan yields the category and the keywords that matched
+    category, matched_keywords = get_classifier().classify_with_matches(text)
 
     # Calculate simple confidence based on keyword matches
     confidence = 0.5  # Base confidence
@@ -3,8 +3,9 @@
 Creates the folder structure if it doesn't exist.
 """
 
+import os
 from pathlib import Path
-from typing import Annotated, Any, Dict, Optional
+from typing import Annotated, Any, Dict, Optional, Tuple
 
 from pydantic import Field
 
@@ -32,26 +33,39 @@ def create_category_folder(
         - created: Whether the folder was newly created (False if it already existed)
         - success: Whether operation succeeded
     """
-    # Normalize path by removing shell escape characters
-    if base_dir:
-        normalized_base = base_dir.replace('\\ ', ' ')  # Handle escaped spaces from shell
-        base = Path(normalized_base).expanduser()
-    else:
-        base = Path(base_folder).expanduser()
-    category_path = base / category
-
-    logger.info(f"Creating category folder: {category_path}")
-
-    created = False
-    if not category_path.exists():
-        category_path.mkdir(parents=True, exist_ok=True)
-        created = True
-        logger.info(f"Created new category folder: {category_path}")
-    else:
-        logger.debug(f"Category folder already exists: {category_path}")
+    category_path, created = ensure_category_folder(category, base_dir)
 
     return {
         "folder_path": str(category_path),
         "created": created,
         "success": True
     }
+
+
+def ensure_category_folder(category: str, base_dir: Optional[str] = None) -> Tuple[Path, bool]:
+    """Return the category folder path, creating it if needed.
+
+    Args:
+        category: Category name
+        base_dir: Base directory for organization (config default if None)
+
+    Returns:
+        Tuple of (category folder path, whether it was newly created)
+    """
+    # Normalize path by removing shell escape characters
+    base = os.path.expanduser(base_dir.replace('\\ ', ' ') if base_dir else base_folder)
+    category_path = Path(base, category)
+
+    # One mkdir either way: an existing folder (or one another call created
+    # meanwhile) surfaces as FileExistsError instead of needing an exists() probe
+    try:
+        category_path.mkdir(parents=True)
+        created = True
+        logger.info("Created new category folder: %s", category_path)
+    except FileExistsError:
+        if not category_path.is_dir():
+            raise
+        created = False
+        logger.debug("Category folder already exists: %s", category_path)
+
+    return category_path, created
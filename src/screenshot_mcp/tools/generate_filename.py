@@ -4,7 +4,9 @@ This is a simple utility for generating filenames. The Agent (GPT-4)
 can use its own intelligence to generate better filenames if desired.
 """
 
-from datetime import datetime
+import re
+import time
+from itertools import islice
 from pathlib import Path
 from typing import Annotated, Any, Dict, Optional
 
@@ -14,6 +16,11 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Runs of 3+ word characters. Punctuation never reaches the filename, so OCR
+# text like "src/app.py:" cannot inject path separators or colons
+_WORD_RE = re.compile(r"\w{3,}")
+_MAX_WORDS = 5
+
 
 def generate_filename(
     original_filename: Annotated[str, Field(description="Original filename")],
@@ -38,41 +45,26 @@ def generate_filename(
         - extension: File extension
         - timestamp: Timestamp string
     """
-    logger.debug(f"Generating filename for {original_filename} (category={category})")
+    logger.debug("Generating filename for %s (category=%s)", original_filename, category)
 
     # Get extension from original
     extension = Path(original_filename).suffix
 
-    # Generate timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d")
-
-    # Try to generate descriptive name from text or description
-    if text:
-        # Take first meaningful words (up to 5)
-        words = [w for w in text.split() if len(w) > 2][:5]
-        if words:
-            base_name = "_".join(words).lower()
-            suggested = f"{base_name}_{timestamp}"
-            return {
-                "suggested_filename": suggested,
-                "extension": extension,
-                "timestamp": timestamp
-            }
-
-    if description:
-        # Take first few words from description
-        words = [w for w in description.split() if len(w) > 2][:5]
-        if words:
-            base_name = "_".join(words).lower()
-            suggested = f"{base_name}_{timestamp}"
-            return {
-                "suggested_filename": suggested,
-                "extension": extension,
-                "timestamp": timestamp
-            }
+    # Generate timestamp (local date, formatted in C without a datetime object)
+    timestamp = time.strftime("%Y-%m-%d")
 
+    # Try to generate descriptive name from text, then description (first
+    # meaningful words, up to 5 - stop scanning once they are found).
     # Fallback: category + timestamp
-    suggested = f"{category}_screenshot_{timestamp}"
+    base_name = f"{category}_screenshot"
+    for source in (text, description):
+        if source:
+            words = [match.group() for match in islice(_WORD_RE.finditer(source), _MAX_WORDS)]
+            if words:
+                base_name = "_".join(words).lower()
+                break
+
+    suggested = f"{base_name}_{timestamp}"
     return {
         "suggested_filename": suggested,
         "extension": extension,
@@ -3,18 +3,33 @@
 Returns category configuration for the Agent to use when categorizing.
 """
 
+from functools import cache
 from typing import Any, Dict
 
 from utils.logger import get_logger
-from .shared import classifier, categories
+from .shared import categories, get_classifier
 
 logger = get_logger(__name__)
 
+# Human-readable descriptions for the built-in categories
+CATEGORY_DESCRIPTIONS = {
+    "code": "Code snippets, terminal output, IDE screenshots, programming content",
+    "errors": "Error messages, stack traces, warnings, exceptions",
+    "documentation": "Documentation pages, technical specs, API references",
+    "design": "UI mockups, design files, graphics, visual assets",
+    "communication": "Messages, emails, chat conversations, social media",
+    "memes": "Memes, jokes, funny images",
+    "other": "Miscellaneous screenshots that don't fit other categories"
+}
+
 
 def get_categories() -> Dict[str, Any]:
     """Get list of available screenshot categories.
 
     Returns category configuration for the Agent to use when categorizing.
+    The result depends only on configuration loaded at server start, so it
+    is built once and the same dictionary is returned on every call.
+    Callers must treat it as read-only.
 
     Returns:
         Dictionary containing:
@@ -22,30 +37,24 @@ def get_categories() -> Dict[str, Any]:
         - default_category: Default category for uncategorized items
     """
     logger.debug("Getting category configuration")
+    return _category_config()
 
-    # Get keyword patterns from classifier
-    patterns = classifier.patterns
 
-    category_list = []
-    for category_name in categories:
-        category_info = {
-            "name": category_name,
-            "keywords": patterns.get(category_name, [])
-        }
+@cache
+def _category_config() -> Dict[str, Any]:
+    """Build the category configuration (once per server process)."""
+    # Get keyword patterns from classifier. Copy each list so the cached
+    # response is a snapshot and does not change under add_pattern()
+    patterns = get_classifier().patterns
 
-        # Add descriptions based on category
-        descriptions = {
-            "code": "Code snippets, terminal output, IDE screenshots, programming content",
-            "errors": "Error messages, stack traces, warnings, exceptions",
-            "documentation": "Documentation pages, technical specs, API references",
-            "design": "UI mockups, design files, graphics, visual assets",
-            "communication": "Messages, emails, chat conversations, social media",
-            "memes": "Memes, jokes, funny images",
-            "other": "Miscellaneous screenshots that don't fit other categories"
+    category_list = [
+        {
+            "name": category_name,
+            "keywords": list(patterns.get(category_name, ())),
+            "description": CATEGORY_DESCRIPTIONS.get(category_name, "")
         }
-        category_info["description"] = descriptions.get(category_name, "")
-
-        category_list.append(category_info)
+        for category_name in categories
+    ]
 
     return {
         "categories": category_list,
@@ -4,22 +4,88 @@ Returns raw file information without any analysis or categorization.
 The Agent decides what to do with the files.
 """
 
-from datetime import datetime
-from pathlib import Path
-from typing import Annotated, Any, Dict, Optional
+import os
+import re
+import stat as stat_module
+import tempfile
+import time
+from typing import Annotated, Any, Dict, Iterator, Optional
 
 from pydantic import Field
 
+from screenshot_mcp import codec
 from utils.logger import get_logger
-from .shared import batch_processor
+from .shared import get_batch_processor, resolve_path
 
 logger = get_logger(__name__)
 
+# macOS uses U+202F (narrow no-break space) before AM/PM in screenshot filenames
+_NARROW_NBSP_AMPM = re.compile('\u202f(AM|PM)')
+
+# Local-time ISO 8601 to the second, formatted in C without a datetime per file
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _resolve_directory(directory: str) -> str:
+    """Normalize a directory path and check it exists (one stat for exists + is_dir)."""
+    dir_path, dir_stat = resolve_path(directory)
+    if dir_stat is None:
+        raise FileNotFoundError(f"Directory not found: {dir_path}")
+    if not stat_module.S_ISDIR(dir_stat.st_mode):
+        raise NotADirectoryError(f"Not a directory: {dir_path}")
+    return dir_path
+
+
+def _file_info(entry: os.DirEntry) -> Dict[str, Any]:
+    """Build the file info dict for a scanned DirEntry.
+
+    Raises:
+        OSError: If the file cannot be stat'd
+    """
+    stat = entry.stat()
+    # Replace U+202F before AM/PM with a regular space - it can confuse AI agents
+    return {
+        "path": _NARROW_NBSP_AMPM.sub(r' \1', entry.path),
+        "filename": _NARROW_NBSP_AMPM.sub(r' \1', entry.name),
+        "size_bytes": stat.st_size,
+        "modified_time": time.strftime(_ISO_FORMAT, time.localtime(stat.st_mtime))
+    }
+
+
+def iter_screenshot_files(directory: str, recursive: bool = False) -> Iterator[Dict[str, Any]]:
+    """Yield file info dicts for screenshots in a directory, one at a time.
+
+    Unlike list_screenshots this never holds the listing in memory, so peak
+    memory stays flat however many files the directory holds.
+
+    Args:
+        directory: Absolute path to directory to scan
+        recursive: Whether to scan subdirectories
+
+    Yields:
+        File information dicts (as in list_screenshots "files")
+
+    Raises:
+        FileNotFoundError, NotADirectoryError: If directory is not a directory
+            (raised by this call, before the first file is requested)
+    """
+    return _iter_file_infos(_resolve_directory(directory), recursive)
+
+
+def _iter_file_infos(dir_path: str, recursive: bool) -> Iterator[Dict[str, Any]]:
+    """Yield file info dicts for an already resolved directory."""
+    for entry in get_batch_processor().iter_entries(dir_path, recursive=recursive):
+        try:
+            yield _file_info(entry)
+        except OSError as e:
+            logger.warning(f"Failed to stat file {entry.path}: {e}")
+
 
 def list_screenshots(
     directory: Annotated[str, Field(description="Absolute path to directory to scan for screenshots")],
     recursive: Annotated[bool, Field(description="Scan subdirectories recursively")] = False,
-    max_files: Annotated[Optional[int], Field(description="Maximum number of files to return")] = None
+    max_files: Annotated[Optional[int], Field(description="Maximum number of files to return")] = None,
+    offset: Annotated[int, Field(ge=0, description="Number of files to skip (for paging through large directories)")] = 0
 ) -> Dict[str, Any]:
     """List screenshot files in a directory.
 
@@ -30,55 +96,122 @@ def list_screenshots(
         directory: Absolute path to directory to scan
         recursive: Whether to scan subdirectories
         max_files: Maximum number of files to return (optional)
+        offset: Number of files to skip before the returned page (default 0)
 
     Returns:
         Dictionary containing:
         - files: List of file information dicts
         - total_count: Total number of files found
-        - truncated: Whether the list was truncated due to max_files limit
+        - truncated: Whether more files remain after this page
+        - next_offset: Offset of the next page (None if this is the last page)
     """
     # Normalize path by removing shell escape characters
-    normalized_dir = directory.replace('\\ ', ' ')  # Handle escaped spaces from shell
-    dir_path = Path(normalized_dir).expanduser()
-    if not dir_path.exists():
-        raise FileNotFoundError(f"Directory not found: {normalized_dir}")
+    dir_path = _resolve_directory(directory)
+
+    logger.debug("Listing screenshots in %s (recursive=%s)", directory, recursive)
 
-    logger.debug(f"Listing screenshots in {directory} (recursive={recursive})")
+    # Scan lazily - keep only the requested page of raw DirEntry objects (no
+    # Path allocations) and just count the rest for total_count
+    end = offset + max_files if max_files else None
+    page = []
+    total_count = 0
+    for entry in get_batch_processor().iter_entries(dir_path, recursive=recursive):
+        if offset <= total_count and (end is None or total_count < end):
+            page.append(entry)
+        total_count += 1
 
-    # Scan for files
-    files = batch_processor.scan_folder(dir_path, recursive=recursive)
+    next_offset = offset + len(page) if offset + len(page) < total_count else None
+    if next_offset is not None:
+        logger.debug("Returning files %d-%d of %d", offset, next_offset, total_count)
 
     # Build file info list
     file_list = []
-    for file_path in files:
+    for entry in page:
         try:
-            stat = file_path.stat()
-            # Normalize path - replace Unicode narrow no-break space (U+202F) before AM/PM with regular space
-            # macOS uses U+202F before AM/PM in screenshot filenames which can confuse AI agents
-            import re
-            normalized_path = re.sub('\u202f(AM|PM)', r' \1', str(file_path))
-            normalized_filename = re.sub('\u202f(AM|PM)', r' \1', file_path.name)
-
-            file_list.append({
-                "path": normalized_path,
-                "filename": normalized_filename,
-                "size_bytes": stat.st_size,
-                "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat()
-            })
+            file_list.append(_file_info(entry))
         except Exception as e:
-            logger.warning(f"Failed to stat file {file_path}: {e}")
-
-    total_count = len(file_list)
-    truncated = False
-
-    # Apply max_files limit if specified
-    if max_files and len(file_list) > max_files:
-        file_list = file_list[:max_files]
-        truncated = True
-        logger.debug(f"Truncated file list to {max_files} files (found {total_count})")
+            logger.warning(f"Failed to stat file {entry.path}: {e}")
 
     return {
         "files": file_list,
         "total_count": total_count,
-        "truncated": truncated
+        "truncated": next_offset is not None,
+        "next_offset": next_offset
+    }
+
+
+def export_screenshot_list(
+    directory: Annotated[str, Field(description="Absolute path to directory to scan for screenshots")],
+    output_path: Annotated[str, Field(description="Absolute path of the NDJSON file to write, inside directory")],
+    recursive: Annotated[bool, Field(description="Scan subdirectories recursively")] = False,
+    overwrite: Annotated[bool, Field(description="Replace output_path if it already exists")] = False
+) -> Dict[str, Any]:
+    """Write the full screenshot listing of a directory to an NDJSON file.
+
+    Streams one JSON line per file as the directory is scanned, so very large
+    directories can be listed without building the whole response in memory.
+    The listing is written to a temp file next to output_path and renamed
+    into place, so a failed scan never leaves a partial file behind.
+
+    Args:
+        directory: Absolute path to directory to scan
+        output_path: Absolute path of the NDJSON file to write; must be
+            inside directory
+        recursive: Whether to scan subdirectories
+        overwrite: Replace output_path if it already exists (default False)
+
+    Returns:
+        Dictionary containing:
+        - output_path: Path of the written file
+        - total_count: Number of files written
+
+    Raises:
+        PermissionError: If output_path is outside directory
+        FileExistsError: If output_path exists and overwrite is False
+    """
+    dir_path = _resolve_directory(directory)
+    out_path = _resolve_export_path(dir_path, output_path, overwrite)
+
+    total_count = 0
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(out_path), prefix=f".{os.path.basename(out_path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for info in _iter_file_infos(dir_path, recursive):
+                f.write(codec.encode(info))
+                f.write("\n")
+                total_count += 1
+        if not overwrite and os.path.lexists(out_path):
+            raise FileExistsError(f"Output file already exists: {out_path}")
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.debug("Exported %d screenshots from %s to %s", total_count, directory, out_path)
+
+    return {
+        "output_path": out_path,
+        "total_count": total_count
     }
+
+
+def _resolve_export_path(dir_path: str, output_path: str, overwrite: bool) -> str:
+    """Check an export target before anything is written.
+
+    The target must lie inside the listed directory (after resolving
+    symlinks), so a tool call cannot write anywhere else on disk, and must
+    not exist unless overwrite is set.
+    """
+    out_path, out_stat = resolve_path(output_path)
+    real_dir = os.path.realpath(dir_path)
+    real_out = os.path.realpath(out_path)
+    if real_out == real_dir or os.path.commonpath([real_dir, real_out]) != real_dir:
+        raise PermissionError(f"Output file must be inside {dir_path}: {out_path}")
+    if out_stat is not None:
+        if not overwrite:
+            raise FileExistsError(f"Output file already exists: {out_path}")
+        if not stat_module.S_ISREG(out_stat.st_mode):
+            raise IsADirectoryError(f"Output path is not a regular file: {out_path}")
+    return out_path
@@ -4,15 +4,32 @@ Simple file operation - just moves/copies the file as instructed.
 The Agent decides the destination and new filename.
 """
 
+import errno
+import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 from typing import Annotated, Any, Dict, Optional
 
 from pydantic import Field
 
 from utils.logger import get_logger
+from .shared import resolve_path, resolve_screenshot
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows - always use shutil.copy2
+    fcntl = None
 
 logger = get_logger(__name__)
 
+# FICLONE ioctl from linux/fs.h (fcntl only exports the name from Python 3.12)
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl and sys.platform.startswith("linux") else None
+
+# Below this size shutil.copy2 (sendfile) is already as fast as a reflink
+_REFLINK_MIN_SIZE = 256 * 1024
+
 
 def move_screenshot(
     source_path: Annotated[str, Field(description="Absolute path to source file")],
@@ -39,63 +56,54 @@ def move_screenshot(
         - success: Whether operation succeeded
         - error: Error message if failed (None if successful)
     """
-    # Normalize paths by handling shell escapes
-    normalized_source = source_path.replace('\\ ', ' ')  # Handle escaped spaces from shell
-    normalized_dest = dest_folder.replace('\\ ', ' ')  # Handle escaped spaces from shell
-
-    source = Path(normalized_source).expanduser()
-
-    # macOS uses Unicode narrow no-break space (U+202F) before AM/PM in screenshot filenames
-    # Try both variations: with regular spaces and with U+202F before AM/PM
-    if not source.exists():
-        import re
-        dir_path = source.parent
-        filename = source.name
-
-        # Try replacing space before AM/PM with U+202F (macOS default)
-        unicode_filename = re.sub(r' (AM|PM)', '\u202f\\1', filename)
-        unicode_path_obj = dir_path / unicode_filename
-        if unicode_path_obj.exists():
-            source = unicode_path_obj
-        else:
-            # Also try the reverse: U+202F before AM/PM -> regular space
-            regular_filename = re.sub('\u202f(AM|PM)', r' \1', filename)
-            regular_path_obj = dir_path / regular_filename
-            if regular_path_obj.exists():
-                source = regular_path_obj
+    # Resolve source (shell escapes, macOS AM/PM spacing) and check destination
+    source, _ = resolve_screenshot(source_path, "Source file")
+
+    dest_dir, dest_stat = resolve_path(dest_folder)
+    if dest_stat is None:
+        raise FileNotFoundError(f"Destination folder not found: {dest_dir}")
+
+    return transfer_screenshot(source, Path(dest_dir), new_filename, keep_original)
+
 
-    if not source.exists():
-        raise FileNotFoundError(f"Source file not found: {normalized_source}")
+def transfer_screenshot(
+    source: Path,
+    dest_dir: Path,
+    new_filename: Optional[str] = None,
+    keep_original: bool = True
+) -> Dict[str, Any]:
+    """Copy or move an existing file into an existing folder.
 
-    dest_dir = Path(normalized_dest).expanduser()
-    if not dest_dir.exists():
-        raise FileNotFoundError(f"Destination folder not found: {normalized_dest}")
+    Args:
+        source: Existing source file
+        dest_dir: Existing destination folder
+        new_filename: Optional new filename (without extension)
+        keep_original: If True, copy instead of move
 
+    Returns:
+        Result dictionary as described in move_screenshot()
+    """
     # Determine destination filename
     if new_filename:
         # Use new filename but keep original extension
-        extension = source.suffix
-        dest_path = dest_dir / f"{new_filename}{extension}"
+        dest_path = dest_dir / f"{new_filename}{source.suffix}"
     else:
         # Keep original filename
         dest_path = dest_dir / source.name
 
     logger.info(
-        f"{'Copying' if keep_original else 'Moving'} screenshot: "
-        f"{source.name} → {dest_path}"
+        "%s screenshot: %s → %s",
+        "Copying" if keep_original else "Moving", source.name, dest_path
     )
 
+    operation = "copy" if keep_original else "move"
     try:
-        operation = ""
         if keep_original:
-            import shutil
-            shutil.copy2(source, dest_path)
-            operation = "copy"
+            _copy_file(source, dest_path)
         else:
-            source.rename(dest_path)
-            operation = "move"
+            _move_file(source, dest_path)
 
-        logger.info(f"Successfully {operation}ed {source.name} to {dest_path}")
+        logger.info("Successfully %sed %s to %s", operation, source.name, dest_path)
 
         return {
             "original_path": str(source),
@@ -114,3 +122,80 @@ def move_screenshot(
             "success": False,
             "error": str(e)
         }
+
+
+def _move_file(source: Path, dest_path: Path):
+    """Move a file without replacing an existing destination.
+
+    The destination name is claimed first with an empty O_EXCL placeholder,
+    which the move then replaces, so a file created at dest_path by anyone
+    else is never clobbered (on any platform).
+
+    Raises:
+        FileExistsError: If dest_path already exists
+    """
+    os.close(os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+    try:
+        try:
+            # Same filesystem: a single rename syscall
+            os.replace(source, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device: copy with metadata, then remove the source
+            shutil.move(source, dest_path)
+    except BaseException:
+        os.unlink(dest_path)
+        raise
+
+
+def _copy_file(source: Path, dest_path: Path):
+    """Copy a file with metadata, as a copy-on-write reflink when possible.
+
+    On Btrfs/XFS a reflink shares the source's data blocks, so copying a
+    multi-MB screenshot is a metadata-only operation. Anything else (other
+    filesystems, cross-device, small files) falls back to shutil.copy2.
+
+    Raises:
+        shutil.SameFileError: If dest_path is the source file itself
+    """
+    # Checked before anything opens dest_path, like shutil.copy2 does
+    try:
+        same_file = os.path.samefile(source, dest_path)
+    except FileNotFoundError:
+        same_file = False
+    if same_file:
+        raise shutil.SameFileError(f"{source!r} and {dest_path!r} are the same file")
+    if _FICLONE is not None and _reflink(source, dest_path):
+        return
+    shutil.copy2(source, dest_path)
+
+
+def _reflink(source: Path, dest_path: Path) -> bool:
+    """Try to clone source into dest_path with the FICLONE ioctl.
+
+    The clone goes into a new temporary file next to dest_path (created
+    with O_EXCL) that is renamed over dest_path only once it is complete,
+    so an existing dest_path is never truncated by a failed attempt.
+
+    Returns:
+        True if the clone succeeded, False if the caller should copy instead
+    """
+    with open(source, "rb") as src:
+        if os.fstat(src.fileno()).st_size < _REFLINK_MIN_SIZE:
+            return False
+        fd, tmp_path = tempfile.mkstemp(dir=dest_path.parent, prefix=f".{dest_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, tmp_path)
+            os.replace(tmp_path, dest_path)
+        except OSError as e:
+            os.unlink(tmp_path)
+            # EOPNOTSUPP/EINVAL (no reflink support), EXDEV (other filesystem)
+            logger.debug("Reflink not available for %s: %s", dest_path, e)
+            return False
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return True
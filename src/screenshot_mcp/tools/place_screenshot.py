@@ -0,0 +1,50 @@
+"""Place a screenshot into its category folder in one step.
+
+Combines create_category_folder and move_screenshot: the Agent still decides
+the category and filename, but a single call creates the folder (if needed)
+and moves/copies the file, with paths normalized once.
+"""
+
+from typing import Annotated, Any, Dict, Optional
+
+from pydantic import Field
+
+from utils.logger import get_logger
+from .create_category_folder import ensure_category_folder
+from .move_screenshot import transfer_screenshot
+from .shared import resolve_screenshot
+
+logger = get_logger(__name__)
+
+
+def place_screenshot(
+    source_path: Annotated[str, Field(description="Absolute path to source file")],
+    category: Annotated[str, Field(description="Category name (e.g., 'code', 'errors')")],
+    base_dir: Annotated[Optional[str], Field(description="Base directory for organization (uses config default if not provided)")] = None,
+    new_filename: Annotated[Optional[str], Field(description="New filename (without extension). If None, keeps original name")] = None,
+    keep_original: Annotated[bool, Field(description="If True, copy instead of move")] = True
+) -> Dict[str, Any]:
+    """Move (or copy) a screenshot into its category folder, creating it if needed.
+
+    Args:
+        source_path: Absolute path to source file
+        category: Category name (folder under base_dir)
+        base_dir: Base directory for organization (optional)
+        new_filename: Optional new filename (without extension)
+        keep_original: If True, copy instead of move
+
+    Returns:
+        Dictionary containing:
+        - original_path: Original file path
+        - new_path: New file path after move/copy
+        - operation: "copy" or "move"
+        - folder_created: Whether the category folder was newly created
+        - success: Whether operation succeeded
+        - error: Error message if failed (None if successful)
+    """
+    source, _ = resolve_screenshot(source_path, "Source file")
+    dest_dir, created = ensure_category_folder(category, base_dir)
+
+    result = transfer_screenshot(source, dest_dir, new_filename, keep_original)
+    result["folder_created"] = created
+    return result
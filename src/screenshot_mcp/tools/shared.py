@@ -1,30 +1,178 @@
 """Shared processors and utilities for MCP tools.
 
-This module initializes all processors and organizers at module level
-so they can be imported by individual tool modules without duplication.
+Processors and organizers are created on first use through shared accessors,
+so the MCP server starts without importing Tesseract/PIL or the Azure OpenAI
+SDK, and tools that never need a processor (e.g. get_categories) never pay
+for it. Each accessor returns the same instance for the life of the server.
+
+Also provides path resolution shared by the tools: Agent-supplied paths are
+normalized once and stat'ed once, and callers reuse the stat result.
 """
 
-from classifiers.keyword_classifier import KeywordClassifier
-from organizers.batch_processor import BatchProcessor
-from organizers.file_organizer import FileOrganizer
-from processors.ocr_processor import OCRProcessor
-from processors.azure_vision_processor import AzureVisionProcessor
+import os
+import re
+import threading
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, TypeVar
+
 from utils.config import get as config_get
 from utils.logger import get_logger
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    from classifiers.keyword_classifier import KeywordClassifier
+    from organizers.batch_processor import BatchProcessor
+    from organizers.file_organizer import FileOrganizer
+    from processors.azure_vision_processor import AzureVisionProcessor
+    from processors.ocr_processor import OCRProcessor
+    from processors.result_cache import ResultCache
 
-# Initialize processors and organizers at module level
-ocr_min_words = config_get("processing.ocr_min_words", 10)
-ocr_processor = OCRProcessor(min_words_threshold=ocr_min_words)
-vision_processor = AzureVisionProcessor()
-classifier = KeywordClassifier()
+logger = get_logger(__name__)
 
+# Plain configuration values (cheap, resolved at import)
 base_folder = config_get("organization.base_folder", "~/Screenshots/organized")
 categories = config_get("organization.categories", ["code", "errors", "documentation", "design", "communication", "memes", "other"])
 keep_originals = config_get("organization.keep_originals", True)
-file_organizer = FileOrganizer(base_folder, categories, keep_originals)
+preserve_metadata = config_get("organization.preserve_metadata", True)
+
+# macOS puts U+202F (narrow no-break space) before AM/PM in screenshot names;
+# Agents often send a regular space instead (or the reverse)
+_SPACE_AMPM = re.compile(r' (AM|PM)')
+_NARROW_NBSP_AMPM = re.compile('\u202f(AM|PM)')
+ocr_skip_max_stddev = config_get("processing.ocr_skip_max_stddev", 0)
+vision_max_batch = config_get("processing.vision_max_batch", 1)
+
+T = TypeVar("T")
+
+
+def _shared(factory: Callable[[], T]) -> Callable[[], T]:
+    """Turn a no-argument factory into an accessor for one shared instance.
+
+    Like functools.cache, but the factory runs at most once even when
+    analyze_screenshots_batch worker threads race on first use (two OCR
+    processors would each load their own EasyOCR model).
+    """
+    lock = threading.Lock()
+    instance = []
+
+    @wraps(factory)
+    def accessor() -> T:
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(factory())
+        return instance[0]
+
+    return accessor
+
+
+@_shared
+def get_ocr_processor() -> "OCRProcessor":
+    """Get the shared OCR processor (created on first use)."""
+    from processors.ocr_processor import OCRProcessor
+
+    ocr_min_words = config_get("processing.ocr_min_words", 10)
+    logger.info("Initializing shared OCR processor")
+    return OCRProcessor(
+        min_words_threshold=ocr_min_words,
+        tile_max_height=config_get("processing.ocr_tile_max_height", 2000),
+        gpu_min_batch=config_get("processing.ocr_gpu_min_batch", 0),
+        probe_width=config_get("processing.ocr_probe_width", 0),
+        tesseract_config=config_get("processing.ocr_tesseract_config", "--oem 1 --psm 6")
+    )
+
+
+@_shared
+def get_vision_processor() -> "AzureVisionProcessor":
+    """Get the shared Azure vision processor (created on first use)."""
+    from processors.azure_vision_processor import AzureVisionProcessor
+
+    logger.info("Initializing shared vision processor")
+    return AzureVisionProcessor()
+
+
+@_shared
+def get_result_cache() -> Optional["ResultCache"]:
+    """Get the shared on-disk OCR/vision result cache (None if disabled)."""
+    from processors.result_cache import ResultCache
+
+    cache_dir = config_get("processing.result_cache_dir", "")
+    if not cache_dir:
+        return None
+    result_cache = ResultCache(cache_dir, max_age_days=config_get("processing.result_cache_max_age_days", 30))
+    result_cache.prune()
+    return result_cache
+
+
+@_shared
+def get_classifier() -> "KeywordClassifier":
+    """Get the shared keyword classifier (created on first use)."""
+    from classifiers.keyword_classifier import KeywordClassifier
+
+    return KeywordClassifier()
+
+
+@_shared
+def get_file_organizer() -> "FileOrganizer":
+    """Get the shared file organizer (created on first use)."""
+    from organizers.file_organizer import FileOrganizer
+
+    return FileOrganizer(base_folder, categories, keep_originals, preserve_metadata)
+
+
+@_shared
+def get_batch_processor() -> "BatchProcessor":
+    """Get the shared batch processor (created on first use)."""
+    from organizers.batch_processor import BatchProcessor
+
+    return BatchProcessor(scan_workers=config_get("processing.scan_workers", 0))
+
+
+def resolve_path(path_str: str) -> Tuple[str, Optional[os.stat_result]]:
+    """Normalize an Agent-supplied path and stat it (one syscall).
+
+    Args:
+        path_str: Path as sent by the Agent (may contain shell-escaped spaces or ~)
+
+    Returns:
+        Tuple of (expanded path, stat result or None if nothing exists there)
+    """
+    path = os.path.expanduser(path_str.replace('\\ ', ' '))  # Handle escaped spaces from shell
+    try:
+        return path, os.stat(path)
+    except OSError:
+        return path, None
+
+
+def resolve_screenshot(path_str: str, label: str = "Screenshot file") -> Tuple[Path, os.stat_result]:
+    """Resolve an Agent-supplied screenshot path to an existing file.
+
+    Tries the path as given, then with the space before AM/PM swapped for
+    U+202F (macOS default) and the reverse.
+
+    Args:
+        path_str: Path as sent by the Agent
+        label: What the file is, for the error message
+
+    Returns:
+        Tuple of (existing file path, its stat result)
+
+    Raises:
+        FileNotFoundError: If no variation of the path exists
+    """
+    normalized = path_str.replace('\\ ', ' ')  # Handle escaped spaces from shell
+    path, stat = resolve_path(normalized)
+    if stat is not None:
+        return Path(path), stat
 
-batch_processor = BatchProcessor()
+    head, filename = os.path.split(path)
+    for candidate in (_SPACE_AMPM.sub('\u202f\\1', filename), _NARROW_NBSP_AMPM.sub(r' \1', filename)):
+        if candidate == filename:
+            continue
+        candidate_path = os.path.join(head, candidate)
+        try:
+            return Path(candidate_path), os.stat(candidate_path)
+        except OSError:
+            pass
 
-logger.info("MCP tools shared processors initialized")
+    raise FileNotFoundError(f"{label} not found: {normalized}")
@@ -4,6 +4,7 @@ Stores AgentThread state from Microsoft Agent Framework for conversation persist
 """
 
 import json
+import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -12,6 +13,11 @@ from uuid import uuid4
 
 from utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - fall back to stdlib json
+    orjson = None
+
 logger = get_logger(__name__)
 
 
@@ -249,18 +255,38 @@ class SessionManager:
         Returns:
             Session data dictionary.
         """
+        if orjson is not None:
+            return orjson.loads(session_file.read_bytes())
         with open(session_file, "r") as f:
             return json.load(f)
 
     def _write_session_file(self, session_file: Path, session_data: Dict[str, Any]):
         """Write session data to file.
 
+        Writes to a temporary file and renames it over the target so an
+        interrupted save never leaves a truncated session behind.
+
         Args:
             session_file: Path to session file.
             session_data: Session data dictionary.
         """
-        with open(session_file, "w") as f:
-            json.dump(session_data, f, indent=2)
+        tmp_file = session_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(self._encode(session_data))
+        os.replace(tmp_file, session_file)
+
+    @staticmethod
+    def _encode(session_data: Dict[str, Any]) -> bytes:
+        """Encode session data as indented JSON bytes (orjson when available).
+
+        Args:
+            session_data: Session data dictionary.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        if orjson is not None:
+            return orjson.dumps(session_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(session_data, indent=2).encode("utf-8")
 
     def export_session(self, session_id: str, export_path: Path) -> bool:
         """Export a session to a custom location.
@@ -280,9 +306,7 @@ class SessionManager:
         
         try:
             session_data = self._read_session_file(session_file)
-            
-            with open(export_path, "w") as f:
-                json.dump(session_data, f, indent=2)
+            Path(export_path).write_bytes(self._encode(session_data))
             
             logger.info(f"Exported session {session_id} to {export_path}")
             return True
@@ -301,8 +325,7 @@ class SessionManager:
             Session ID if import successful, None otherwise.
         """
         try:
-            with open(import_path, "r") as f:
-                session_data = json.load(f)
+            session_data = self._read_session_file(Path(import_path))
             
             # Generate new session ID to avoid conflicts
             session_id = str(uuid4())
@@ -1,7 +1,9 @@
+import copy
 import os
+import threading
 import yaml
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 # Try config.yaml first, fall back to default_config.yaml
 CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
@@ -10,6 +12,37 @@ if not DEFAULT_CONFIG_PATH.exists():
     DEFAULT_CONFIG_PATH = CONFIG_DIR / "default_config.yaml"
 
 
+# Parsed YAML per config path, with the (mtime_ns, size) it was read at. get()
+# is called for every config key, so re-parsing the file each time dominated;
+# an edited file is picked up on the next call.
+_parsed: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_parsed_lock = threading.Lock()
+
+
+def _parse_config_file(cfg_path: Path) -> Optional[Dict[str, Any]]:
+    """Return the parsed YAML of a config file (shared - do not mutate).
+
+    Returns:
+        The parsed mapping, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(cfg_path)
+    except FileNotFoundError:
+        return None
+    signature = (st.st_mtime_ns, st.st_size)
+
+    with _parsed_lock:
+        entry = _parsed.get(cfg_path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+    with open(cfg_path, "r", encoding="utf-8") as fh:
+        parsed = yaml.safe_load(fh) or {}
+    with _parsed_lock:
+        _parsed[cfg_path] = (signature, parsed)
+    return parsed
+
+
 def load_config(path: str | None = None) -> Dict[str, Any]:
     """Load configuration from YAML and allow environment variable overrides.
 
@@ -21,11 +54,8 @@ def load_config(path: str | None = None) -> Dict[str, Any]:
         A dictionary with configuration values.
     """
     cfg_path = Path(path) if path else DEFAULT_CONFIG_PATH
-    config: Dict[str, Any] = {}
-
-    if cfg_path.exists():
-        with open(cfg_path, "r", encoding="utf-8") as fh:
-            config = yaml.safe_load(fh) or {}
+    # Callers own the returned dict, so hand out a copy of the shared parse
+    config: Dict[str, Any] = copy.deepcopy(_parse_config_file(cfg_path) or {})
 
     # Simple env overrides for top-level keys (dot-separated paths not supported)
     for key in list(config.keys()):
@@ -42,14 +72,20 @@ def get(path: str, default: Any = None) -> Any:
     Example: get('processing.ocr_min_words')
     """
     parts = path.split(".") if path else []
-    cfg = load_config()
-    cur = cfg
-    for p in parts:
+    if not parts:
+        return load_config()
+
+    # Same result as walking load_config(), without copying the whole config
+    cur: Any = _parse_config_file(DEFAULT_CONFIG_PATH) or {}
+    for i, p in enumerate(parts):
         if isinstance(cur, dict) and p in cur:
             cur = cur[p]
+            # Top-level keys can be overridden by environment variables
+            if i == 0 and p.upper() in os.environ:
+                cur = os.environ[p.upper()]
         else:
             return default
-    return cur
+    return copy.deepcopy(cur)
 
 
 def get_mode() -> str:
@@ -0,0 +1,34 @@
+"""Event loop selection for the CLI and the MCP server.
+
+Both processes spend most of their time waiting on pipes (the stdio MCP
+transport) and sockets. uvloop handles that with fewer syscalls per message
+than the default selector loop, so it is used when installed.
+"""
+
+import asyncio
+import sys
+
+from utils.logger import get_logger
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup - default asyncio loop otherwise
+    uvloop = None
+
+logger = get_logger(__name__)
+
+
+def install_event_loop_policy() -> bool:
+    """Use uvloop for event loops created after this call, if available.
+
+    Must be called before asyncio.run().
+
+    Returns:
+        True if uvloop was installed, False if the default loop is kept.
+    """
+    if uvloop is None or sys.platform == "win32":
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
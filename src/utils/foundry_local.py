@@ -7,15 +7,21 @@ Also detects the correct model ID format (e.g., "Phi-4-generic-gpu:1" not "phi-4
 
 import re
 import subprocess
+import time
 import requests
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Cache for session duration (avoid running subprocess repeatedly)
-_cached_endpoint: Optional[str] = None
-_cached_model_id: Optional[str] = None
+# Detection results are reused for this long (avoid running the subprocess and
+# models query for every new client); clear_endpoint_cache() drops them early
+_CACHE_TTL_S = 60.0
+
+# (endpoint, detected at) and {(model name, base endpoint): (model ID, detected at)},
+# timestamps from time.monotonic()
+_cached_endpoint: Optional[Tuple[str, float]] = None
+_cached_model_ids: Dict[Tuple[str, str], Tuple[str, float]] = {}
 
 
 def detect_foundry_endpoint() -> Optional[str]:
@@ -37,10 +43,10 @@ def detect_foundry_endpoint() -> Optional[str]:
     """
     global _cached_endpoint
 
-    # Return cached value if available
-    if _cached_endpoint is not None:
-        logger.debug(f"Using cached Foundry endpoint: {_cached_endpoint}")
-        return _cached_endpoint
+    # Return cached value if still fresh
+    if _cached_endpoint is not None and time.monotonic() - _cached_endpoint[1] < _CACHE_TTL_S:
+        logger.debug(f"Using cached Foundry endpoint: {_cached_endpoint[0]}")
+        return _cached_endpoint[0]
 
     try:
         # Run foundry service status
@@ -77,8 +83,8 @@ def detect_foundry_endpoint() -> Optional[str]:
         foundry_endpoint = f"{base_endpoint}/v1"
         logger.info(f"✓ Detected Foundry Local endpoint: {foundry_endpoint}")
 
-        # Cache for session
-        _cached_endpoint = foundry_endpoint
+        # Cache for the next clients
+        _cached_endpoint = (foundry_endpoint, time.monotonic())
         return foundry_endpoint
 
     except FileNotFoundError:
@@ -108,12 +114,12 @@ def detect_model_id(model_name: str, base_endpoint: str) -> Optional[str]:
     Returns:
         Full model ID (e.g., "Phi-4-generic-gpu:1"), or None if not found.
     """
-    global _cached_model_id
-
-    # Return cached value if available
-    if _cached_model_id is not None:
-        logger.debug(f"Using cached model ID: {_cached_model_id}")
-        return _cached_model_id
+    # Return cached value for this model and endpoint if still fresh
+    cache_key = (model_name.lower(), base_endpoint)
+    cached = _cached_model_ids.get(cache_key)
+    if cached is not None and time.monotonic() - cached[1] < _CACHE_TTL_S:
+        logger.debug(f"Using cached model ID: {cached[0]}")
+        return cached[0]
 
     try:
         # Query /v1/models endpoint
@@ -145,7 +151,7 @@ def detect_model_id(model_name: str, base_endpoint: str) -> Optional[str]:
             # e.g., "phi-4-mini" should match "Phi-4-mini-instruct-generic-gpu:4" not "Phi-4-generic-gpu:1"
             if model_id_lower.startswith(model_name_lower):
                 logger.info(f"✓ Detected model ID: {model_id} (for {model_name})")
-                _cached_model_id = model_id
+                _cached_model_ids[cache_key] = (model_id, time.monotonic())
                 return model_id
 
         logger.warning(f"Could not find model matching '{model_name}' in available models")
@@ -163,9 +169,9 @@ def detect_model_id(model_name: str, base_endpoint: str) -> Optional[str]:
 
 def clear_endpoint_cache():
     """Clear the cached endpoint and model ID (useful for testing or after service restart)."""
-    global _cached_endpoint, _cached_model_id
+    global _cached_endpoint
     _cached_endpoint = None
-    _cached_model_id = None
+    _cached_model_ids.clear()
     logger.debug("Cleared Foundry endpoint and model ID cache")
 
 
@@ -0,0 +1,51 @@
+"""Tests for AgentClient reply rendering."""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from agent.client import AgentClient
+
+
+class _FakeAgent:
+    """Stands in for ChatAgent, replaying a fixed list of streaming updates."""
+
+    tools = []
+
+    def __init__(self, updates):
+        self.updates = updates
+
+    async def run_stream(self, user_message, thread=None, **kwargs):
+        for update in self.updates:
+            yield update
+
+
+def _update(text=None, contents=()):
+    return SimpleNamespace(text=text, contents=list(contents))
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_renders_tool_arguments_results_and_method():
+    result = {"processing_method": "ocr", "extracted_text": "def main():", "success": True}
+    client = AgentClient.__new__(AgentClient)
+    client.current_thread = object()
+    client.agent = _FakeAgent([
+        _update(contents=[SimpleNamespace(type="function_call", call_id="c1", name="analyze_screenshot", arguments='{"file_')]),
+        _update(contents=[SimpleNamespace(type="function_call", call_id="", name="", arguments='path": "/tmp/a.png"}')]),
+        _update(contents=[SimpleNamespace(type="function_result", call_id="c1", result=json.dumps(result))]),
+        _update(text="It is code."),
+    ])
+
+    reply = "".join([chunk async for chunk in client.chat_stream("Analyze /tmp/a.png")])
+
+    assert "🔧 **Calling Tool:** `analyze_screenshot`" in reply
+    assert '"file_path": "/tmp/a.png"' in reply
+    assert "✅ **Local OCR processing completed**" in reply
+    assert '"extracted_text": "def main():"' in reply
+    assert reply.endswith("It is code.")
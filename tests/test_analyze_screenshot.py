@@ -0,0 +1,84 @@
+"""Tests for analyze_screenshot's OCR pre-screen and GPU prefetch."""
+
+import importlib
+import sys
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processors.ocr_processor import OCRProcessor, OCRResult
+
+# The package re-exports the tool function under the module's name
+analyze_module = importlib.import_module("screenshot_mcp.tools.analyze_screenshot")
+
+
+def _check(path):
+    return analyze_module._is_low_contrast(path, path.stat().st_mtime_ns)
+
+
+def test_low_contrast_prescreen_is_off_by_default(tmp_path):
+    """Without ocr_skip_max_stddev every image goes through OCR."""
+    blank = tmp_path / "blank.png"
+    Image.new("RGB", (1920, 1080), (30, 30, 30)).save(blank)
+
+    assert analyze_module.ocr_skip_max_stddev == 0
+    assert _check(blank) is False
+
+
+def test_low_contrast_prescreen_keeps_dark_mode_text(tmp_path, monkeypatch):
+    """Sparse light text on a dark background is not mistaken for a blank image."""
+    monkeypatch.setattr(analyze_module, "ocr_skip_max_stddev", 8.0)
+
+    dark_mode = tmp_path / "dark_mode.png"
+    img = Image.new("RGB", (2560, 1440), (30, 30, 30))
+    draw = ImageDraw.Draw(img)
+    for line in range(12):
+        draw.text((40, 40 + 22 * line), "def analyze(path): return ocr.process(path)", fill=(200, 200, 200))
+    img.save(dark_mode)
+
+    blank = tmp_path / "blank.png"
+    Image.new("RGB", (2560, 1440), (30, 30, 30)).save(blank)
+
+    assert _check(dark_mode) is False
+    assert _check(blank) is True
+
+
+class _FakeGPUOCR(OCRProcessor):
+    """OCRProcessor whose GPU batch path works without EasyOCR."""
+
+    def __init__(self):
+        super().__init__(min_words_threshold=1, tile_max_height=2000, gpu_min_batch=2)
+        self.batched = []
+
+    def use_gpu_for(self, batch_size):
+        return batch_size >= self.gpu_min_batch
+
+    def process_batch(self, image_paths):
+        self.batched = [Path(path).name for path in image_paths]
+        return [OCRResult("gpu text", 2, 1.0, True) for _ in image_paths]
+
+
+def test_gpu_prefetch_skips_tall_images_and_downscaled_results_are_not_cached(tmp_path, monkeypatch):
+    """Tall images stay on the tiled path; analyses of downscaled OCR are not reused."""
+    ocr = _FakeGPUOCR()
+    monkeypatch.setattr(analyze_module, "get_ocr_processor", lambda: ocr)
+    monkeypatch.setattr(analyze_module, "get_result_cache", lambda: None)
+
+    sizes = {"small.png": (800, 600), "large.png": (2560, 1440), "tall.png": (1000, 5000)}
+    screenshots = []
+    for name, size in sizes.items():
+        path = tmp_path / name
+        Image.new("RGB", size, (255, 255, 255)).save(path)
+        screenshots.append((path, path.stat()))
+
+    analyze_module.prefetch_ocr(screenshots)
+    assert ocr.batched == ["small.png", "large.png"]
+
+    for path, stat in screenshots[:2]:
+        assert analyze_module.analyze_path(path, stat)["extracted_text"] == "gpu text"
+
+    cached = {key[0] for key in analyze_module._analysis_cache}
+    assert str(tmp_path / "small.png") in cached
+    assert str(tmp_path / "large.png") not in cached
@@ -0,0 +1,37 @@
+"""Tests for batched GPT-4o vision replies."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processors.azure_vision_processor import AzureVisionProcessor
+
+
+def _item(image_id, category):
+    return {"id": image_id, "category": category, "description": f"{category} shot", "filename": category}
+
+
+def test_batch_reply_is_matched_by_image_id():
+    """Results come back keyed by id even when the model reorders them."""
+    reply = json.dumps([_item("img2", "errors"), _item("img1", "code")])
+
+    parsed = AzureVisionProcessor()._parse_batch_response(reply, ["img1", "img2"])
+
+    assert parsed["img1"]["category"] == "code"
+    assert parsed["img2"]["category"] == "errors"
+
+
+@pytest.mark.parametrize("items", [
+    [_item("img1", "code")],                                            # missing img2
+    [_item("img1", "code"), _item("img1", "errors")],                   # duplicate id
+    [_item("img1", "code"), _item("img3", "errors")],                   # unknown id
+    [_item("img1", "code"), {k: v for k, v in _item("img2", "memes").items() if k != "id"}],
+])
+def test_batch_reply_that_does_not_cover_every_id_is_rejected(items):
+    """A reply that cannot be matched id-for-id raises, so callers fall back."""
+    with pytest.raises(ValueError):
+        AzureVisionProcessor()._parse_batch_response(json.dumps(items), ["img1", "img2"])
@@ -0,0 +1,150 @@
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from organizers.batch_processor import BatchProcessor
+
+
+def _make_tree(root: Path):
+    for i in range(5):
+        nested = root / f"dir{i}" / "nested"
+        nested.mkdir(parents=True)
+        (root / f"dir{i}" / f"shot{i}.png").write_bytes(b"")
+        (nested / f"deep{i}.JPG").write_bytes(b"")
+        (nested / "notes.txt").write_bytes(b"")
+    (root / "top.png").write_bytes(b"")
+
+
+def test_scan_filters_extensions_and_respects_recursive(tmp_path):
+    _make_tree(tmp_path)
+    processor = BatchProcessor()
+    assert [p.name for p in processor.scan_folder(tmp_path)] == ["top.png"]
+    assert len(processor.scan_folder(tmp_path, recursive=True)) == 11
+
+
+def test_parallel_scan_matches_serial_scan_sorted(tmp_path):
+    _make_tree(tmp_path)
+    serial = sorted(e.path for e in BatchProcessor().iter_entries(tmp_path, recursive=True))
+    parallel = [e.path for e in BatchProcessor(scan_workers=4).iter_entries(tmp_path, recursive=True)]
+    assert parallel == serial
+
+
+def test_scan_missing_folder_returns_empty(tmp_path):
+    assert BatchProcessor(scan_workers=4).scan_folder(tmp_path / "missing", recursive=True) == []
+
+
+def test_process_batch_with_workers_matches_serial(tmp_path):
+    from organizers.batch_processor import FileProcessingResult
+
+    files = [tmp_path / f"shot{i}.png" for i in range(20)]
+
+    def process(path):
+        if path.name == "shot3.png":
+            raise ValueError("boom")
+        return FileProcessingResult(path=path, success=path.name != "shot7.png", category="code")
+
+    serial = BatchProcessor().process_batch(files, process)
+    parallel = BatchProcessor(process_workers=4).process_batch(files, process)
+    for stats in (serial, parallel):
+        assert (stats.processed, stats.successful, stats.failed) == (19, 18, 2)
+        assert stats.categories_count == {"code": 18}
+    assert parallel.errors == serial.errors
+
+
+def test_custom_extensions_match_case_insensitively(tmp_path):
+    _make_tree(tmp_path)
+    processor = BatchProcessor(supported_extensions=["JPG"])
+    assert len(processor.scan_folder(tmp_path, recursive=True)) == 5
+    assert processor.scan_folder(tmp_path / "top.png") == []
+
+
+def test_process_batch_streams_results_to_jsonl(tmp_path):
+    import json
+    from organizers.batch_processor import FileProcessingResult
+
+    files = [tmp_path / "a.png", tmp_path / "b.png"]
+
+    def process(path):
+        if path.name == "b.png":
+            raise OSError("unreadable")
+        return FileProcessingResult(path=path, success=True, category="memes")
+
+    results_path = tmp_path / "results.jsonl"
+    BatchProcessor().process_batch(files, process, results_path=results_path)
+    records = [json.loads(line) for line in results_path.read_text().splitlines()]
+    assert [(r["path"], r["success"], r["category"], r["error"]) for r in records] == [
+        (str(files[0]), True, "memes", None),
+        (str(files[1]), False, None, "unreadable"),
+    ]
+
+
+def test_unwritable_results_path_fails_before_processing(tmp_path):
+    import pytest
+
+    processed = []
+    with pytest.raises(OSError):
+        BatchProcessor().process_batch(
+            [tmp_path / "a.png"], processed.append, results_path=tmp_path / "missing" / "results.jsonl"
+        )
+    assert processed == []
+
+
+def _classify_by_name(path):
+    from organizers.batch_processor import FileProcessingResult
+
+    if path.name == "shot3.png":
+        raise ValueError("boom")
+    return FileProcessingResult(path=path, success=True, category=path.stem[-1])
+
+
+def test_process_pool_matches_threads_and_falls_back_for_closures(tmp_path):
+    files = [tmp_path / f"shot{i}.png" for i in range(12)]
+
+    threaded = BatchProcessor(process_workers=3).process_batch(files, _classify_by_name)
+    pooled = BatchProcessor(process_workers=3, use_processes=True).process_batch(files, _classify_by_name)
+    assert pooled.categories_count == threaded.categories_count
+    assert pooled.errors == threaded.errors == ["shot3.png: boom"]
+
+    fallback = BatchProcessor(process_workers=3, use_processes=True).process_batch(
+        files, lambda path: _classify_by_name(path)
+    )
+    assert fallback.categories_count == threaded.categories_count
+
+
+def test_filter_by_size_accepts_scanned_entries(tmp_path):
+    (tmp_path / "small.png").write_bytes(b"x" * 100)
+    (tmp_path / "large.png").write_bytes(b"x" * 4096)
+    processor = BatchProcessor()
+
+    entries = processor.scan_entries(tmp_path)
+    kept = processor.filter_files_by_size(entries, min_size_kb=1)
+    assert [e.name for e in kept] == ["large.png"]
+    assert kept[0] is next(e for e in entries if e.name == "large.png")
+    paths = processor.filter_files_by_size(processor.scan_folder(tmp_path), max_size_kb=1)
+    assert [p.name for p in paths] == ["small.png"]
+
+
+def test_process_folder_applies_size_filter(tmp_path):
+    from organizers.batch_processor import FileProcessingResult
+
+    (tmp_path / "small.png").write_bytes(b"x" * 100)
+    (tmp_path / "large.png").write_bytes(b"x" * 4096)
+    seen = []
+
+    def process(path):
+        seen.append(path)
+        return FileProcessingResult(path=path, success=True, category="code")
+
+    stats = BatchProcessor().process_folder(tmp_path, process, min_size_kb=1)
+    assert stats.total_files == 1 and seen == [tmp_path / "large.png"]
+
+
+def test_scan_sorted_by_inode(tmp_path):
+    import os
+
+    _make_tree(tmp_path)
+    paths = BatchProcessor(sort_by_inode=True).scan_folder(tmp_path, recursive=True)
+    inodes = [os.stat(p).st_ino for p in paths]
+    assert len(paths) == 11 and inodes == sorted(inodes)
@@ -18,3 +18,21 @@ def test_load_config_defaults():
 def test_get_helper():
     # should return default when path not present
     assert config.get("non.existing.path", default=123) == 123
+
+
+def test_get_matches_load_config_and_sees_edits(tmp_path, monkeypatch):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("processing:\n  ocr_min_words: 10\n", encoding="utf-8")
+    monkeypatch.setattr(config, "DEFAULT_CONFIG_PATH", cfg_path)
+
+    assert config.get("processing.ocr_min_words") == 10
+    assert config.get("processing") == config.load_config()["processing"]
+
+    # Returned values are copies, not the cached parse
+    config.get("processing")["ocr_min_words"] = 99
+    assert config.get("processing.ocr_min_words") == 10
+
+    cfg_path.write_text("processing:\n  ocr_min_words: 25\n", encoding="utf-8")
+    import os
+    os.utime(cfg_path, ns=(0, 10**9))
+    assert config.get("processing.ocr_min_words") == 25
@@ -0,0 +1,145 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from organizers.file_organizer import FileOrganizer
+
+
+def test_reserve_unique_path_never_hands_out_a_name_twice(tmp_path):
+    organizer = FileOrganizer(tmp_path, categories=["code"])
+    target = tmp_path / "shot.png"
+    target.write_bytes(b"existing")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        reserved = list(executor.map(lambda _: organizer.reserve_unique_path(target), range(40)))
+
+    assert len(set(reserved)) == 40
+    assert target not in reserved
+    assert target.read_bytes() == b"existing"
+
+
+def test_organize_file_keeps_originals_under_unique_names(tmp_path):
+    organizer = FileOrganizer(tmp_path / "out", categories=["code", "other"])
+    results = []
+    for i in range(3):
+        source = tmp_path / f"src{i}" / "Screenshot.png"
+        source.parent.mkdir()
+        source.write_bytes(bytes([i]) * 1000)
+        results.append(organizer.organize_file(source, "code", suggested_filename="editor"))
+
+    assert all(r.success and r.archived for r in results)
+    assert len({r.destination_path for r in results}) == 3
+    archived = sorted(p.name for p in (tmp_path / "out" / "_originals").iterdir())
+    assert archived == ["Screenshot.png", "Screenshot_1.png", "Screenshot_2.png"]
+    assert [r.destination_path.read_bytes()[0] for r in results] == [0, 1, 2]
+
+
+def test_organize_file_recreates_removed_category_folder(tmp_path):
+    import shutil
+
+    organizer = FileOrganizer(tmp_path / "out", categories=["code"], keep_originals=False)
+    organizer.ensure_folder_structure()
+    shutil.rmtree(tmp_path / "out" / "code")
+
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"png")
+    result = organizer.organize_file(source, "code")
+
+    assert result.success and not source.exists()
+    assert result.destination_path.parent == tmp_path / "out" / "code"
+
+
+def test_organize_file_recreates_removed_archive_folder(tmp_path):
+    import shutil
+
+    organizer = FileOrganizer(tmp_path / "out", categories=["code"], keep_originals=True)
+    organizer.ensure_folder_structure()
+    shutil.rmtree(organizer.archive_folder)
+
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"png")
+    result = organizer.organize_file(source, "code")
+
+    assert result.success and result.archived and source.exists()
+    assert result.destination_path.read_bytes() == b"png"
+    assert [p.name for p in organizer.archive_folder.iterdir()] == ["shot.png"]
+
+
+def test_statistics_count_files_per_category(tmp_path):
+    organizer = FileOrganizer(tmp_path, categories=["code", "memes", "missing"])
+    (tmp_path / "code" / "sub").mkdir(parents=True)
+    (tmp_path / "memes").mkdir()
+    for name in ("a.png", "b.png", ".DS_Store"):
+        (tmp_path / "code" / name).write_bytes(b"")
+
+    assert organizer.get_statistics() == {"code": 3, "memes": 0, "missing": 0}
+
+
+def test_preserve_metadata_controls_copied_timestamps(tmp_path):
+    import os
+
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"png" * 100)
+    os.utime(source, (1_000_000_000, 1_000_000_000))
+
+    for preserve in (True, False):
+        organizer = FileOrganizer(tmp_path / f"out_{preserve}", categories=["code"], preserve_metadata=preserve)
+        result = organizer.organize_file(source, "code")
+        assert result.destination_path.read_bytes() == source.read_bytes()
+        assert (result.destination_path.stat().st_mtime == 1_000_000_000) is preserve
+
+
+def test_move_falls_back_to_shutil_move_across_filesystems(tmp_path, monkeypatch):
+    import errno
+    import os
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    organizer = FileOrganizer(tmp_path / "out", categories=["code"], keep_originals=False)
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"png")
+    monkeypatch.setattr(os, "replace", cross_device)
+    result = organizer.organize_file(source, "code")
+
+    assert result.success and not source.exists()
+    assert result.destination_path.read_bytes() == b"png"
+
+
+def test_conflict_counters_are_bounded(tmp_path, monkeypatch):
+    import organizers.file_organizer as file_organizer
+
+    monkeypatch.setattr(file_organizer, "_NEXT_COUNTER_SIZE", 2)
+    organizer = FileOrganizer(tmp_path, categories=["code"])
+    for name in ("a.png", "b.png", "c.png"):
+        (tmp_path / name).write_bytes(b"existing")
+        organizer.reserve_unique_path(tmp_path / name)
+
+    assert list(organizer._next_counter) == [tmp_path / "b.png", tmp_path / "c.png"]
+
+
+def test_short_range_copy_falls_back_to_a_full_copy(tmp_path, monkeypatch):
+    import os
+
+    import organizers.file_organizer as file_organizer
+
+    real_copy_file_range = os.copy_file_range
+
+    def stops_after_first_chunk(src, dst, count, offset_src=None, offset_dst=None):
+        if offset_src:
+            return 0  # Some filesystems end early without an error
+        return real_copy_file_range(src, dst, min(count, 100), offset_src)
+
+    monkeypatch.setattr(file_organizer, "_HAS_COPY_FILE_RANGE", True)
+    monkeypatch.setattr(os, "copy_file_range", stops_after_first_chunk)
+    organizer = FileOrganizer(tmp_path / "out", categories=["code"], keep_originals=True)
+    source = tmp_path / "shot.png"
+    source.write_bytes(bytes(range(256)) * 10)
+    result = organizer.organize_file(source, "code")
+
+    assert result.success
+    assert result.destination_path.read_bytes() == source.read_bytes()
+    assert (organizer.archive_folder / "shot.png").read_bytes() == source.read_bytes()
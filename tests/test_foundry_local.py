@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import foundry_local
+
+
+def test_endpoint_detection_is_cached_until_ttl_or_clear(monkeypatch):
+    calls = []
+
+    def fake_run(*args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(
+            args, 0, stdout="Model management service is running on http://127.0.0.1:60779/openai/status", stderr=""
+        )
+
+    clock = [1000.0]
+    monkeypatch.setattr(foundry_local.subprocess, "run", fake_run)
+    monkeypatch.setattr(foundry_local.time, "monotonic", lambda: clock[0])
+    foundry_local.clear_endpoint_cache()
+
+    assert foundry_local.detect_foundry_endpoint() == "http://127.0.0.1:60779/v1"
+    assert foundry_local.detect_foundry_endpoint() == "http://127.0.0.1:60779/v1"
+    assert len(calls) == 1
+
+    clock[0] += foundry_local._CACHE_TTL_S
+    foundry_local.detect_foundry_endpoint()
+    foundry_local.clear_endpoint_cache()
+    foundry_local.detect_foundry_endpoint()
+    assert len(calls) == 3
+    foundry_local.clear_endpoint_cache()
@@ -0,0 +1,79 @@
+import random
+import re
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from classifiers.keyword_classifier import KeywordClassifier
+
+
+def test_classify_code_and_errors():
+    classifier = KeywordClassifier()
+    assert classifier.classify("def main():\n    import os\n    return value") == "code"
+    assert classifier.classify("Traceback: TypeError - fatal exception") == "errors"
+
+
+def test_classify_empty_and_unmatched_text():
+    classifier = KeywordClassifier()
+    assert classifier.classify("") == "other"
+    assert classifier.classify("zzz qqq") == "other"
+
+
+def test_added_pattern_is_used():
+    classifier = KeywordClassifier()
+    classifier.add_pattern("invoices", r"\binvoice\b")
+    assert classifier.classify("Invoice #42, invoice total") == "invoices"
+
+
+def _findall_scores(classifier, text):
+    """Reference scoring: every pattern counted on its own, as findall does."""
+    scores = {category: 0 for category in classifier.patterns}
+    for category, patterns in classifier.patterns.items():
+        for pattern in patterns:
+            scores[category] += len(re.findall(pattern, text, re.IGNORECASE))
+    best_category, best_score = max(scores.items(), key=lambda item: item[1])
+    return best_category if best_score > 0 else "other"
+
+
+def test_classify_matches_per_pattern_findall_scoring():
+    classifier = KeywordClassifier()
+    words = [
+        "error", "exception", "stack trace", "import", "from os import", "def main",
+        "class Foo", "return x", "if (", "lol", "meme", "haha", "😂", "guide",
+        "how to", "slack", "message", "figma", "layout", "TypeError", "zzz", "the",
+    ]
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+        assert classifier.classify(text) == _findall_scores(classifier, text), text
+
+
+def test_overlapping_patterns_each_score():
+    classifier = KeywordClassifier()
+    # "import" is matched by both \bimport\s+ and \bfrom\s+\w+\s+import
+    assert classifier.classify_with_matches("from x import y") == ("code", ["import ", "from x import"])
+
+
+def test_classify_with_matches_reports_matched_keywords():
+    classifier = KeywordClassifier()
+    category, matched = classifier.classify_with_matches("Traceback: TypeError, then another TypeError")
+    assert category == "errors"
+    assert matched == ["traceback", "typeerror"]
+    assert classifier.classify_with_matches("zzz") == ("other", [])
+
+
+def test_ascii_fast_path_matches_unicode_scan():
+    classifier = KeywordClassifier()
+    # \N{...} escapes are str-only, so this category keeps its str patterns
+    classifier.add_pattern("invoices", r"\binvoice\N{NUMBER SIGN}")
+    assert classifier._ascii_patterns["invoices"] is None
+    assert classifier.classify("invoice# invoice# error") == "invoices"
+
+    text = "Traceback (most recent call last): TypeError in def main(), see README"
+    ascii_result = classifier.classify_with_matches(text)
+    classifier._ascii_patterns = dict.fromkeys(classifier._ascii_patterns)
+    assert classifier.classify_with_matches(text) == ascii_result
+    # Non-ASCII text takes the str scan
+    assert classifier.classify("exception levée 😂 lol lmao") == "memes"
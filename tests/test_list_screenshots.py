@@ -0,0 +1,40 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from screenshot_mcp.tools.list_screenshots import export_screenshot_list
+
+
+def test_export_writes_ndjson_inside_directory(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"")
+    (tmp_path / "b.png").write_bytes(b"")
+    out = tmp_path / "listing.ndjson"
+
+    result = export_screenshot_list(str(tmp_path), str(out))
+
+    assert result["total_count"] == 2
+    assert sorted(json.loads(line)["filename"] for line in out.read_text().splitlines()) == ["a.png", "b.png"]
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_export_refuses_unsafe_targets(tmp_path):
+    shots = tmp_path / "shots"
+    shots.mkdir()
+    existing = shots / "listing.ndjson"
+    existing.write_text("keep")
+
+    with pytest.raises(PermissionError):
+        export_screenshot_list(str(shots), str(tmp_path / "elsewhere.ndjson"))
+    with pytest.raises(FileExistsError):
+        export_screenshot_list(str(shots), str(existing))
+    assert existing.read_text() == "keep"
+    with pytest.raises(FileNotFoundError):
+        export_screenshot_list(str(tmp_path / "missing"), str(tmp_path / "missing" / "out.ndjson"))
+
+    assert export_screenshot_list(str(shots), str(existing), overwrite=True)["total_count"] == 0
+    assert existing.read_text() == ""
@@ -135,6 +135,53 @@ class TestErrorHandling:
         assert "--mode remote" in response.text
 
 
+class TestStreaming:
+    """Test that local mode streams replies chunk by chunk."""
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_yields_local_chunks(self):
+        """AgentClient.chat_stream goes through the local client's streaming path."""
+        from types import SimpleNamespace
+        from agent.client import AgentClient
+
+        async def fake_stream_updates(self, **kwargs):
+            for text in ["5 + 5", " = ", "10"]:
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+        agent_client = AgentClient(mode="local", local_config={"endpoint": TEST_ENDPOINT})
+        agent_client.get_new_thread()
+
+        with patch.object(LocalFoundryChatClient, "_stream_updates", fake_stream_updates):
+            chunks = [chunk async for chunk in agent_client.chat_stream("What is 5 + 5?")]
+
+        assert chunks == ["5 + 5", " = ", "10"]
+
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_connection_error_before_first_chunk(self):
+        """A connection error before any text re-detects the endpoint and streams again."""
+        from types import SimpleNamespace
+
+        calls = []
+
+        async def flaky_stream_updates(self, **kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise ConnectionError("Connection refused")
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="10"))])
+
+        async def reconnect(self):
+            return True
+
+        client = LocalFoundryChatClient(endpoint=TEST_ENDPOINT)
+        with patch.object(LocalFoundryChatClient, "_stream_updates", flaky_stream_updates), \
+                patch.object(LocalFoundryChatClient, "_reconnect", reconnect):
+            texts = [update.text async for update in client.get_streaming_response("What is 5 + 5?")]
+
+        assert texts == ["10"]
+        assert len(calls) == 2
+
+
 @pytest.mark.integration
 class TestLocalModeIntegration:
     """Integration tests for local mode (requires AI Foundry server running)."""
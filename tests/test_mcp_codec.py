@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from screenshot_mcp import codec
+
+
+def test_roundtrip():
+    payload = {"files": [{"path": "/tmp/a b.png", "size_bytes": 10}], "truncated": False}
+    text = codec.encode(payload)
+    assert isinstance(text, str)
+    assert codec.decode(text) == payload
+
+
+def test_invalid_payload_raises_decode_error():
+    with pytest.raises(codec.DecodeError):
+        codec.decode("{not json")
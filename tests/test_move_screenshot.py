@@ -0,0 +1,96 @@
+"""Tests for the move_screenshot copy paths."""
+
+import errno
+import importlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# The package re-exports the tool function under the module's name
+move_module = importlib.import_module("screenshot_mcp.tools.move_screenshot")
+
+
+def test_copy_onto_itself_fails_without_touching_the_file(tmp_path):
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"png data")
+
+    result = move_module.transfer_screenshot(source, tmp_path, keep_original=True)
+
+    assert not result["success"]
+    assert "same file" in result["error"]
+    assert source.read_bytes() == b"png data"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shot.png"]
+
+
+@pytest.mark.skipif(move_module.fcntl is None, reason="reflinks need fcntl")
+def test_failed_reflink_leaves_existing_destination_intact(tmp_path, monkeypatch):
+    """The clone goes to a temp file, so a failed reflink never truncates the target."""
+    source = tmp_path / "src" / "shot.png"
+    source.parent.mkdir()
+    source.write_bytes(b"x" * move_module._REFLINK_MIN_SIZE)
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+    (dest_dir / "shot.png").write_bytes(b"existing")
+
+    def no_reflink(fd, request, arg):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    seen_by_fallback = []
+
+    def copy2(src, dst):
+        seen_by_fallback.append(Path(dst).read_bytes())
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(move_module, "_FICLONE", 0x40049409)
+    monkeypatch.setattr(move_module.fcntl, "ioctl", no_reflink)
+    monkeypatch.setattr(shutil, "copy2", copy2)
+    result = move_module.transfer_screenshot(source, dest_dir, keep_original=True)
+
+    assert not result["success"]
+    assert seen_by_fallback == [b"existing"]
+    assert (dest_dir / "shot.png").read_bytes() == b"existing"
+    assert sorted(p.name for p in dest_dir.iterdir()) == ["shot.png"]  # No temp files left
+
+
+def test_small_files_are_copied_with_copy2(tmp_path, monkeypatch):
+    source = tmp_path / "src" / "shot.png"
+    source.parent.mkdir()
+    source.write_bytes(b"small png")
+    os.utime(source, (1_000_000_000, 1_000_000_000))
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+
+    def unexpected_ioctl(fd, request, arg):
+        raise AssertionError("small files should not be reflinked")
+
+    if move_module.fcntl is not None:
+        monkeypatch.setattr(move_module.fcntl, "ioctl", unexpected_ioctl)
+    result = move_module.transfer_screenshot(source, dest_dir, new_filename="renamed", keep_original=True)
+
+    copied = dest_dir / "renamed.png"
+    assert result["success"] and result["new_path"] == str(copied)
+    assert copied.read_bytes() == b"small png"
+    assert copied.stat().st_mtime == 1_000_000_000
+    assert source.exists()
+
+
+def test_move_never_replaces_an_existing_destination(tmp_path):
+    source = tmp_path / "src" / "shot.png"
+    source.parent.mkdir()
+    source.write_bytes(b"new")
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+    (dest_dir / "shot.png").write_bytes(b"existing")
+
+    blocked = move_module.transfer_screenshot(source, dest_dir, keep_original=False)
+    moved = move_module.transfer_screenshot(source, dest_dir, new_filename="renamed", keep_original=False)
+
+    assert not blocked["success"]
+    assert (dest_dir / "shot.png").read_bytes() == b"existing"
+    assert moved["success"] and not source.exists()
+    assert (dest_dir / "renamed.png").read_bytes() == b"new"
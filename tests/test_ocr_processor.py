@@ -0,0 +1,30 @@
+"""Tests for OCRProcessor's GPU batch preparation."""
+
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processors.ocr_processor import OCRProcessor
+
+
+def test_gpu_canvas_keeps_aspect_ratio(tmp_path):
+    """A wide screenshot is shrunk to the canvas width and padded, not stretched."""
+    ocr = OCRProcessor(tile_max_height=2000)
+    path = tmp_path / "wide.png"
+    img = Image.new("RGB", (2560, 1000), (255, 255, 255))
+    img.paste((0, 0, 0), (0, 0, 2560, 10))  # A black bar along the top edge
+    img.save(path)
+
+    canvas = ocr._gpu_canvas(path)
+
+    assert canvas.shape == (OCRProcessor.GPU_BATCH_HEIGHT, OCRProcessor.GPU_BATCH_WIDTH, 3)
+    # Scaled by 1280/2560, the 10px bar becomes 5px (stretched to 720px tall
+    # it would be 7px); the padding below repeats the white background
+    assert canvas[:4, :, :].max() < 16
+    assert canvas[6:, :, :].min() > 230
+    assert ocr.gpu_batch_mode(2560, 1000) == "downscaled"
+    assert ocr.gpu_batch_mode(1280, 720) == "full"
+    assert ocr.gpu_batch_mode(1000, 5000) is None
@@ -0,0 +1,38 @@
+"""Tests for the place_screenshot tool."""
+
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from screenshot_mcp.tools.place_screenshot import place_screenshot
+
+
+def test_place_screenshot_creates_folder_and_copies(tmp_path):
+    source = tmp_path / "Screenshot 1.png"
+    source.write_bytes(b"png")
+    base = tmp_path / "organized"
+
+    first = place_screenshot(str(source), "code", base_dir=str(base), new_filename="editor")
+    second = place_screenshot(str(source), "code", base_dir=str(base), new_filename="terminal")
+
+    assert first["success"] and first["folder_created"]
+    assert second["success"] and not second["folder_created"]
+    assert first["new_path"] == str(base / "code" / "editor.png")
+    assert (base / "code" / "terminal.png").read_bytes() == b"png"
+    assert source.exists()
+
+
+def test_place_screenshot_recreates_a_removed_folder(tmp_path):
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"png")
+    base = tmp_path / "organized"
+
+    place_screenshot(str(source), "errors", base_dir=str(base))
+    shutil.rmtree(base / "errors")
+    result = place_screenshot(str(source), "errors", base_dir=str(base), keep_original=False)
+
+    assert result["success"] and result["folder_created"]
+    assert result["operation"] == "move" and not source.exists()
+    assert (base / "errors" / "shot.png").read_bytes() == b"png"
@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processors.result_cache import ResultCache
+
+
+def test_round_trip_by_content_digest(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    digest = cache.digest(b"png bytes")
+    assert digest == cache.digest(b"png bytes") != cache.digest(b"other bytes")
+    assert cache.get("ocr", digest) is None
+
+    cache.put("ocr", digest, {"text": "hello", "word_count": 1})
+    assert cache.get("ocr", digest) == {"text": "hello", "word_count": 1}
+    assert cache.get("vision", digest) is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    digest = cache.digest(b"x")
+    cache.put("ocr", digest, {"text": "x"})
+    cache._entry_path("ocr", digest).write_text("{not json")
+    assert cache.get("ocr", digest) is None
+
+
+def test_entries_are_keyed_by_variant(tmp_path):
+    cache = ResultCache(tmp_path)
+    digest = cache.digest(b"x")
+    cache.put("ocr", digest, {"text": "tesseract"}, variant="pytesseract|--psm 6")
+    assert cache.get("ocr", digest, variant="pytesseract|--psm 6") == {"text": "tesseract"}
+    assert cache.get("ocr", digest, variant="pytesseract|--psm 3") is None
+    assert cache.get("ocr", digest) is None
+
+
+def test_expired_entries_are_misses_and_pruned(tmp_path):
+    import os
+
+    cache = ResultCache(tmp_path, max_age_days=1)
+    old, fresh = cache.digest(b"old"), cache.digest(b"fresh")
+    cache.put("ocr", old, {"text": "old"})
+    cache.put("ocr", fresh, {"text": "fresh"})
+    two_days_ago = os.stat(cache._entry_path("ocr", old)).st_mtime - 2 * 86400
+    os.utime(cache._entry_path("ocr", old), (two_days_ago, two_days_ago))
+
+    assert cache.get("ocr", old) is None
+    cache.put("ocr", old, {"text": "old"})
+    os.utime(cache._entry_path("ocr", old), (two_days_ago, two_days_ago))
+    assert cache.prune() == 1
+    assert cache.get("ocr", fresh) == {"text": "fresh"}
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import session_manager
+from session_manager import SessionManager
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    manager = SessionManager(session_dir=tmp_path)
+    session_id = manager.create_session()
+    thread_data = {"messages": [{"role": "user", "text": "héllo 👋"}]}
+
+    manager.save_session(session_id, thread_data)
+
+    assert manager.load_session(session_id) == thread_data
+    # Atomic write must not leave temporary files behind
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_stdlib_json_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_manager, "orjson", None)
+    manager = SessionManager(session_dir=tmp_path)
+    session_id = manager.create_session()
+
+    manager.save_session(session_id, {"messages": []})
+
+    assert manager.load_session(session_id) == {"messages": []}